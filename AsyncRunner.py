@@ -0,0 +1,86 @@
+import asyncio
+import sys
+from os import environ
+
+from MyStrategy import MyStrategy, SessionFinished
+from RemoteProcessClient import RemoteProcessClient
+from StreamProcessClient import StreamProcessClient
+from model.Move import Move
+from strategy_release import make_cars_history
+
+
+async def run_session(host, port, token, decode_mode=None, strategy_class=MyStrategy):
+    reader, writer = await asyncio.open_connection(host, port)
+    client = StreamProcessClient(reader, writer, decode_mode)
+
+    try:
+        client.write_token_message(token)
+        await client.drain()
+        await client.wait_message()
+        team_size = client.read_team_size_message()
+        client.write_protocol_version_message()
+        await client.drain()
+        await client.wait_message()
+        game = client.read_game_context_message()
+
+        history = make_cars_history()
+        strategies = []
+
+        for _ in range(team_size):
+            strategies.append(strategy_class(history))
+
+        while True:
+            await client.wait_message()
+            player_context = client.read_player_context_message()
+            if player_context is None:
+                break
+
+            player_cars = player_context.cars
+            if player_cars is None or player_cars.__len__() != team_size:
+                break
+
+            moves = []
+
+            for car_index in range(team_size):
+                player_car = player_cars[car_index]
+
+                move = Move()
+                moves.append(move)
+                try:
+                    strategies[player_car.teammate_index].move(player_car, player_context.world, game, move)
+                except SessionFinished:
+                    return
+
+            client.write_moves_message(moves)
+            await client.drain()
+    finally:
+        client.close()
+
+
+async def run_sessions(host, sessions, decode_mode=None, strategy_class=MyStrategy):
+    return await asyncio.gather(
+        *(run_session(host, port, token, decode_mode, strategy_class) for port, token in sessions),
+        return_exceptions=True
+    )
+
+
+def main():
+    decode_mode = None
+
+    if "DECODE_MODE" in environ:
+        decode_mode = getattr(RemoteProcessClient.DecodeMode, environ["DECODE_MODE"].upper())
+
+    if sys.argv.__len__() >= 4:
+        host = sys.argv[1]
+        sessions = [(int(sys.argv[i]), sys.argv[i + 1]) for i in range(2, sys.argv.__len__() - 1, 2)]
+    else:
+        host = "127.0.0.1"
+        sessions = [(31001, "0000000000000000")]
+
+    for (port, _), result in zip(sessions, asyncio.run(run_sessions(host, sessions, decode_mode))):
+        if isinstance(result, BaseException):
+            print("Session on port %s failed: %r" % (port, result))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from model.Car import Car
 from model.Game import Game
 from model.Move import Move
 from model.World import World
-from strategy_release import Context, ReleaseStrategy
+from strategy_release import Context, ReleaseStrategy, make_cars_history
 
 
 def profile(func):
@@ -23,29 +23,34 @@ def profile(func):
         return func
 
 
+class SessionFinished(Exception):
+    pass
+
+
 class MyStrategy:
-    def __init__(self):
+    def __init__(self, history=None):
+        self.__history = make_cars_history() if history is None else history
         if 'DEBUG' in environ and environ['DEBUG'] == '1':
             from strategy_debug import DebugStrategy
-            self.__impl = DebugStrategy()
+            self.__impl = DebugStrategy(self.__history)
         else:
-            self.__impl = ReleaseStrategy()
+            self.__impl = ReleaseStrategy(self.__history)
 
     @profile
     def move(self, me: Car, world: World, game: Game, move: Move):
         if 'MAX_TICKS' in environ and world.tick >= int(environ['MAX_TICKS']):
-            exit(0)
+            raise SessionFinished()
         if 'EXIT_ON_FINISH' in environ and environ['EXIT_ON_FINISH'] == '1':
             if me.finished_track:
                 print(world.tick, 'finished')
-                exit(0)
+                raise SessionFinished()
         context = Context(me=me, world=world, game=game, move=move)
         if isinstance(self.__impl, ReleaseStrategy):
             try:
                 self.__impl.move(context)
             except Exception:
-                self.__impl = ReleaseStrategy()
+                self.__impl = ReleaseStrategy(self.__history)
             except BaseException:
-                self.__impl = ReleaseStrategy()
+                self.__impl = ReleaseStrategy(self.__history)
         else:
             self.__impl.move(context)
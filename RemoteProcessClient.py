@@ -1,83 +1,126 @@
-import _socket
 import struct
 
-from model.Car import Car
-from model.CarType import CarType
+import protocol_codec
+import protocol_transport
 from model.Direction import Direction
-from model.Projectile import Projectile
-from model.ProjectileType import ProjectileType
 from model.TileType import TileType
-from model.Bonus import Bonus
-from model.BonusType import BonusType
-from model.Game import Game
-from model.Move import Move
-from model.OilSlick import OilSlick
-from model.Player import Player
 from model.PlayerContext import PlayerContext
 from model.World import World
+from protocol_arrays import EntityList, WorldValues
 
 
 class RemoteProcessClient:
-    LITTLE_ENDIAN_BYTE_ORDER = True
+    LITTLE_ENDIAN_BYTE_ORDER = protocol_codec.LITTLE_ENDIAN_BYTE_ORDER
 
-    BYTE_ORDER_FORMAT_STRING = "<" if LITTLE_ENDIAN_BYTE_ORDER else ">"
+    BYTE_ORDER_FORMAT_STRING = protocol_codec.BYTE_ORDER_FORMAT_STRING
 
     SIGNED_BYTE_SIZE_BYTES = 1
     INTEGER_SIZE_BYTES = 4
     LONG_SIZE_BYTES = 8
     DOUBLE_SIZE_BYTES = 8
 
-    def __init__(self, host, port):
-        self.socket = _socket.socket()
-        self.socket.setsockopt(_socket.IPPROTO_TCP, _socket.TCP_NODELAY, True)
-        self.socket.connect((host, port))
+    READ_BUFFER_SIZE_BYTES = 1 << 16
+
+    def __init__(self, host, port, decode_mode=None, recorder=None, transport=None):
+        self.socket = self.connect(host, port) if transport is None else transport
+        self._buffer = bytearray(RemoteProcessClient.READ_BUFFER_SIZE_BYTES)
+        self._view = memoryview(self._buffer)
+        self._begin = 0
+        self._end = 0
+        self._offset = 0
+        self._write_buffer = bytearray()
+        self.recorder = recorder
         self.map_name = None
         self.tiles_x_y = None
+        self.tiles_version = 0
+        self.changed_tiles = frozenset()
         self.waypoints = None
         self.starting_direction = None
+        self.map_name_written = False
+        self.waypoints_written = False
+        self.starting_direction_written = False
+        self.decode_mode = RemoteProcessClient.DecodeMode.OBJECTS if decode_mode is None else decode_mode
+        self.world_arrays = None
+        self.world_pool = None
+
+        if self.decode_mode == RemoteProcessClient.DecodeMode.ARRAYS:
+            from protocol_arrays import WorldArrays
+            self.world_arrays = WorldArrays()
+
+        if self.decode_mode == RemoteProcessClient.DecodeMode.POOL:
+            from protocol_pool import WorldPool
+            self.world_pool = WorldPool()
+
+    @staticmethod
+    def connect(host, port):
+        return protocol_transport.connect_tcp(host, port)
 
     def write_token_message(self, token):
         self.write_enum(RemoteProcessClient.MessageType.AUTHENTICATION_TOKEN)
         self.write_string(token)
+        self.flush()
 
     def read_team_size_message(self):
+        begin = self.read_offset()
         message_type = self.read_enum(RemoteProcessClient.MessageType)
         self.ensure_message_type(message_type, RemoteProcessClient.MessageType.TEAM_SIZE)
-        return self.read_int()
+        team_size = self.read_int()
+        self.record_message(message_type, begin)
+        return team_size
 
     def write_protocol_version_message(self):
         self.write_enum(RemoteProcessClient.MessageType.PROTOCOL_VERSION)
         self.write_int(2)
+        self.flush()
 
     def read_game_context_message(self):
+        begin = self.read_offset()
         message_type = self.read_enum(RemoteProcessClient.MessageType)
         self.ensure_message_type(message_type, RemoteProcessClient.MessageType.GAME_CONTEXT)
-        return self.read_game()
+        game = self.read_game()
+        self.record_message(message_type, begin)
+        return game
 
     def read_player_context_message(self):
+        begin = self.read_offset()
         message_type = self.read_enum(RemoteProcessClient.MessageType)
         if message_type == RemoteProcessClient.MessageType.GAME_OVER:
+            self.record_message(message_type, begin)
             return None
 
         self.ensure_message_type(message_type, RemoteProcessClient.MessageType.PLAYER_CONTEXT)
-        return self.read_player_context()
+        player_context = self.read_player_context()
+        self.record_message(message_type, begin)
+        return player_context
 
     def write_moves_message(self, moves):
         self.write_enum(RemoteProcessClient.MessageType.MOVE)
         self.write_moves(moves)
+        self.flush()
 
     def close(self):
         self.socket.close()
 
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def wait_message(self):
+        byte_count = self.scan(self.scan_message())
+        self.ensure_bytes(byte_count)
+        return byte_count
+
+    def read_offset(self):
+        return self._offset + self._begin
+
+    def record_message(self, message_type, begin):
+        if self.recorder is not None:
+            self.recorder.message_received(message_type, begin, self.read_offset())
+
     def read_bonus(self):
         if not self.read_boolean():
             return None
 
-        return Bonus(
-            self.read_long(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_enum(BonusType)
-        )
+        return protocol_codec.make_bonus(self.read_struct(protocol_codec.BONUS))
 
     def write_bonus(self, bonus):
         if bonus is None:
@@ -85,17 +128,7 @@ class RemoteProcessClient:
         else:
             self.write_boolean(True)
 
-            self.write_long(bonus.id)
-            self.write_double(bonus.mass)
-            self.write_double(bonus.x)
-            self.write_double(bonus.y)
-            self.write_double(bonus.speed_x)
-            self.write_double(bonus.speed_y)
-            self.write_double(bonus.angle)
-            self.write_double(bonus.angular_speed)
-            self.write_double(bonus.width)
-            self.write_double(bonus.height)
-            self.write_enum(bonus.type)
+            self.write_bytes(protocol_codec.pack_bonus(bonus))
 
     def read_bonuses(self):
         bonus_count = self.read_int()
@@ -122,14 +155,7 @@ class RemoteProcessClient:
         if not self.read_boolean():
             return None
 
-        return Car(
-            self.read_long(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_long(), self.read_int(), self.read_boolean(), self.read_enum(CarType), self.read_int(),
-            self.read_int(), self.read_int(), self.read_int(), self.read_int(), self.read_int(), self.read_int(),
-            self.read_int(), self.read_double(), self.read_double(), self.read_double(), self.read_int(),
-            self.read_int(), self.read_int(), self.read_boolean()
-        )
+        return protocol_codec.make_car(self.read_struct(protocol_codec.CAR))
 
     def write_car(self, car):
         if car is None:
@@ -137,35 +163,7 @@ class RemoteProcessClient:
         else:
             self.write_boolean(True)
 
-            self.write_long(car.id)
-            self.write_double(car.mass)
-            self.write_double(car.x)
-            self.write_double(car.y)
-            self.write_double(car.speed_x)
-            self.write_double(car.speed_y)
-            self.write_double(car.angle)
-            self.write_double(car.angular_speed)
-            self.write_double(car.width)
-            self.write_double(car.height)
-            self.write_long(car.player_id)
-            self.write_int(car.teammate_index)
-            self.write_boolean(car.teammate)
-            self.write_enum(car.type)
-            self.write_int(car.projectile_count)
-            self.write_int(car.nitro_charge_count)
-            self.write_int(car.oil_canister_count)
-            self.write_int(car.remaining_projectile_cooldown_ticks)
-            self.write_int(car.remaining_nitro_cooldown_ticks)
-            self.write_int(car.remaining_oil_cooldown_ticks)
-            self.write_int(car.remaining_nitro_ticks)
-            self.write_int(car.remaining_oiled_ticks)
-            self.write_double(car.durability)
-            self.write_double(car.engine_power)
-            self.write_double(car.wheel_turn)
-            self.write_int(car.next_waypoint_index)
-            self.write_int(car.next_waypoint_x)
-            self.write_int(car.next_waypoint_y)
-            self.write_boolean(car.finished_track)
+            self.write_bytes(protocol_codec.pack_car(car))
 
     def read_cars(self):
         car_count = self.read_int()
@@ -192,19 +190,9 @@ class RemoteProcessClient:
         if not self.read_boolean():
             return None
 
-        return Game(
-            self.read_long(), self.read_int(), self.read_int(), self.read_int(), self.read_double(), self.read_double(),
-            self.read_int(), self.read_int(), self.read_int(), self.read_double(), self.read_ints(), self.read_int(),
-            self.read_double(), self.read_double(), self.read_int(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_int(), self.read_int(),
-            self.read_int(), self.read_double(), self.read_int(), self.read_int(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_int(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_int(), self.read_int()
-        )
+        head = self.read_struct(protocol_codec.GAME_HEAD)
+        finish_track_scores = self.read_ints()
+        return protocol_codec.make_game(head, finish_track_scores, self.read_struct(protocol_codec.GAME_TAIL))
 
     def write_game(self, game):
         if game is None:
@@ -212,60 +200,9 @@ class RemoteProcessClient:
         else:
             self.write_boolean(True)
 
-            self.write_long(game.random_seed)
-            self.write_int(game.tick_count)
-            self.write_int(game.world_width)
-            self.write_int(game.world_height)
-            self.write_double(game.track_tile_size)
-            self.write_double(game.track_tile_margin)
-            self.write_int(game.lap_count)
-            self.write_int(game.lap_tick_count)
-            self.write_int(game.initial_freeze_duration_ticks)
-            self.write_double(game.burning_time_duration_factor)
+            self.write_bytes(protocol_codec.pack_game_head(game))
             self.write_ints(game.finish_track_scores)
-            self.write_int(game.finish_lap_score)
-            self.write_double(game.lap_waypoints_summary_score_factor)
-            self.write_double(game.car_damage_score_factor)
-            self.write_int(game.car_elimination_score)
-            self.write_double(game.car_width)
-            self.write_double(game.car_height)
-            self.write_double(game.car_engine_power_change_per_tick)
-            self.write_double(game.car_wheel_turn_change_per_tick)
-            self.write_double(game.car_angular_speed_factor)
-            self.write_double(game.car_movement_air_friction_factor)
-            self.write_double(game.car_rotation_air_friction_factor)
-            self.write_double(game.car_lengthwise_movement_friction_factor)
-            self.write_double(game.car_crosswise_movement_friction_factor)
-            self.write_double(game.car_rotation_friction_factor)
-            self.write_int(game.throw_projectile_cooldown_ticks)
-            self.write_int(game.use_nitro_cooldown_ticks)
-            self.write_int(game.spill_oil_cooldown_ticks)
-            self.write_double(game.nitro_engine_power_factor)
-            self.write_int(game.nitro_duration_ticks)
-            self.write_int(game.car_reactivation_time_ticks)
-            self.write_double(game.buggy_mass)
-            self.write_double(game.buggy_engine_forward_power)
-            self.write_double(game.buggy_engine_rear_power)
-            self.write_double(game.jeep_mass)
-            self.write_double(game.jeep_engine_forward_power)
-            self.write_double(game.jeep_engine_rear_power)
-            self.write_double(game.bonus_size)
-            self.write_double(game.bonus_mass)
-            self.write_int(game.pure_score_amount)
-            self.write_double(game.washer_radius)
-            self.write_double(game.washer_mass)
-            self.write_double(game.washer_initial_speed)
-            self.write_double(game.washer_damage)
-            self.write_double(game.side_washer_angle)
-            self.write_double(game.tire_radius)
-            self.write_double(game.tire_mass)
-            self.write_double(game.tire_initial_speed)
-            self.write_double(game.tire_damage_factor)
-            self.write_double(game.tire_disappear_speed_factor)
-            self.write_double(game.oil_slick_initial_range)
-            self.write_double(game.oil_slick_radius)
-            self.write_int(game.oil_slick_lifetime)
-            self.write_int(game.max_oiled_state_duration_ticks)
+            self.write_bytes(protocol_codec.pack_game_tail(game))
 
     def read_games(self):
         game_count = self.read_int()
@@ -292,16 +229,7 @@ class RemoteProcessClient:
         if not self.read_boolean():
             return None
 
-        move = Move()
-
-        move.engine_power = self.read_double()
-        move.brake = self.read_boolean()
-        move.wheel_turn = self.read_double()
-        move.throw_projectile = self.read_boolean()
-        move.use_nitro = self.read_boolean()
-        move.spill_oil = self.read_boolean()
-
-        return move
+        return protocol_codec.make_move(self.read_struct(protocol_codec.MOVE))
 
     def write_move(self, move):
         if move is None:
@@ -309,12 +237,7 @@ class RemoteProcessClient:
         else:
             self.write_boolean(True)
 
-            self.write_double(move.engine_power)
-            self.write_boolean(move.brake)
-            self.write_double(move.wheel_turn)
-            self.write_boolean(move.throw_projectile)
-            self.write_boolean(move.use_nitro)
-            self.write_boolean(move.spill_oil)
+            self.write_bytes(protocol_codec.pack_move(move))
 
     def read_moves(self):
         move_count = self.read_int()
@@ -341,10 +264,7 @@ class RemoteProcessClient:
         if not self.read_boolean():
             return None
 
-        return OilSlick(
-            self.read_long(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_double(), self.read_int()
-        )
+        return protocol_codec.make_oil_slick(self.read_struct(protocol_codec.OIL_SLICK))
 
     def write_oil_slick(self, oil_slick):
         if oil_slick is None:
@@ -352,16 +272,7 @@ class RemoteProcessClient:
         else:
             self.write_boolean(True)
 
-            self.write_long(oil_slick.id)
-            self.write_double(oil_slick.mass)
-            self.write_double(oil_slick.x)
-            self.write_double(oil_slick.y)
-            self.write_double(oil_slick.speed_x)
-            self.write_double(oil_slick.speed_y)
-            self.write_double(oil_slick.angle)
-            self.write_double(oil_slick.angular_speed)
-            self.write_double(oil_slick.radius)
-            self.write_int(oil_slick.remaining_lifetime)
+            self.write_bytes(protocol_codec.pack_oil_slick(oil_slick))
 
     def read_oil_slicks(self):
         oil_slick_count = self.read_int()
@@ -388,7 +299,12 @@ class RemoteProcessClient:
         if not self.read_boolean():
             return None
 
-        return Player(self.read_long(), self.read_boolean(), self.read_string(), self.read_boolean(), self.read_int())
+        return protocol_codec.make_player(self.read_player_values())
+
+    def read_player_values(self):
+        player_id, me = self.read_struct(protocol_codec.PLAYER_HEAD)
+        name = self.read_string()
+        return (player_id, me, name) + self.read_struct(protocol_codec.PLAYER_TAIL)
 
     def write_player(self, player):
         if player is None:
@@ -427,8 +343,23 @@ class RemoteProcessClient:
         if not self.read_boolean():
             return None
 
+        if self.decode_mode == RemoteProcessClient.DecodeMode.POOL:
+            return self.read_player_context_pooled()
+
         return PlayerContext(self.read_cars(), self.read_world())
 
+    def read_player_context_pooled(self):
+        car_values = self.read_optional_values(lambda: self.read_struct(protocol_codec.CAR))
+        world = self.read_world()
+        cars = self.make_pooled(self.world_pool.cars, car_values)
+
+        if self.world_pool.player_context is None:
+            self.world_pool.player_context = PlayerContext(cars, world)
+        else:
+            self.world_pool.player_context.__init__(cars, world)
+
+        return self.world_pool.player_context
+
     def write_player_context(self, player_context):
         if player_context is None:
             self.write_boolean(False)
@@ -463,11 +394,7 @@ class RemoteProcessClient:
         if not self.read_boolean():
             return None
 
-        return Projectile(
-            self.read_long(), self.read_double(), self.read_double(), self.read_double(), self.read_double(),
-            self.read_double(), self.read_double(), self.read_double(), self.read_double(), self.read_long(),
-            self.read_long(), self.read_enum(ProjectileType)
-        )
+        return protocol_codec.make_projectile(self.read_struct(protocol_codec.PROJECTILE))
 
     def write_projectile(self, projectile):
         if projectile is None:
@@ -475,18 +402,7 @@ class RemoteProcessClient:
         else:
             self.write_boolean(True)
 
-            self.write_long(projectile.id)
-            self.write_double(projectile.mass)
-            self.write_double(projectile.x)
-            self.write_double(projectile.y)
-            self.write_double(projectile.speed_x)
-            self.write_double(projectile.speed_y)
-            self.write_double(projectile.angle)
-            self.write_double(projectile.angular_speed)
-            self.write_double(projectile.radius)
-            self.write_long(projectile.car_id)
-            self.write_long(projectile.player_id)
-            self.write_enum(projectile.type)
+            self.write_bytes(protocol_codec.pack_projectile(projectile))
 
     def read_projectiles(self):
         projectile_count = self.read_int()
@@ -513,32 +429,286 @@ class RemoteProcessClient:
         if not self.read_boolean():
             return None
 
+        if self.decode_mode == RemoteProcessClient.DecodeMode.ARRAYS:
+            return self.read_world_arrays()
+
+        if self.decode_mode == RemoteProcessClient.DecodeMode.LAZY:
+            return self.read_world_lazy()
+
+        if self.decode_mode == RemoteProcessClient.DecodeMode.POOL:
+            return self.read_world_pooled()
+
         return World(
-            self.read_int(), self.read_int(), self.read_int(), self.read_int(), self.read_int(), self.read_players(),
+            *self.read_struct(protocol_codec.WORLD_HEAD), self.read_players(),
             self.read_cars(), self.read_projectiles(), self.read_bonuses(), self.read_oil_slicks(),
-            self.read_map_name(), self.read_tiles_x_y(), self.read_waypoints(), self.read_starting_direction()
+            self.read_map_name(), self.read_tiles_x_y(), self.read_waypoints(), self.read_starting_direction(),
+            self.tiles_version, self.changed_tiles
+        )
+
+    def read_world_arrays(self):
+        head = self.read_struct(protocol_codec.WORLD_HEAD)
+        players = self.read_players()
+        cars = self.read_entity_arrays(self.world_arrays.cars)
+        projectiles = self.read_entity_arrays(self.world_arrays.projectiles)
+        bonuses = self.read_entity_arrays(self.world_arrays.bonuses)
+        oil_slicks = self.read_entity_arrays(self.world_arrays.oil_slicks)
+        arrays = WorldValues(*(
+            EntityList(entity_arrays.values.copy(), entity_arrays.make) if entities is None else entities
+            for entities, entity_arrays in zip(
+                (cars, projectiles, bonuses, oil_slicks),
+                (self.world_arrays.cars, self.world_arrays.projectiles, self.world_arrays.bonuses,
+                 self.world_arrays.oil_slicks)
+            )
+        ))
+
+        return World(
+            *head, players, cars, projectiles, bonuses, oil_slicks, self.read_map_name(), self.read_tiles_x_y(),
+            self.read_waypoints(), self.read_starting_direction(), self.tiles_version, self.changed_tiles, arrays
+        )
+
+    def read_entity_arrays(self, entity_arrays):
+        count = self.read_int()
+        if count < 0:
+            entity_arrays.count = 0
+            return None
+
+        record_size = entity_arrays.record_struct.size
+        offset = 0
+        complete = True
+
+        for _ in range(count):
+            if self._end - self._begin <= offset:
+                self.receive(offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES)
+
+            if self._buffer[self._begin + offset] != 0:
+                offset += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES + record_size
+            else:
+                offset += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+                complete = False
+
+        if self._end - self._begin < offset:
+            self.receive(offset)
+
+        slots = None
+
+        if complete:
+            entity_arrays.assign_records(self._buffer, self._begin, count)
+        else:
+            values = []
+            slots = []
+            position = self._begin
+
+            for _ in range(count):
+                position += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+
+                if self._buffer[position - RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES] != 0:
+                    slots.append(values.__len__())
+                    values.append(entity_arrays.record_struct.unpack_from(self._buffer, position))
+                    position += record_size
+                else:
+                    slots.append(None)
+
+            entity_arrays.assign_values(values)
+
+        self._begin += offset
+
+        return EntityList(entity_arrays.values.copy(), entity_arrays.make, slots)
+
+    def read_world_pooled(self):
+        pool = self.world_pool
+        pool.begin()
+
+        head = self.read_struct(protocol_codec.WORLD_HEAD)
+        players = self.make_pooled(pool.players, self.read_optional_values(self.read_player_values))
+        cars = self.make_pooled(pool.cars, self.read_optional_values(
+            lambda: self.read_struct(protocol_codec.CAR)))
+        projectiles = self.make_pooled(pool.projectiles, self.read_optional_values(
+            lambda: self.read_struct(protocol_codec.PROJECTILE)))
+        bonuses = self.make_pooled(pool.bonuses, self.read_optional_values(
+            lambda: self.read_struct(protocol_codec.BONUS)))
+        oil_slicks = self.make_pooled(pool.oil_slicks, self.read_optional_values(
+            lambda: self.read_struct(protocol_codec.OIL_SLICK)))
+
+        pool.end()
+
+        values = (
+            *head, players, cars, projectiles, bonuses, oil_slicks, self.read_map_name(), self.read_tiles_x_y(),
+            self.read_waypoints(), self.read_starting_direction(), self.tiles_version, self.changed_tiles
+        )
+
+        if pool.world is None:
+            pool.world = World(*values)
+        else:
+            pool.world.__init__(*values)
+
+        return pool.world
+
+    def read_optional_values(self, read_values):
+        count = self.read_int()
+        if count < 0:
+            return None
+
+        values = []
+
+        for _ in range(count):
+            values.append(read_values() if self.read_boolean() else None)
+
+        return values
+
+    @staticmethod
+    def make_pooled(pool, values):
+        if values is None:
+            return None
+
+        return [None if entry is None else pool.get(entry) for entry in values]
+
+    def read_world_lazy(self):
+        from protocol_lazy import LazyWorld
+
+        head = self.read_struct(protocol_codec.WORLD_HEAD)
+        sections = {
+            'players': self.read_section(self.scan_player),
+            'cars': self.read_section(lambda offset: self.scan_record(offset, protocol_codec.CAR)),
+            'projectiles': self.read_section(lambda offset: self.scan_record(offset, protocol_codec.PROJECTILE)),
+            'bonuses': self.read_section(lambda offset: self.scan_record(offset, protocol_codec.BONUS)),
+            'oil_slicks': self.read_section(lambda offset: self.scan_record(offset, protocol_codec.OIL_SLICK)),
+        }
+
+        return LazyWorld(
+            *head, sections, self.read_map_name(), self.read_tiles_x_y(), self.read_waypoints(),
+            self.read_starting_direction(), self.tiles_version, self.changed_tiles
+        )
+
+    def read_section(self, scan_entry):
+        return self.read_bytes(self.scan(self.scan_array(0, scan_entry)))
+
+    def scan(self, scan):
+        try:
+            while True:
+                self.ensure_bytes(next(scan))
+        except StopIteration as stop:
+            return stop.value
+
+    def scan_message(self, offset=0):
+        yield offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+        message_type = self.peek_byte(offset)
+        offset += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+
+        if message_type == RemoteProcessClient.MessageType.TEAM_SIZE:
+            return offset + RemoteProcessClient.INTEGER_SIZE_BYTES
+        if message_type == RemoteProcessClient.MessageType.GAME_CONTEXT:
+            return (yield from self.scan_game(offset))
+        if message_type == RemoteProcessClient.MessageType.PLAYER_CONTEXT:
+            return (yield from self.scan_player_context(offset))
+
+        return offset
+
+    def scan_game(self, offset):
+        if (yield from self.scan_absent(offset)):
+            return offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+
+        offset += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES + protocol_codec.GAME_HEAD.size
+        offset = yield from self.scan_values(offset, RemoteProcessClient.INTEGER_SIZE_BYTES)
+
+        return offset + protocol_codec.GAME_TAIL.size
+
+    def scan_player_context(self, offset):
+        if (yield from self.scan_absent(offset)):
+            return offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+
+        offset += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+        offset = yield from self.scan_array(offset, lambda entry_offset: self.scan_record(entry_offset,
+                                                                                          protocol_codec.CAR))
+
+        return (yield from self.scan_world(offset))
+
+    def scan_world(self, offset):
+        if (yield from self.scan_absent(offset)):
+            return offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+
+        offset += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES + protocol_codec.WORLD_HEAD.size
+        offset = yield from self.scan_array(offset, self.scan_player)
+
+        for record_struct in (protocol_codec.CAR, protocol_codec.PROJECTILE, protocol_codec.BONUS,
+                              protocol_codec.OIL_SLICK):
+            offset = yield from self.scan_array(
+                offset, lambda entry_offset: self.scan_record(entry_offset, record_struct)
+            )
+
+        if self.map_name is None:
+            offset = yield from self.scan_values(offset, RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES)
+
+        offset = yield from self.scan_array(
+            offset, lambda entry_offset: self.scan_values(entry_offset, RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES)
         )
 
+        if self.waypoints is None:
+            offset = yield from self.scan_array(
+                offset, lambda entry_offset: self.scan_values(entry_offset, RemoteProcessClient.INTEGER_SIZE_BYTES)
+            )
+
+        if self.starting_direction is None:
+            offset += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+
+        return offset
+
+    def scan_array(self, offset, scan_entry):
+        yield offset + RemoteProcessClient.INTEGER_SIZE_BYTES
+        count = self.peek_int(offset)
+        offset += RemoteProcessClient.INTEGER_SIZE_BYTES
+
+        for _ in range(count):
+            offset = yield from scan_entry(offset)
+
+        return offset
+
+    def scan_values(self, offset, value_size):
+        yield offset + RemoteProcessClient.INTEGER_SIZE_BYTES
+        count = self.peek_int(offset)
+
+        return offset + RemoteProcessClient.INTEGER_SIZE_BYTES + max(count, 0) * value_size
+
+    def scan_record(self, offset, record_struct):
+        if (yield from self.scan_absent(offset)):
+            return offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+
+        return offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES + record_struct.size
+
+    def scan_player(self, offset):
+        if (yield from self.scan_absent(offset)):
+            return offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+
+        offset += RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES + protocol_codec.PLAYER_HEAD.size
+        offset = yield from self.scan_values(offset, RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES)
+
+        return offset + protocol_codec.PLAYER_TAIL.size
+
+    def scan_absent(self, offset):
+        yield offset + RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES
+        return self.peek_byte(offset) == 0
+
+    def peek_byte(self, offset):
+        return protocol_codec.SIGNED_BYTE.unpack_from(self._buffer, self._begin + offset)[0]
+
+    def peek_int(self, offset):
+        return protocol_codec.INTEGER.unpack_from(self._buffer, self._begin + offset)[0]
+
     def write_world(self, world):
         if world is None:
             self.write_boolean(False)
         else:
             self.write_boolean(True)
 
-            self.write_int(world.tick)
-            self.write_int(world.tick_count)
-            self.write_int(world.last_tick_index)
-            self.write_int(world.width)
-            self.write_int(world.height)
+            self.write_bytes(protocol_codec.pack_world_head(world))
             self.write_players(world.players)
             self.write_cars(world.cars)
             self.write_projectiles(world.projectiles)
             self.write_bonuses(world.bonuses)
             self.write_oil_slicks(world.oil_slicks)
-            self.write_string(world.map_name)
+            self.write_map_name(world.map_name)
             self.write_enums_2d(world.tiles_x_y)
-            self.write_ints_2d(world.waypoints)
-            self.write_enum(world.starting_direction)
+            self.write_waypoints(world.waypoints)
+            self.write_starting_direction(world.starting_direction)
 
     def read_worlds(self):
         world_count = self.read_int()
@@ -567,11 +737,36 @@ class RemoteProcessClient:
 
         return self.map_name
 
+    def write_map_name(self, map_name):
+        if not self.map_name_written:
+            self.write_string(map_name)
+            self.map_name_written = True
+
     def read_tiles_x_y(self):
         new_tiles_x_y = self.read_enums_2d(TileType)
+        changed_tiles = set()
 
         if new_tiles_x_y is not None and new_tiles_x_y.__len__() > 0:
-            self.tiles_x_y = new_tiles_x_y
+            row_size = new_tiles_x_y[0].__len__()
+
+            if (self.tiles_x_y is None or self.tiles_x_y.__len__() != new_tiles_x_y.__len__() or
+                    any(column.__len__() != row_size for column in self.tiles_x_y)):
+                self.tiles_x_y = new_tiles_x_y
+                changed_tiles.update(range(new_tiles_x_y.__len__() * row_size))
+            else:
+                for x, new_column in enumerate(new_tiles_x_y):
+                    column = self.tiles_x_y[x]
+
+                    if column != new_column:
+                        for y, tile_type in enumerate(new_column):
+                            if column[y] != tile_type:
+                                column[y] = tile_type
+                                changed_tiles.add(x * row_size + y)
+
+        if changed_tiles:
+            self.tiles_version += 1
+
+        self.changed_tiles = frozenset(changed_tiles)
 
         return self.tiles_x_y
 
@@ -581,38 +776,42 @@ class RemoteProcessClient:
 
         return self.waypoints
 
+    def write_waypoints(self, waypoints):
+        if not self.waypoints_written:
+            self.write_ints_2d(waypoints)
+            self.waypoints_written = True
+
     def read_starting_direction(self):
         if self.starting_direction is None:
             self.starting_direction = self.read_enum(Direction)
 
         return self.starting_direction
 
+    def write_starting_direction(self, starting_direction):
+        if not self.starting_direction_written:
+            self.write_enum(starting_direction)
+            self.starting_direction_written = True
+
     @staticmethod
     def ensure_message_type(actual_type, expected_type):
         if actual_type != expected_type:
             raise ValueError("Received wrong message [actual=%s, expected=%s]." % (actual_type, expected_type))
 
     def read_enum(self, enum_class):
-        byte_array = self.read_bytes(RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES)
-        value = struct.unpack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "b", byte_array)[0]
-
-        for enum_key, enum_value in enum_class.__dict__.items():
-            if not str(enum_key).startswith("__") and value == enum_value:
-                return enum_value
-
-        return None
+        return protocol_codec.make_enum(enum_class, self.read_struct(protocol_codec.SIGNED_BYTE)[0])
 
     def read_enums(self, enum_class):
         count = self.read_int()
         if count < 0:
             return None
 
-        enums = []
+        if self._end - self._begin < count:
+            self.receive(count)
 
-        for _ in range(count):
-            enums.append(self.read_enum(enum_class))
+        begin = self._begin
+        self._begin += count
 
-        return enums
+        return protocol_codec.make_enums(enum_class, self._view[begin:self._begin])
 
     def read_enums_2d(self, enum_class):
         count = self.read_int()
@@ -627,18 +826,14 @@ class RemoteProcessClient:
         return enums_2d
 
     def write_enum(self, value):
-        self.write_bytes(struct.pack(
-            RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "b", -1 if value is None else value
-        ))
+        self.write_bytes(protocol_codec.SIGNED_BYTE.pack(protocol_codec.enum_value(value)))
 
     def write_enums(self, enums):
         if enums is None:
             self.write_int(-1)
         else:
             self.write_int(enums.__len__())
-
-            for value in enums:
-                self.write_enum(value)
+            self.write_bytes(protocol_codec.pack_enums(enums))
 
     def write_enums_2d(self, enums_2d):
         if enums_2d is None:
@@ -668,8 +863,7 @@ class RemoteProcessClient:
         self.write_bytes(byte_array)
 
     def read_boolean(self):
-        byte_array = self.read_bytes(RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES)
-        return struct.unpack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "b", byte_array)[0] != 0
+        return self.read_struct(protocol_codec.SIGNED_BYTE)[0] != 0
 
     def read_boolean_array(self, count):
         byte_array = self.read_bytes(count * RemoteProcessClient.SIGNED_BYTE_SIZE_BYTES)
@@ -678,21 +872,24 @@ class RemoteProcessClient:
         return [unpacked_bytes[i] != 0 for i in range(count)]
 
     def write_boolean(self, value):
-        self.write_bytes(struct.pack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "b", 1 if value else 0))
+        self.write_bytes(protocol_codec.SIGNED_BYTE.pack(1 if value else 0))
 
     def read_int(self):
-        byte_array = self.read_bytes(RemoteProcessClient.INTEGER_SIZE_BYTES)
-        return struct.unpack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "i", byte_array)[0]
+        return self.read_struct(protocol_codec.INTEGER)[0]
 
     def read_ints(self):
         count = self.read_int()
         if count < 0:
             return None
 
-        ints = []
+        byte_count = count * RemoteProcessClient.INTEGER_SIZE_BYTES
+        if self._end - self._begin < byte_count:
+            self.receive(byte_count)
 
-        for _ in range(count):
-            ints.append(self.read_int())
+        ints = list(struct.unpack_from(
+            RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + str(count) + "i", self._buffer, self._begin
+        ))
+        self._begin += byte_count
 
         return ints
 
@@ -709,16 +906,14 @@ class RemoteProcessClient:
         return ints_2d
 
     def write_int(self, value):
-        self.write_bytes(struct.pack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "i", value))
+        self.write_bytes(protocol_codec.INTEGER.pack(value))
 
     def write_ints(self, ints):
         if ints is None:
             self.write_int(-1)
         else:
             self.write_int(ints.__len__())
-
-            for value in ints:
-                self.write_int(value)
+            self.write_bytes(protocol_codec.pack_ints(ints))
 
     def write_ints_2d(self, ints_2d):
         if ints_2d is None:
@@ -730,34 +925,88 @@ class RemoteProcessClient:
                 self.write_ints(ints)
 
     def read_long(self):
-        byte_array = self.read_bytes(RemoteProcessClient.LONG_SIZE_BYTES)
-        return struct.unpack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "q", byte_array)[0]
+        return self.read_struct(protocol_codec.LONG)[0]
 
     def write_long(self, value):
-        self.write_bytes(struct.pack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "q", value))
+        self.write_bytes(protocol_codec.LONG.pack(value))
 
     def read_double(self):
-        byte_array = self.read_bytes(RemoteProcessClient.DOUBLE_SIZE_BYTES)
-        return struct.unpack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "d", byte_array)[0]
+        return self.read_struct(protocol_codec.DOUBLE)[0]
 
     def write_double(self, value):
-        self.write_bytes(struct.pack(RemoteProcessClient.BYTE_ORDER_FORMAT_STRING + "d", value))
+        self.write_bytes(protocol_codec.DOUBLE.pack(value))
+
+    def read_struct(self, record_struct):
+        if self._end - self._begin < record_struct.size:
+            self.receive(record_struct.size)
+
+        values = record_struct.unpack_from(self._buffer, self._begin)
+        self._begin += record_struct.size
+
+        return values
+
+    def ensure_bytes(self, byte_count):
+        if self._end - self._begin < byte_count:
+            self.receive(byte_count)
 
     def read_bytes(self, byte_count):
-        byte_array = bytes()
+        if self._end - self._begin < byte_count:
+            self.receive(byte_count)
+
+        begin = self._begin
+        self._begin += byte_count
+
+        return bytes(self._view[begin:self._begin])
+
+    def receive(self, byte_count):
+        if self._begin == self._end:
+            self._offset += self._begin
+            self._begin = 0
+            self._end = 0
 
-        while len(byte_array) < byte_count:
-            chunk = self.socket.recv(byte_count - len(byte_array))
+        if self._begin + byte_count > self._buffer.__len__():
+            self.compact(byte_count)
 
-            if not len(chunk):
+        while self._end - self._begin < byte_count:
+            received = self.socket.recv_into(self._view[self._end:])
+
+            if not received:
                 raise IOError("Can't read %s bytes from input stream." % str(byte_count))
 
-            byte_array += chunk
+            if self.recorder is not None:
+                self.recorder.received(self._view[self._end:self._end + received])
+
+            self._end += received
+
+    def compact(self, byte_count):
+        unread = bytes(self._view[self._begin:self._end])
+
+        if byte_count > self._buffer.__len__():
+            self._view.release()
+            self._buffer = bytearray(max(byte_count, 2 * self._buffer.__len__()))
+            self._view = memoryview(self._buffer)
 
-        return byte_array
+        self._view[:unread.__len__()] = unread
+        self._offset += self._begin
+        self._begin = 0
+        self._end = unread.__len__()
 
     def write_bytes(self, byte_array):
-        self.socket.sendall(byte_array)
+        self._write_buffer += byte_array
+
+    def flush(self):
+        self.socket.sendall(self._write_buffer)
+
+        if self.recorder is not None:
+            self.recorder.sent(self._write_buffer)
+
+        del self._write_buffer[:]
+
+    class DecodeMode:
+        OBJECTS = 0
+        ARRAYS = 1
+        LAZY = 2
+        POOL = 3
 
     class MessageType:
         UNKNOWN = 0
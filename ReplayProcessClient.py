@@ -0,0 +1,35 @@
+import mmap
+from copy import copy
+
+from RemoteProcessClient import RemoteProcessClient
+
+
+class ReplayProcessClient(RemoteProcessClient):
+    def __init__(self, path, decode_mode=None):
+        RemoteProcessClient.__init__(self, None, None, decode_mode)
+        self.file = open(path + ".in", "rb")
+        self._buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._buffer)
+        self._end = self._buffer.__len__()
+        self.sent = bytearray()
+        self.moves = []
+
+    @staticmethod
+    def connect(host, port):
+        return None
+
+    def write_moves_message(self, moves):
+        RemoteProcessClient.write_moves_message(self, moves)
+        self.moves.append([copy(move) for move in moves])
+
+    def close(self):
+        self._view.release()
+        self._buffer.close()
+        self.file.close()
+
+    def receive(self, byte_count):
+        raise IOError("Can't read %s bytes from recording." % str(byte_count))
+
+    def flush(self):
+        self.sent += self._write_buffer
+        del self._write_buffer[:]
@@ -1,19 +1,48 @@
 import sys
+from os import environ
 
-from MyStrategy import MyStrategy
+from MyStrategy import MyStrategy, SessionFinished
 from RemoteProcessClient import RemoteProcessClient
 from model.Move import Move
+from strategy_release import make_cars_history
+from tick_latency import DECODE, ENCODE, STRATEGY, WAIT, NullTickProfiler, TickProfiler
 
 
 class Runner:
     def __init__(self):
-        if sys.argv.__len__() == 4:
-            self.remote_process_client = RemoteProcessClient(sys.argv[1], int(sys.argv[2]))
+        decode_mode = None
+        recorder = None
+
+        if "DECODE_MODE" in environ:
+            decode_mode = getattr(RemoteProcessClient.DecodeMode, environ["DECODE_MODE"].upper())
+
+        if "RECORD_PATH" in environ:
+            from protocol_recorder import Recorder
+            recorder = Recorder(environ["RECORD_PATH"])
+
+        if "REPLAY_PATH" in environ:
+            from ReplayProcessClient import ReplayProcessClient
+            self.remote_process_client = ReplayProcessClient(environ["REPLAY_PATH"], decode_mode)
+            self.token = "0000000000000000"
+        elif "UNIX_SOCKET_PATH" in environ:
+            from protocol_transport import connect_unix
+            transport = connect_unix(environ["UNIX_SOCKET_PATH"])
+            self.remote_process_client = RemoteProcessClient(None, None, decode_mode, recorder, transport)
+            self.token = sys.argv[3] if sys.argv.__len__() == 4 else "0000000000000000"
+        elif sys.argv.__len__() == 4:
+            self.remote_process_client = RemoteProcessClient(sys.argv[1], int(sys.argv[2]), decode_mode, recorder)
             self.token = sys.argv[3]
         else:
-            self.remote_process_client = RemoteProcessClient("127.0.0.1", 31001)
+            self.remote_process_client = RemoteProcessClient("127.0.0.1", 31001, decode_mode, recorder)
             self.token = "0000000000000000"
 
+        self.profile_phases = "PROFILE_PHASES" in environ and environ["PROFILE_PHASES"] == "1"
+
+        if self.profile_phases:
+            self.profiler = TickProfiler()
+        else:
+            self.profiler = NullTickProfiler()
+
     def run(self):
         try:
             self.remote_process_client.write_token_message(self.token)
@@ -21,31 +50,60 @@ class Runner:
             self.remote_process_client.write_protocol_version_message()
             game = self.remote_process_client.read_game_context_message()
 
+            history = make_cars_history()
             strategies = []
+            moves = []
 
             for _ in range(team_size):
-                strategies.append(MyStrategy())
+                strategies.append(MyStrategy(history))
+                moves.append(Move())
 
             while True:
+                self.profiler.start()
+                if self.profile_phases:
+                    self.remote_process_client.wait_message()
+                    self.profiler.lap(WAIT)
                 player_context = self.remote_process_client.read_player_context_message()
+                self.profiler.lap(DECODE)
                 if player_context is None:
                     break
 
+                self.count_pooled()
+
                 player_cars = player_context.cars
                 if player_cars is None or player_cars.__len__() != team_size:
                     break
 
-                moves = []
-
                 for car_index in range(team_size):
                     player_car = player_cars[car_index]
 
-                    move = Move()
-                    moves.append(move)
-                    strategies[player_car.teammate_index].move(player_car, player_context.world, game, move)
+                    move = moves[car_index]
+                    move.__init__()
+                    try:
+                        strategies[player_car.teammate_index].move(player_car, player_context.world, game, move)
+                    except SessionFinished:
+                        return
+                    self.profiler.lap(STRATEGY)
 
                 self.remote_process_client.write_moves_message(moves)
+                self.profiler.lap(ENCODE)
         finally:
             self.remote_process_client.close()
+            self.dump_profile()
+
+    def count_pooled(self):
+        pool = self.remote_process_client.world_pool
+
+        if pool is not None:
+            self.profiler.count(allocated=pool.allocated, reused=pool.reused, released=pool.released)
+
+    def dump_profile(self):
+        summary = list(self.profiler.summary())
+
+        if summary:
+            from debug import log
+
+            for values in summary:
+                log(**values)
 
 Runner().run()
@@ -0,0 +1,73 @@
+from RemoteProcessClient import RemoteProcessClient
+
+
+class IncompleteMessage(Exception):
+    pass
+
+
+class StreamProcessClient(RemoteProcessClient):
+    def __init__(self, reader, writer, decode_mode=None, recorder=None):
+        RemoteProcessClient.__init__(self, None, None, decode_mode, recorder)
+        self.reader = reader
+        self.writer = writer
+
+    @staticmethod
+    def connect(host, port):
+        return None
+
+    async def wait_message(self):
+        scan = self.scan_message()
+
+        try:
+            while True:
+                await self.wait_bytes(next(scan))
+        except StopIteration as stop:
+            byte_count = stop.value
+
+        await self.wait_bytes(byte_count)
+        return byte_count
+
+    async def wait_bytes(self, byte_count):
+        while self._end - self._begin < byte_count:
+            data = await self.reader.read(RemoteProcessClient.READ_BUFFER_SIZE_BYTES)
+
+            if not data:
+                raise IOError("Can't read message from input stream.")
+
+            self.feed(data)
+
+    async def drain(self):
+        await self.writer.drain()
+
+    def feed(self, data):
+        if self._begin == self._end:
+            self._offset += self._begin
+            self._begin = 0
+            self._end = 0
+
+        if self._end + data.__len__() > self._buffer.__len__():
+            self.compact(self._end - self._begin + data.__len__())
+
+        self._view[self._end:self._end + data.__len__()] = data
+
+        if self.recorder is not None:
+            self.recorder.received(data)
+
+        self._end += data.__len__()
+
+    def close(self):
+        self.writer.close()
+
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def receive(self, byte_count):
+        raise IncompleteMessage()
+
+    def flush(self):
+        self.writer.write(bytes(self._write_buffer))
+
+        if self.recorder is not None:
+            self.recorder.sent(self._write_buffer)
+
+        del self._write_buffer[:]
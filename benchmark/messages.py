@@ -0,0 +1,136 @@
+from argparse import ArgumentParser
+from collections import namedtuple
+from json import dump
+from random import Random
+from threading import Thread
+from time import perf_counter
+from RemoteProcessClient import RemoteProcessClient
+from benchmark.protocol import connect, encode, measure
+from model.Move import Move
+from model.PlayerContext import PlayerContext
+from protocol_scenario import generate_world
+
+Profile = namedtuple('Profile', (
+    'players_count', 'team_size', 'projectiles_count', 'bonuses_count',
+    'oil_slicks_count', 'world_size',
+))
+
+PROFILES = {
+    'duel': Profile(2, 1, 0, 4, 0, 8),
+    'typical': Profile(4, 2, 4, 16, 2, 16),
+    'crowded': Profile(4, 2, 100, 100, 50, 32),
+    'extreme': Profile(4, 2, 500, 500, 300, 64),
+}
+
+DECODE_MODES = {
+    'objects': RemoteProcessClient.DecodeMode.OBJECTS,
+    'arrays': RemoteProcessClient.DecodeMode.ARRAYS,
+    'lazy': RemoteProcessClient.DecodeMode.LAZY,
+    'pool': RemoteProcessClient.DecodeMode.POOL,
+}
+
+Result = namedtuple('Result', (
+    'benchmark', 'profile', 'decode_mode', 'messages', 'bytes', 'seconds',
+    'messages_per_second', 'megabytes_per_second',
+))
+
+
+def main():
+    args = parse_args()
+    results = []
+    for profile_name in args.profiles:
+        profile = PROFILES[profile_name]
+        worlds = generate_worlds(profile, args.count, args.seed)
+        contexts = [PlayerContext(world.cars[:profile.team_size], world)
+                    for world in worlds]
+        context_data = encode('write_player_context', contexts)
+        world_data = encode('write_world', worlds)
+        for mode_name in args.decode_modes:
+            mode = DECODE_MODES[mode_name]
+            results.append(make_result(
+                'read_player_context', profile_name, mode_name, args.count,
+                context_data.__len__(),
+                read_seconds(context_data, args.count,
+                             RemoteProcessClient.read_player_context, mode)))
+            results.append(make_result(
+                'read_world', profile_name, mode_name, args.count,
+                world_data.__len__(),
+                read_seconds(world_data, args.count,
+                             RemoteProcessClient.read_world, mode)))
+        byte_count, seconds = measure_write_moves(args.count,
+                                                  profile.team_size)
+        results.append(make_result('write_moves', profile_name, None,
+                                   args.count, byte_count, seconds))
+    for result in results:
+        print(result.benchmark, result.profile, result.decode_mode or '-',
+              '%.0f messages/s' % result.messages_per_second,
+              '%.1f MB/s' % result.megabytes_per_second)
+    if args.output is not None:
+        with open(args.output, 'w') as stream:
+            dump([result._asdict() for result in results], stream, indent=2)
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--profiles', nargs='+', choices=list(PROFILES),
+                        default=list(PROFILES))
+    parser.add_argument('--decode-modes', nargs='+',
+                        choices=list(DECODE_MODES),
+                        default=list(DECODE_MODES))
+    parser.add_argument('--output', default=None)
+    return parser.parse_args()
+
+
+def generate_worlds(profile, count, seed):
+    random = Random(seed)
+    return [generate_world(random, tick=tick,
+                           players_count=profile.players_count,
+                           team_size=profile.team_size,
+                           projectiles_count=profile.projectiles_count,
+                           bonuses_count=profile.bonuses_count,
+                           oil_slicks_count=profile.oil_slicks_count,
+                           world_size=profile.world_size)
+            for tick in range(count)]
+
+
+def read_seconds(data, count, read, decode_mode):
+    return count / measure(data, count, read, decode_mode)
+
+
+def measure_write_moves(count, moves_count):
+    client, peer = connect()
+    received = [0]
+
+    def receive():
+        while True:
+            chunk = peer.recv(1 << 16)
+            if not chunk:
+                break
+            received[0] += chunk.__len__()
+
+    receiver = Thread(target=receive)
+    receiver.start()
+    moves = [Move() for _ in range(moves_count)]
+    start = perf_counter()
+    for _ in range(count):
+        client.write_moves_message(moves)
+    finish = perf_counter()
+    client.close()
+    receiver.join()
+    peer.close()
+    return received[0], finish - start
+
+
+def make_result(benchmark, profile, decode_mode, messages, byte_count,
+                seconds):
+    return Result(benchmark=benchmark, profile=profile,
+                  decode_mode=decode_mode, messages=messages,
+                  bytes=byte_count, seconds=seconds,
+                  messages_per_second=messages / seconds,
+                  megabytes_per_second=byte_count / seconds / 1e6)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+from tracemalloc import start, stop, take_snapshot
+import protocol_codec
+from model.Bonus import Bonus
+from model.Car import Car
+from model.OilSlick import OilSlick
+from model.Projectile import Projectile
+from protocol_scenario import generate_world
+
+KINDS = {
+    'car': (Car, protocol_codec.CAR, protocol_codec.pack_car,
+            protocol_codec.update_car, 'cars'),
+    'bonus': (Bonus, protocol_codec.BONUS, protocol_codec.pack_bonus,
+              protocol_codec.update_bonus, 'bonuses'),
+    'projectile': (Projectile, protocol_codec.PROJECTILE,
+                   protocol_codec.pack_projectile,
+                   protocol_codec.update_projectile, 'projectiles'),
+    'oil_slick': (OilSlick, protocol_codec.OIL_SLICK,
+                  protocol_codec.pack_oil_slick,
+                  protocol_codec.update_oil_slick, 'oil_slicks'),
+}
+
+ATTRIBUTES = ('x', 'y', 'speed_x', 'speed_y', 'angle', 'id')
+
+
+def main():
+    args = parse_args()
+    worlds = read_worlds(args)
+    for name, (cls, record_struct, pack, update, section) in KINDS.items():
+        values = [record_struct.unpack(pack(entity)) for world in worlds
+                  for entity in getattr(world, section) or () if entity]
+        if not values:
+            continue
+        for variant, variant_cls in (('dict', make_dict_class(cls)),
+                                     ('slots', cls)):
+            memory, objects = measure_memory(variant_cls, update, values)
+            access = measure_access(objects, args.repeat)
+            print(name, variant, 'objects:', objects.__len__(),
+                  'memory: %.1f bytes/object' % memory,
+                  'access: %.1f ns/attribute' % access)
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument('--replay', default=None)
+    parser.add_argument('--ticks', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=20)
+    return parser.parse_args()
+
+
+def read_worlds(args):
+    if args.replay is None:
+        random = Random(args.seed)
+        return [generate_world(random, tick=tick, projectiles_count=4,
+                               bonuses_count=16, oil_slicks_count=2)
+                for tick in range(args.ticks)]
+    from ReplayProcessClient import ReplayProcessClient
+    client = ReplayProcessClient(args.replay)
+    client.write_token_message('0000000000000000')
+    client.read_team_size_message()
+    client.write_protocol_version_message()
+    client.read_game_context_message()
+    worlds = []
+    while True:
+        player_context = client.read_player_context_message()
+        if player_context is None:
+            break
+        worlds.append(player_context.world)
+    client.close()
+    return worlds
+
+
+def make_dict_class(cls):
+    return type('Dict' + cls.__name__, (),
+                {'__init__': cls.__init__, '__module__': __name__})
+
+
+def measure_memory(cls, update, values):
+    start()
+    before = take_snapshot()
+    objects = [update(cls.__new__(cls), entry) for entry in values]
+    after = take_snapshot()
+    stop()
+    allocated = sum(v.size_diff for v in after.compare_to(before, 'lineno'))
+    list_size = objects.__sizeof__()
+    return (allocated - list_size) / objects.__len__(), objects
+
+
+def measure_access(objects, repeat):
+    getters = [compile('for o in objects: o.' + name, name, 'exec')
+               for name in ATTRIBUTES]
+    start_time = perf_counter()
+    for _ in range(repeat):
+        for getter in getters:
+            exec(getter, {'objects': objects})
+    finish_time = perf_counter()
+    count = repeat * getters.__len__() * objects.__len__()
+    return (finish_time - start_time) * 1e9 / count
+
+
+if __name__ == '__main__':
+    main()
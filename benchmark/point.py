@@ -0,0 +1,141 @@
+from argparse import ArgumentParser
+from math import cos, sin, hypot
+from random import Random
+from time import perf_counter
+from tracemalloc import start, stop, take_snapshot
+from strategy_common import Point, MutablePoint
+
+
+class DictPoint:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return self.x == other.x and self.y == other.y
+
+    def __add__(self, other):
+        if isinstance(other, DictPoint):
+            return DictPoint(self.x + other.x, self.y + other.y)
+        else:
+            return DictPoint(self.x + other, self.y + other)
+
+    def __mul__(self, other):
+        if isinstance(other, DictPoint):
+            return DictPoint(self.x * other.x, self.y * other.y)
+        else:
+            return DictPoint(self.x * other, self.y * other)
+
+    def distance(self, other):
+        return hypot(other.x - self.x, other.y - self.y)
+
+    def rotate(self, angle):
+        return DictPoint(self.x * cos(angle) - self.y * sin(angle),
+                         self.y * cos(angle) + self.x * sin(angle))
+
+
+def construct(cls, points):
+    return [cls(v.x, v.y) for v in points]
+
+
+def add(cls, points):
+    return [v + v for v in points]
+
+
+def rotate_and_scale(cls, points):
+    return [v.rotate(0.1) * 2 for v in points]
+
+
+def rotate_scale(cls, points):
+    return [v.rotate_scale(0.1, 2) for v in points]
+
+
+def compare_distance(cls, points):
+    origin = points[0]
+    return [v.distance(origin) < 1 for v in points]
+
+
+def compare_squared_distance(cls, points):
+    origin = points[0]
+    return [v.squared_distance(origin) < 1 for v in points]
+
+
+def accumulate(cls, points):
+    result = cls(0, 0)
+    for v in points:
+        result = result + v
+    return result
+
+
+def accumulate_inplace(cls, points):
+    result = MutablePoint(0, 0)
+    for v in points:
+        result += v
+    return result
+
+
+def contains_in_list(cls, points):
+    visited = list(points[:16])
+    return [v in visited for v in points]
+
+
+def contains_in_set(cls, points):
+    visited = set(points[:16])
+    return [v in visited for v in points]
+
+
+CASES = (
+    ('construct', construct, construct),
+    ('add', add, add),
+    ('rotate_scale', rotate_and_scale, rotate_scale),
+    ('distance', compare_distance, compare_squared_distance),
+    ('accumulate', accumulate, accumulate_inplace),
+    ('contains', contains_in_list, contains_in_set),
+)
+
+
+def main():
+    args = parse_args()
+    random = Random(args.seed)
+    values = [(random.uniform(-1e3, 1e3), random.uniform(-1e3, 1e3))
+              for _ in range(args.count)]
+    for cls in (DictPoint, Point):
+        print(cls.__name__,
+              'memory: %.1f bytes/object' % measure_memory(cls, values))
+    for name, dict_function, slots_function in CASES:
+        for cls, function in ((DictPoint, dict_function),
+                              (Point, slots_function)):
+            points = [cls(x, y) for x, y in values]
+            seconds = measure(function, cls, points, args.repeat)
+            print(name, cls.__name__, function.__name__,
+                  '%.1f ns/point' % (seconds * 1e9 / args.count))
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+def measure_memory(cls, values):
+    start()
+    before = take_snapshot()
+    points = [cls(x, y) for x, y in values]
+    after = take_snapshot()
+    stop()
+    allocated = sum(v.size_diff for v in after.compare_to(before, 'lineno'))
+    return (allocated - points.__sizeof__()) / points.__len__()
+
+
+def measure(function, cls, points, repeat):
+    start_time = perf_counter()
+    for _ in range(repeat):
+        function(cls, points)
+    finish_time = perf_counter()
+    return (finish_time - start_time) / repeat
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+from argparse import ArgumentParser
+from random import Random
+from threading import Thread
+from time import perf_counter
+from RemoteProcessClient import RemoteProcessClient
+from model.BonusType import BonusType
+from model.Car import Car
+from model.CarType import CarType
+from model.Bonus import Bonus
+from model.OilSlick import OilSlick
+from model.Projectile import Projectile
+from model.ProjectileType import ProjectileType
+from model.TileType import TileType
+from protocol_codec import SIGNED_BYTE
+from protocol_transport import make_pair
+from protocol_scenario import (
+    generate_bonus,
+    generate_car,
+    generate_game,
+    generate_oil_slick,
+    generate_projectile,
+)
+
+
+def main():
+    args = parse_args()
+    random = Random(args.seed)
+    records = {
+        'car': (lambda: generate_car(random, 1, 1, 0, True), 'write_car',
+                'read_car', read_car_fields),
+        'bonus': (lambda: generate_bonus(random, 1), 'write_bonus',
+                  'read_bonus', read_bonus_fields),
+        'projectile': (lambda: generate_projectile(random, 1, 1, 1),
+                       'write_projectile', 'read_projectile',
+                       read_projectile_fields),
+        'oil_slick': (lambda: generate_oil_slick(random, 1), 'write_oil_slick',
+                      'read_oil_slick', read_oil_slick_fields),
+        'game': (lambda: generate_game(random), 'write_game', 'read_game',
+                 None),
+        'tiles_16x16': (lambda: generate_tiles(random, 16), 'write_enums_2d',
+                        'read_tiles', read_tiles_fields),
+        'tiles_64x64': (lambda: generate_tiles(random, 64), 'write_enums_2d',
+                        'read_tiles', read_tiles_fields),
+    }
+    for name, (generate, write, read, read_fields) in records.items():
+        data = encode(write, [generate() for _ in range(args.count)])
+        rate = measure(data, args.count, getattr(Readers, read))
+        print(name, 'struct:', int(rate), 'records/s')
+        if read_fields is not None:
+            rate = measure(data, args.count, read_fields)
+            print(name, 'fields:', int(rate), 'records/s')
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+def connect(decode_mode=None):
+    transport, peer = make_pair()
+    client = RemoteProcessClient(None, None, decode_mode, transport=transport)
+    return client, peer
+
+
+def encode(write, values):
+    client, peer = connect()
+    result = bytearray()
+
+    def receive():
+        while True:
+            chunk = peer.recv(1 << 16)
+            if not chunk:
+                break
+            result.extend(chunk)
+
+    receiver = Thread(target=receive)
+    receiver.start()
+    for value in values:
+        getattr(client, write)(value)
+    client.flush()
+    client.close()
+    receiver.join()
+    peer.close()
+    return bytes(result)
+
+
+def measure(data, count, read, decode_mode=None):
+    client, peer = connect(decode_mode)
+    sender = Thread(target=peer.sendall, args=(data,))
+    sender.start()
+    start = perf_counter()
+    for _ in range(count):
+        read(client)
+    finish = perf_counter()
+    sender.join()
+    client.close()
+    peer.close()
+    return count / (finish - start)
+
+
+def generate_tiles(random: Random, size):
+    values = [v for k, v in vars(TileType).items() if not k.startswith('__')]
+    return [[random.choice(values) for _ in range(size)] for _ in range(size)]
+
+
+class Readers:
+    read_car = RemoteProcessClient.read_car
+    read_bonus = RemoteProcessClient.read_bonus
+    read_projectile = RemoteProcessClient.read_projectile
+    read_oil_slick = RemoteProcessClient.read_oil_slick
+    read_game = RemoteProcessClient.read_game
+
+    @staticmethod
+    def read_tiles(client: RemoteProcessClient):
+        return client.read_enums_2d(TileType)
+
+
+def read_tiles_fields(client: RemoteProcessClient):
+    result = []
+    for _ in range(client.read_int()):
+        result.append([read_enum_fields(client, TileType)
+                       for _ in range(client.read_int())])
+    return result
+
+
+def read_enum_fields(client: RemoteProcessClient, enum_class):
+    value = client.read_struct(SIGNED_BYTE)[0]
+    for enum_key, enum_value in enum_class.__dict__.items():
+        if not str(enum_key).startswith("__") and value == enum_value:
+            return enum_value
+    return None
+
+
+def read_car_fields(client: RemoteProcessClient):
+    if not client.read_boolean():
+        return None
+    return Car(
+        client.read_long(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_long(), client.read_int(),
+        client.read_boolean(), client.read_enum(CarType), client.read_int(),
+        client.read_int(), client.read_int(), client.read_int(),
+        client.read_int(), client.read_int(), client.read_int(),
+        client.read_int(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_int(), client.read_int(),
+        client.read_int(), client.read_boolean()
+    )
+
+
+def read_bonus_fields(client: RemoteProcessClient):
+    if not client.read_boolean():
+        return None
+    return Bonus(
+        client.read_long(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_enum(BonusType)
+    )
+
+
+def read_projectile_fields(client: RemoteProcessClient):
+    if not client.read_boolean():
+        return None
+    return Projectile(
+        client.read_long(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_double(), client.read_double(),
+        client.read_long(), client.read_long(),
+        client.read_enum(ProjectileType)
+    )
+
+
+def read_oil_slick_fields(client: RemoteProcessClient):
+    if not client.read_boolean():
+        return None
+    return OilSlick(
+        client.read_long(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_double(), client.read_double(),
+        client.read_double(), client.read_double(), client.read_double(),
+        client.read_int()
+    )
+
+
+if __name__ == '__main__':
+    main()
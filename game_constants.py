@@ -0,0 +1,43 @@
+from collections import namedtuple
+from functools import lru_cache
+from model.Game import Game
+
+GameConstants = namedtuple('GameConstants', (
+    'tile_size',
+    'tile_margin',
+    'min_car_size',
+    'max_car_size',
+    'path_shift',
+    'take_next_distance',
+    'remake_distance',
+    'washer_range',
+    'tire_range',
+))
+
+WASHER_RANGE_TICKS = 150
+TIRE_RANGE_TICKS = 50
+TAKE_NEXT_DISTANCE_FACTOR = 0.75
+REMAKE_DISTANCE_FACTOR = 2
+GAME_CONSTANTS_CACHE_SIZE = 4
+
+
+def make_game_constants(game: Game):
+    max_car_size = max(game.car_width, game.car_height)
+    return GameConstants(
+        tile_size=game.track_tile_size,
+        tile_margin=game.track_tile_margin,
+        min_car_size=min(game.car_width, game.car_height),
+        max_car_size=max_car_size,
+        path_shift=(game.track_tile_size / 2 - game.track_tile_margin -
+                    max_car_size / 2),
+        take_next_distance=TAKE_NEXT_DISTANCE_FACTOR * game.track_tile_size,
+        remake_distance=REMAKE_DISTANCE_FACTOR * game.track_tile_size,
+        washer_range=game.washer_initial_speed * WASHER_RANGE_TICKS,
+        tire_range=game.tire_initial_speed * TIRE_RANGE_TICKS,
+    )
+
+
+
+@lru_cache(maxsize=GAME_CONSTANTS_CACHE_SIZE)
+def get_game_constants(game: Game):
+    return make_game_constants(game)
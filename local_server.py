@@ -0,0 +1,171 @@
+from argparse import ArgumentParser
+from os import unlink
+from random import Random
+from socket import socket, AF_UNIX
+from time import perf_counter
+from RemoteProcessClient import RemoteProcessClient
+from model.PlayerContext import PlayerContext
+from protocol_transport import set_no_delay
+from protocol_scenario import generate_game, generate_world
+
+
+class ServerConnection(RemoteProcessClient):
+    def __init__(self, connection, decode_mode=None):
+        RemoteProcessClient.__init__(self, None, None, decode_mode,
+                                     transport=set_no_delay(connection))
+
+    def read_token_message(self):
+        message_type = self.read_enum(RemoteProcessClient.MessageType)
+        self.ensure_message_type(
+            message_type, RemoteProcessClient.MessageType.AUTHENTICATION_TOKEN)
+        return self.read_string()
+
+    def write_team_size_message(self, team_size):
+        self.write_enum(RemoteProcessClient.MessageType.TEAM_SIZE)
+        self.write_int(team_size)
+        self.flush()
+
+    def read_protocol_version_message(self):
+        message_type = self.read_enum(RemoteProcessClient.MessageType)
+        self.ensure_message_type(
+            message_type, RemoteProcessClient.MessageType.PROTOCOL_VERSION)
+        return self.read_int()
+
+    def write_game_context_message(self, game):
+        self.write_enum(RemoteProcessClient.MessageType.GAME_CONTEXT)
+        self.write_game(game)
+        self.flush()
+
+    def write_player_context_message(self, player_context):
+        self.write_enum(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+        self.write_player_context(player_context)
+        self.flush()
+
+    def read_moves_message(self):
+        message_type = self.read_enum(RemoteProcessClient.MessageType)
+        self.ensure_message_type(message_type,
+                                 RemoteProcessClient.MessageType.MOVE)
+        return self.read_moves()
+
+    def write_game_over_message(self):
+        self.write_enum(RemoteProcessClient.MessageType.GAME_OVER)
+        self.flush()
+
+
+class Session:
+    def __init__(self, team_size, game, player_contexts):
+        self.team_size = team_size
+        self.game = game
+        self.player_contexts = player_contexts
+
+
+def generate_session(seed, ticks, team_size=2):
+    random = Random(seed)
+
+    def player_contexts():
+        for tick in range(ticks):
+            world = generate_world(random, tick=tick, team_size=team_size,
+                                   projectiles_count=random.randint(0, 4),
+                                   bonuses_count=random.randint(0, 8),
+                                   oil_slicks_count=random.randint(0, 2))
+            yield PlayerContext(world.cars[:team_size], world)
+
+    return Session(team_size, generate_game(random), player_contexts())
+
+
+def replay_session(path):
+    from ReplayProcessClient import ReplayProcessClient
+
+    client = ReplayProcessClient(path)
+    client.write_token_message('0000000000000000')
+    team_size = client.read_team_size_message()
+    client.write_protocol_version_message()
+    game = client.read_game_context_message()
+
+    def player_contexts():
+        try:
+            while True:
+                player_context = client.read_player_context_message()
+                if player_context is None:
+                    break
+                yield player_context
+        finally:
+            client.close()
+
+    return Session(team_size, game, player_contexts())
+
+
+def serve(connection, session):
+    server_connection = ServerConnection(connection)
+    latencies = []
+    truncated = False
+    try:
+        server_connection.read_token_message()
+        server_connection.write_team_size_message(session.team_size)
+        server_connection.read_protocol_version_message()
+        server_connection.write_game_context_message(session.game)
+        for player_context in session.player_contexts:
+            start = perf_counter()
+            server_connection.write_player_context_message(player_context)
+            server_connection.read_moves_message()
+            latencies.append(perf_counter() - start)
+        server_connection.write_game_over_message()
+    except IOError:
+        truncated = True
+    finally:
+        server_connection.close()
+    return latencies, truncated
+
+
+def main():
+    args = parse_args()
+    if args.unix is not None:
+        listener = socket(AF_UNIX)
+        listener.bind(args.unix)
+    else:
+        listener = socket()
+        listener.bind((args.host, args.port))
+    listener.listen(1)
+    try:
+        for game_index in range(args.games):
+            if args.replay is not None:
+                session = replay_session(args.replay)
+            else:
+                session = generate_session(args.seed + game_index, args.ticks,
+                                           args.team_size)
+            connection, _ = listener.accept()
+            print_latencies(*serve(connection, session))
+    finally:
+        listener.close()
+        if args.unix is not None:
+            unlink(args.unix)
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=31001)
+    parser.add_argument('--unix', default=None)
+    parser.add_argument('--games', type=int, default=1)
+    parser.add_argument('--ticks', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--team-size', type=int, default=2)
+    parser.add_argument('--replay', default=None)
+    return parser.parse_args()
+
+
+def print_latencies(latencies, truncated=False):
+    status = 'truncated' if truncated else 'finished'
+    if not latencies:
+        print(status, 'ticks: 0')
+        return
+    ordered = sorted(latencies)
+    print(status, 'ticks:', ordered.__len__(),
+          'mean: %.3f ms' % (1000 * sum(ordered) / ordered.__len__()),
+          'p50: %.3f ms' % (1000 * ordered[ordered.__len__() // 2]),
+          'p99: %.3f ms' % (1000 * ordered[ordered.__len__() * 99 // 100]),
+          'max: %.3f ms' % (1000 * ordered[-1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,8 @@ from model.RectangularUnit import RectangularUnit
 
 
 class Bonus(RectangularUnit):
+    __slots__ = ("type",)
+
     def __init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, width, height, type: (None, BonusType)):
         RectangularUnit.__init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, width, height)
 
@@ -4,6 +4,13 @@ from model.RectangularUnit import RectangularUnit
 
 
 class Car(RectangularUnit):
+    __slots__ = (
+        "player_id", "teammate_index", "teammate", "type", "projectile_count", "nitro_charge_count",
+        "oil_canister_count", "remaining_projectile_cooldown_ticks", "remaining_nitro_cooldown_ticks",
+        "remaining_oil_cooldown_ticks", "remaining_nitro_ticks", "remaining_oiled_ticks", "durability", "engine_power",
+        "wheel_turn", "next_waypoint_index", "next_waypoint_x", "next_waypoint_y", "finished_track"
+    )
+
     def __init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, width, height, player_id, teammate_index,
                  teammate, type: (None, CarType), projectile_count, nitro_charge_count, oil_canister_count,
                  remaining_projectile_cooldown_ticks, remaining_nitro_cooldown_ticks, remaining_oil_cooldown_ticks,
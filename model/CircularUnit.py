@@ -3,6 +3,8 @@ from model.Unit import Unit
 
 
 class CircularUnit(Unit):
+    __slots__ = ("radius",)
+
     def __init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, radius):
         Unit.__init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed)
 
@@ -2,6 +2,22 @@ from math import *
 
 
 class Game:
+    __slots__ = (
+        "random_seed", "tick_count", "world_width", "world_height", "track_tile_size", "track_tile_margin", "lap_count",
+        "lap_tick_count", "initial_freeze_duration_ticks", "burning_time_duration_factor", "finish_track_scores",
+        "finish_lap_score", "lap_waypoints_summary_score_factor", "car_damage_score_factor", "car_elimination_score",
+        "car_width", "car_height", "car_engine_power_change_per_tick", "car_wheel_turn_change_per_tick",
+        "car_angular_speed_factor", "car_movement_air_friction_factor", "car_rotation_air_friction_factor",
+        "car_lengthwise_movement_friction_factor", "car_crosswise_movement_friction_factor",
+        "car_rotation_friction_factor", "throw_projectile_cooldown_ticks", "use_nitro_cooldown_ticks",
+        "spill_oil_cooldown_ticks", "nitro_engine_power_factor", "nitro_duration_ticks", "car_reactivation_time_ticks",
+        "buggy_mass", "buggy_engine_forward_power", "buggy_engine_rear_power", "jeep_mass", "jeep_engine_forward_power",
+        "jeep_engine_rear_power", "bonus_size", "bonus_mass", "pure_score_amount", "washer_radius", "washer_mass",
+        "washer_initial_speed", "washer_damage", "side_washer_angle", "tire_radius", "tire_mass", "tire_initial_speed",
+        "tire_damage_factor", "tire_disappear_speed_factor", "oil_slick_initial_range", "oil_slick_radius",
+        "oil_slick_lifetime", "max_oiled_state_duration_ticks"
+    )
+
     def __init__(self, random_seed, tick_count, world_width, world_height, track_tile_size, track_tile_margin,
                  lap_count, lap_tick_count, initial_freeze_duration_ticks, burning_time_duration_factor,
                  finish_track_scores, finish_lap_score, lap_waypoints_summary_score_factor, car_damage_score_factor,
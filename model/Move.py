@@ -2,6 +2,8 @@ from math import *
 
 
 class Move:
+    __slots__ = ("engine_power", "brake", "wheel_turn", "throw_projectile", "use_nitro", "spill_oil")
+
     def __init__(self):
         self.engine_power = 0.0
         self.brake = False
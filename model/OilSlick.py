@@ -3,6 +3,8 @@ from model.CircularUnit import CircularUnit
 
 
 class OilSlick(CircularUnit):
+    __slots__ = ("remaining_lifetime",)
+
     def __init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, radius, remaining_lifetime):
         CircularUnit.__init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, radius)
 
@@ -2,6 +2,8 @@ from math import *
 
 
 class Player:
+    __slots__ = ("id", "me", "name", "strategy_crashed", "score")
+
     def __init__(self, id, me, name, strategy_crashed, score):
         self.id = id
         self.me = me
@@ -4,6 +4,8 @@ from model.World import World
 
 
 class PlayerContext:
+    __slots__ = ("cars", "world")
+
     def __init__(self, cars, world: (None, World)):
         self.cars = cars
         self.world = world
\ No newline at end of file
@@ -4,6 +4,8 @@ from model.ProjectileType import ProjectileType
 
 
 class Projectile(CircularUnit):
+    __slots__ = ("car_id", "player_id", "type")
+
     def __init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, radius, car_id, player_id,
                  type: (None, ProjectileType)):
         CircularUnit.__init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, radius)
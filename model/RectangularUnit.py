@@ -3,6 +3,8 @@ from model.Unit import Unit
 
 
 class RectangularUnit(Unit):
+    __slots__ = ("width", "height")
+
     def __init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed, width, height):
         Unit.__init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed)
 
@@ -2,6 +2,8 @@ from math import *
 
 
 class Unit:
+    __slots__ = ("id", "mass", "x", "y", "speed_x", "speed_y", "angle", "angular_speed")
+
     def __init__(self, id, mass, x, y, speed_x, speed_y, angle, angular_speed):
         self.id = id
         self.mass = mass
@@ -8,9 +8,61 @@ from model.Projectile import Projectile
 from model.TileType import TileType
 
 
+def make_players_by_id(players):
+    return {player.id: player for player in players or () if player is not None}
+
+
+def make_cars_by_id(cars):
+    return {car.id: car for car in cars or () if car is not None}
+
+
+def make_teammate_cars(cars):
+    return [car for car in cars or () if car is not None and car.teammate]
+
+
+def make_opponent_cars(cars):
+    return [car for car in cars or () if car is not None and not car.teammate]
+
+
+def make_moving_cars(cars):
+    return [car for car in cars or () if car is not None and (car.speed_x != 0 or car.speed_y != 0)]
+
+
+class Index:
+    def __init__(self, name, section, make):
+        self.name = name
+        self.section = section
+        self.make = make
+
+    def __get__(self, world, owner):
+        if world is None:
+            return self
+
+        indices = world.indices
+        result = indices.get(self.name)
+
+        if result is None:
+            result = indices[self.name] = self.make(getattr(world, self.section))
+
+        return result
+
+
 class World:
+    __slots__ = (
+        "tick", "tick_count", "last_tick_index", "width", "height", "players", "cars", "projectiles", "bonuses",
+        "oil_slicks", "map_name", "tiles_x_y", "waypoints", "starting_direction", "tiles_version", "changed_tiles",
+        "arrays", "indices"
+    )
+
+    players_by_id = Index("players_by_id", "players", make_players_by_id)
+    cars_by_id = Index("cars_by_id", "cars", make_cars_by_id)
+    teammate_cars = Index("teammate_cars", "cars", make_teammate_cars)
+    opponent_cars = Index("opponent_cars", "cars", make_opponent_cars)
+    moving_cars = Index("moving_cars", "cars", make_moving_cars)
+
     def __init__(self, tick, tick_count, last_tick_index, width, height, players, cars, projectiles, bonuses,
-                 oil_slicks, map_name, tiles_x_y, waypoints, starting_direction: (None, Direction)):
+                 oil_slicks, map_name, tiles_x_y, waypoints, starting_direction: (None, Direction), tiles_version=0,
+                 changed_tiles=frozenset(), arrays=None):
         self.tick = tick
         self.tick_count = tick_count
         self.last_tick_index = last_tick_index
@@ -25,10 +77,14 @@ class World:
         self.tiles_x_y = tiles_x_y
         self.waypoints = waypoints
         self.starting_direction = starting_direction
+        self.tiles_version = tiles_version
+        self.changed_tiles = changed_tiles
+        self.arrays = arrays
+        self.indices = {}
 
     def get_my_player(self):
         for player in self.players:
             if player.me:
                 return player
 
-        return None
\ No newline at end of file
+        return None
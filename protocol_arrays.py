@@ -0,0 +1,95 @@
+from collections import namedtuple
+from numpy import dtype, empty, frombuffer
+import protocol_codec
+
+NUMPY_CODES = {'b': 'i1', 'i': 'i4', 'q': 'i8', 'd': 'f8'}
+
+
+def make_dtype(fields, present=False):
+    byte_order = protocol_codec.BYTE_ORDER_FORMAT_STRING
+    result = [(name, byte_order + NUMPY_CODES[code]) for name, code in fields]
+    if present:
+        result.insert(0, ('present', 'i1'))
+    return dtype(result)
+
+
+class EntityArrays:
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, fields, record_struct, make):
+        self.dtype = make_dtype(fields)
+        self.record_dtype = make_dtype(fields, present=True)
+        self.record_struct = record_struct
+        self.make = make
+        self.__data = empty(EntityArrays.INITIAL_CAPACITY, dtype=self.dtype)
+        self.count = 0
+
+    @property
+    def values(self):
+        return self.__data[:self.count]
+
+    def reserve(self, count):
+        if count > self.__data.__len__():
+            self.__data = empty(max(count, 2 * self.__data.__len__()), dtype=self.dtype)
+
+    def assign_records(self, buffer, offset, count):
+        self.reserve(count)
+        records = frombuffer(buffer, dtype=self.record_dtype, count=count, offset=offset)
+        for name in self.dtype.names:
+            self.__data[name][:count] = records[name]
+        self.count = count
+
+    def assign_values(self, values):
+        self.reserve(values.__len__())
+        for index, row in enumerate(values):
+            self.__data[index] = row
+        self.count = values.__len__()
+
+
+class WorldArrays:
+    def __init__(self):
+        self.cars = EntityArrays(protocol_codec.CAR_FIELDS, protocol_codec.CAR, protocol_codec.make_car)
+        self.projectiles = EntityArrays(protocol_codec.PROJECTILE_FIELDS, protocol_codec.PROJECTILE,
+                                        protocol_codec.make_projectile)
+        self.bonuses = EntityArrays(protocol_codec.BONUS_FIELDS, protocol_codec.BONUS, protocol_codec.make_bonus)
+        self.oil_slicks = EntityArrays(protocol_codec.OIL_SLICK_FIELDS, protocol_codec.OIL_SLICK,
+                                       protocol_codec.make_oil_slick)
+
+
+WorldValues = namedtuple('WorldValues', ('cars', 'projectiles', 'bonuses', 'oil_slicks'))
+
+
+class EntityList:
+    def __init__(self, values, make, slots=None):
+        self.__values = values
+        self.__make = make
+        self.__slots = slots
+        self.__objects = [None] * (values.__len__() if slots is None else slots.__len__())
+
+    @property
+    def values(self):
+        return self.__values
+
+    @property
+    def count(self):
+        return self.__values.__len__()
+
+    def __len__(self):
+        return self.__objects.__len__()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.__objects.__len__()))]
+        result = self.__objects[index]
+        if result is None:
+            slot = index if self.__slots is None else self.__slots[index]
+            if slot is not None:
+                result = self.__objects[index] = self.__make(self.__values[slot].item())
+        return result
+
+    def __iter__(self):
+        for index in range(self.__objects.__len__()):
+            yield self[index]
+
+    def __repr__(self):
+        return 'EntityList({values})'.format(values=repr(list(self)))
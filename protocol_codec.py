@@ -0,0 +1,234 @@
+from struct import Struct
+from model.Bonus import Bonus
+from model.BonusType import BonusType
+from model.Car import Car
+from model.CarType import CarType
+from model.Game import Game
+from model.Move import Move
+from model.OilSlick import OilSlick
+from model.Player import Player
+from model.Projectile import Projectile
+from model.ProjectileType import ProjectileType
+
+LITTLE_ENDIAN_BYTE_ORDER = True
+
+BYTE_ORDER_FORMAT_STRING = "<" if LITTLE_ENDIAN_BYTE_ORDER else ">"
+
+
+def make_struct(format_string):
+    return Struct(BYTE_ORDER_FORMAT_STRING + format_string)
+
+
+SIGNED_BYTE = make_struct('b')
+INTEGER = make_struct('i')
+LONG = make_struct('q')
+DOUBLE = make_struct('d')
+
+
+def make_record_struct(fields):
+    return make_struct(''.join(code for _, code in fields))
+
+
+UNIT_FIELDS = (
+    ('id', 'q'), ('mass', 'd'), ('x', 'd'), ('y', 'd'), ('speed_x', 'd'), ('speed_y', 'd'), ('angle', 'd'),
+    ('angular_speed', 'd'),
+)
+BONUS_FIELDS = UNIT_FIELDS + (('width', 'd'), ('height', 'd'), ('type', 'b'))
+CAR_FIELDS = UNIT_FIELDS + (
+    ('width', 'd'), ('height', 'd'), ('player_id', 'q'), ('teammate_index', 'i'), ('teammate', 'b'), ('type', 'b'),
+    ('projectile_count', 'i'), ('nitro_charge_count', 'i'), ('oil_canister_count', 'i'),
+    ('remaining_projectile_cooldown_ticks', 'i'), ('remaining_nitro_cooldown_ticks', 'i'),
+    ('remaining_oil_cooldown_ticks', 'i'), ('remaining_nitro_ticks', 'i'), ('remaining_oiled_ticks', 'i'),
+    ('durability', 'd'), ('engine_power', 'd'), ('wheel_turn', 'd'), ('next_waypoint_index', 'i'),
+    ('next_waypoint_x', 'i'), ('next_waypoint_y', 'i'), ('finished_track', 'b'),
+)
+MOVE_FIELDS = (
+    ('engine_power', 'd'), ('brake', 'b'), ('wheel_turn', 'd'), ('throw_projectile', 'b'), ('use_nitro', 'b'),
+    ('spill_oil', 'b'),
+)
+OIL_SLICK_FIELDS = UNIT_FIELDS + (('radius', 'd'), ('remaining_lifetime', 'i'))
+PROJECTILE_FIELDS = UNIT_FIELDS + (('radius', 'd'), ('car_id', 'q'), ('player_id', 'q'), ('type', 'b'))
+
+BONUS = make_record_struct(BONUS_FIELDS)
+CAR = make_record_struct(CAR_FIELDS)
+GAME_HEAD = make_struct('q 3i 2d 3i d')
+GAME_TAIL = make_struct('i 2d i 10d 3i d 2i 8d i 12d 2i')
+MOVE = make_record_struct(MOVE_FIELDS)
+OIL_SLICK = make_record_struct(OIL_SLICK_FIELDS)
+PLAYER_HEAD = make_struct('q b')
+PLAYER_TAIL = make_struct('b i')
+PROJECTILE = make_record_struct(PROJECTILE_FIELDS)
+WORLD_HEAD = make_struct('5i')
+
+
+ENUM_TABLES = {}
+
+
+def get_enum_table(enum_class):
+    table = ENUM_TABLES.get(enum_class)
+
+    if table is None:
+        values = [None] * 256
+
+        for enum_key, enum_value in enum_class.__dict__.items():
+            if not str(enum_key).startswith("__") and isinstance(enum_value, int) and -128 <= enum_value < 128:
+                values[enum_value & 0xFF] = enum_value
+
+        table = ENUM_TABLES[enum_class] = tuple(values)
+
+    return table
+
+
+def make_enum(enum_class, value):
+    return get_enum_table(enum_class)[value & 0xFF]
+
+
+def make_enums(enum_class, byte_array):
+    return list(map(get_enum_table(enum_class).__getitem__, byte_array))
+
+
+def make_bonus(values):
+    return update_bonus(Bonus.__new__(Bonus), values)
+
+
+def make_car(values):
+    return update_car(Car.__new__(Car), values)
+
+
+def make_game(head, finish_track_scores, tail):
+    return Game(*head, finish_track_scores, *tail)
+
+
+def make_move(values):
+    return update_move(Move.__new__(Move), values)
+
+
+def make_oil_slick(values):
+    return update_oil_slick(OilSlick.__new__(OilSlick), values)
+
+
+def make_player(values):
+    return update_player(Player.__new__(Player), values)
+
+
+def make_projectile(values):
+    return update_projectile(Projectile.__new__(Projectile), values)
+
+
+def update_bonus(bonus, values):
+    bonus.__init__(*values[:10], make_enum(BonusType, values[10]))
+    return bonus
+
+
+def update_car(car, values):
+    car.__init__(*values[:12], values[12] != 0, make_enum(CarType, values[13]), *values[14:28], values[28] != 0)
+    return car
+
+
+def update_move(move, values):
+    move.engine_power = values[0]
+    move.brake = values[1] != 0
+    move.wheel_turn = values[2]
+    move.throw_projectile = values[3] != 0
+    move.use_nitro = values[4] != 0
+    move.spill_oil = values[5] != 0
+
+    return move
+
+
+def update_oil_slick(oil_slick, values):
+    oil_slick.__init__(*values)
+    return oil_slick
+
+
+def update_player(player, values):
+    player.__init__(values[0], values[1] != 0, values[2], values[3] != 0, values[4])
+    return player
+
+
+def update_projectile(projectile, values):
+    projectile.__init__(*values[:11], make_enum(ProjectileType, values[11]))
+    return projectile
+
+
+def enum_value(value):
+    return -1 if value is None else value
+
+
+def pack_bonus(bonus):
+    return BONUS.pack(
+        bonus.id, bonus.mass, bonus.x, bonus.y, bonus.speed_x, bonus.speed_y, bonus.angle, bonus.angular_speed,
+        bonus.width, bonus.height, enum_value(bonus.type)
+    )
+
+
+def pack_car(car):
+    return CAR.pack(
+        car.id, car.mass, car.x, car.y, car.speed_x, car.speed_y, car.angle, car.angular_speed, car.width,
+        car.height, car.player_id, car.teammate_index, 1 if car.teammate else 0, enum_value(car.type),
+        car.projectile_count, car.nitro_charge_count, car.oil_canister_count,
+        car.remaining_projectile_cooldown_ticks, car.remaining_nitro_cooldown_ticks,
+        car.remaining_oil_cooldown_ticks, car.remaining_nitro_ticks, car.remaining_oiled_ticks, car.durability,
+        car.engine_power, car.wheel_turn, car.next_waypoint_index, car.next_waypoint_x, car.next_waypoint_y,
+        1 if car.finished_track else 0
+    )
+
+
+def pack_game_head(game):
+    return GAME_HEAD.pack(
+        game.random_seed, game.tick_count, game.world_width, game.world_height, game.track_tile_size,
+        game.track_tile_margin, game.lap_count, game.lap_tick_count, game.initial_freeze_duration_ticks,
+        game.burning_time_duration_factor
+    )
+
+
+def pack_game_tail(game):
+    return GAME_TAIL.pack(
+        game.finish_lap_score, game.lap_waypoints_summary_score_factor, game.car_damage_score_factor,
+        game.car_elimination_score, game.car_width, game.car_height, game.car_engine_power_change_per_tick,
+        game.car_wheel_turn_change_per_tick, game.car_angular_speed_factor, game.car_movement_air_friction_factor,
+        game.car_rotation_air_friction_factor, game.car_lengthwise_movement_friction_factor,
+        game.car_crosswise_movement_friction_factor, game.car_rotation_friction_factor,
+        game.throw_projectile_cooldown_ticks, game.use_nitro_cooldown_ticks, game.spill_oil_cooldown_ticks,
+        game.nitro_engine_power_factor, game.nitro_duration_ticks, game.car_reactivation_time_ticks,
+        game.buggy_mass, game.buggy_engine_forward_power, game.buggy_engine_rear_power, game.jeep_mass,
+        game.jeep_engine_forward_power, game.jeep_engine_rear_power, game.bonus_size, game.bonus_mass,
+        game.pure_score_amount, game.washer_radius, game.washer_mass, game.washer_initial_speed,
+        game.washer_damage, game.side_washer_angle, game.tire_radius, game.tire_mass, game.tire_initial_speed,
+        game.tire_damage_factor, game.tire_disappear_speed_factor, game.oil_slick_initial_range,
+        game.oil_slick_radius, game.oil_slick_lifetime, game.max_oiled_state_duration_ticks
+    )
+
+
+def pack_move(move):
+    return MOVE.pack(
+        move.engine_power, 1 if move.brake else 0, move.wheel_turn, 1 if move.throw_projectile else 0,
+        1 if move.use_nitro else 0, 1 if move.spill_oil else 0
+    )
+
+
+def pack_oil_slick(oil_slick):
+    return OIL_SLICK.pack(
+        oil_slick.id, oil_slick.mass, oil_slick.x, oil_slick.y, oil_slick.speed_x, oil_slick.speed_y,
+        oil_slick.angle, oil_slick.angular_speed, oil_slick.radius, oil_slick.remaining_lifetime
+    )
+
+
+def pack_projectile(projectile):
+    return PROJECTILE.pack(
+        projectile.id, projectile.mass, projectile.x, projectile.y, projectile.speed_x, projectile.speed_y,
+        projectile.angle, projectile.angular_speed, projectile.radius, projectile.car_id, projectile.player_id,
+        enum_value(projectile.type)
+    )
+
+
+def pack_world_head(world):
+    return WORLD_HEAD.pack(world.tick, world.tick_count, world.last_tick_index, world.width, world.height)
+
+
+def pack_enums(enums):
+    return make_struct(str(enums.__len__()) + 'b').pack(*map(enum_value, enums))
+
+
+def pack_ints(ints):
+    return make_struct(str(ints.__len__()) + 'i').pack(*ints)
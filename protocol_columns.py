@@ -0,0 +1,166 @@
+import mmap
+from argparse import ArgumentParser
+from zlib import compress, decompress
+from numpy import array, concatenate, dtype, empty, frombuffer, fromfile, full, searchsorted, zeros
+import protocol_codec
+from protocol_arrays import make_dtype
+
+KINDS = (
+    ('cars', protocol_codec.CAR_FIELDS),
+    ('projectiles', protocol_codec.PROJECTILE_FIELDS),
+    ('bonuses', protocol_codec.BONUS_FIELDS),
+    ('oil_slicks', protocol_codec.OIL_SLICK_FIELDS),
+)
+
+DTYPES = {kind: make_dtype(fields) for kind, fields in KINDS}
+
+BLOCK_HEAD = protocol_codec.make_struct(str(KINDS.__len__()) + 'i')
+
+INDEX_DTYPE = dtype([
+    ('tick', protocol_codec.BYTE_ORDER_FORMAT_STRING + 'i4'),
+    ('offset', protocol_codec.BYTE_ORDER_FORMAT_STRING + 'i8'),
+    ('length', protocol_codec.BYTE_ORDER_FORMAT_STRING + 'i4'),
+])
+
+
+def make_values(kind, entities):
+    names = DTYPES[kind].names
+    present = [entity for entity in entities or () if entity is not None]
+    return array([tuple(protocol_codec.enum_value(getattr(entity, name)) for name in names) for entity in present],
+                 dtype=DTYPES[kind])
+
+
+class ColumnWriter:
+    def __init__(self, path, level=6):
+        self.__data = open(path + '.columns', 'wb')
+        self.__index = open(path + '.ticks', 'wb')
+        self.__offset = 0
+        self.__level = level
+
+    def write_world(self, world):
+        if world.arrays is not None:
+            self.write_tick(world.tick, {kind: getattr(world.arrays, kind).values for kind, _ in KINDS})
+        else:
+            self.write_tick(world.tick, {kind: make_values(kind, getattr(world, kind)) for kind, _ in KINDS})
+
+    def write_tick(self, tick, values):
+        parts = [BLOCK_HEAD.pack(*(values[kind].__len__() for kind, _ in KINDS))]
+
+        for kind, fields in KINDS:
+            for name, _ in fields:
+                parts.append(values[kind][name].astype(DTYPES[kind][name], copy=False).tobytes())
+
+        block = compress(b''.join(parts), self.__level)
+        self.__data.write(block)
+        entry = array([(tick, self.__offset, block.__len__())], dtype=INDEX_DTYPE)
+        self.__index.write(entry.tobytes())
+        self.__offset += block.__len__()
+
+    def close(self):
+        self.__data.close()
+        self.__index.close()
+
+
+class ColumnReader:
+    def __init__(self, path):
+        self.__file = open(path + '.columns', 'rb')
+        self.__data = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = fromfile(path + '.ticks', dtype=INDEX_DTYPE)
+        self.ticks = self.index['tick']
+
+    def __len__(self):
+        return self.index.__len__()
+
+    def find(self, tick):
+        position = tick - int(self.ticks[0])
+
+        if position < 0 or position >= self.ticks.__len__() or self.ticks[position] != tick:
+            position = int(searchsorted(self.ticks, tick))
+
+            if position >= self.ticks.__len__() or self.ticks[position] != tick:
+                raise KeyError(tick)
+
+        return position
+
+    def read_tick(self, tick):
+        return self.read_block(self.find(tick))
+
+    def read_block(self, position, kinds=None, names=None):
+        _, offset, length = self.index[position]
+        block = decompress(self.__data[offset:offset + length])
+        counts = BLOCK_HEAD.unpack_from(block)
+        begin = BLOCK_HEAD.size
+        result = {}
+
+        for (kind, fields), count in zip(KINDS, counts):
+            if kinds is not None and kind not in kinds:
+                begin += count * DTYPES[kind].itemsize
+                continue
+
+            values = result[kind] = zeros(count, dtype=DTYPES[kind])
+
+            for name, _ in fields:
+                field_dtype = DTYPES[kind][name]
+
+                if names is None or name in names:
+                    values[name] = frombuffer(block, dtype=field_dtype, count=count, offset=begin)
+
+                begin += count * field_dtype.itemsize
+
+        return result
+
+    def read_column(self, kind, name):
+        ticks = []
+        ids = []
+        values = []
+
+        for position in range(self.index.__len__()):
+            block = self.read_block(position, (kind,), ('id', name))[kind]
+            ticks.append(full(block.__len__(), self.ticks[position], dtype=self.ticks.dtype))
+            ids.append(block['id'])
+            values.append(block[name])
+
+        if not values:
+            return (empty(0, dtype=self.ticks.dtype), empty(0, dtype=DTYPES[kind]['id']),
+                    empty(0, dtype=DTYPES[kind][name]))
+
+        return concatenate(ticks), concatenate(ids), concatenate(values)
+
+    def close(self):
+        self.__data.close()
+        self.__file.close()
+
+
+def convert(raw_path, path):
+    from RemoteProcessClient import RemoteProcessClient
+    from ReplayProcessClient import ReplayProcessClient
+
+    client = ReplayProcessClient(raw_path, RemoteProcessClient.DecodeMode.ARRAYS)
+    writer = ColumnWriter(path)
+
+    try:
+        client.write_token_message('0000000000000000')
+        client.read_team_size_message()
+        client.write_protocol_version_message()
+        client.read_game_context_message()
+
+        while True:
+            player_context = client.read_player_context_message()
+            if player_context is None:
+                break
+            writer.write_world(player_context.world)
+    finally:
+        writer.close()
+        client.close()
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('raw_path')
+    parser.add_argument('path')
+    args = parser.parse_args()
+    convert(args.raw_path, args.path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+import protocol_codec
+from model.World import World
+
+
+class SectionReader:
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+
+    def read_struct(self, record_struct):
+        values = record_struct.unpack_from(self.data, self.offset)
+        self.offset += record_struct.size
+
+        return values
+
+    def read_string(self):
+        length = self.read_struct(protocol_codec.INTEGER)[0]
+        if length == -1:
+            return None
+
+        begin = self.offset
+        self.offset += length
+
+        return self.data[begin:self.offset].decode()
+
+
+def read_records(reader, record_struct, make):
+    count = reader.read_struct(protocol_codec.INTEGER)[0]
+    if count < 0:
+        return None
+
+    records = []
+
+    for _ in range(count):
+        if reader.read_struct(protocol_codec.SIGNED_BYTE)[0] != 0:
+            records.append(make(reader.read_struct(record_struct)))
+        else:
+            records.append(None)
+
+    return records
+
+
+def read_player(reader):
+    player_id, me = reader.read_struct(protocol_codec.PLAYER_HEAD)
+    name = reader.read_string()
+    return protocol_codec.make_player((player_id, me, name) + reader.read_struct(protocol_codec.PLAYER_TAIL))
+
+
+def read_players(reader):
+    count = reader.read_struct(protocol_codec.INTEGER)[0]
+    if count < 0:
+        return None
+
+    players = []
+
+    for _ in range(count):
+        if reader.read_struct(protocol_codec.SIGNED_BYTE)[0] != 0:
+            players.append(read_player(reader))
+        else:
+            players.append(None)
+
+    return players
+
+
+SECTION_READERS = {
+    'players': read_players,
+    'cars': lambda reader: read_records(reader, protocol_codec.CAR, protocol_codec.make_car),
+    'projectiles': lambda reader: read_records(reader, protocol_codec.PROJECTILE, protocol_codec.make_projectile),
+    'bonuses': lambda reader: read_records(reader, protocol_codec.BONUS, protocol_codec.make_bonus),
+    'oil_slicks': lambda reader: read_records(reader, protocol_codec.OIL_SLICK, protocol_codec.make_oil_slick),
+}
+
+
+class LazySection:
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, world, owner):
+        if world is None:
+            return self
+
+        values = world.section_values
+
+        if self.name not in values:
+            values[self.name] = SECTION_READERS[self.name](SectionReader(world.sections.pop(self.name)))
+
+        return values[self.name]
+
+    def __set__(self, world, value):
+        world.sections.pop(self.name, None)
+        world.section_values[self.name] = value
+
+
+class LazyWorld(World):
+    __slots__ = ('sections', 'section_values')
+
+    players = LazySection('players')
+    cars = LazySection('cars')
+    projectiles = LazySection('projectiles')
+    bonuses = LazySection('bonuses')
+    oil_slicks = LazySection('oil_slicks')
+
+    def __init__(self, tick, tick_count, last_tick_index, width, height, sections, map_name, tiles_x_y, waypoints,
+                 starting_direction, tiles_version=0, changed_tiles=frozenset()):
+        self.sections = {}
+        self.section_values = {}
+        World.__init__(self, tick, tick_count, last_tick_index, width, height, None, None, None, None, None,
+                       map_name, tiles_x_y, waypoints, starting_direction, tiles_version, changed_tiles)
+        self.section_values.clear()
+        self.sections = sections
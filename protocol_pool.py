@@ -0,0 +1,77 @@
+import protocol_codec
+
+
+class EntityPool:
+    def __init__(self, make, update):
+        self.make = make
+        self.update = update
+        self.objects = {}
+        self.__previous = {}
+        self.allocated = 0
+        self.reused = 0
+        self.released = 0
+
+    def begin(self):
+        self.__previous = self.objects
+        self.objects = {}
+        self.allocated = 0
+        self.reused = 0
+        self.released = 0
+
+    def get(self, values):
+        result = self.objects.get(values[0])
+
+        if result is None:
+            result = self.__previous.pop(values[0], None)
+
+            if result is None:
+                result = self.make(values)
+                self.allocated += 1
+            else:
+                self.update(result, values)
+                self.reused += 1
+
+            self.objects[values[0]] = result
+        else:
+            self.update(result, values)
+
+        return result
+
+    def end(self):
+        self.released = self.__previous.__len__()
+        self.__previous = {}
+
+
+class WorldPool:
+    def __init__(self):
+        self.players = EntityPool(protocol_codec.make_player, protocol_codec.update_player)
+        self.cars = EntityPool(protocol_codec.make_car, protocol_codec.update_car)
+        self.projectiles = EntityPool(protocol_codec.make_projectile, protocol_codec.update_projectile)
+        self.bonuses = EntityPool(protocol_codec.make_bonus, protocol_codec.update_bonus)
+        self.oil_slicks = EntityPool(protocol_codec.make_oil_slick, protocol_codec.update_oil_slick)
+        self.world = None
+        self.player_context = None
+
+    @property
+    def entity_pools(self):
+        return self.players, self.cars, self.projectiles, self.bonuses, self.oil_slicks
+
+    @property
+    def allocated(self):
+        return sum(pool.allocated for pool in self.entity_pools)
+
+    @property
+    def reused(self):
+        return sum(pool.reused for pool in self.entity_pools)
+
+    @property
+    def released(self):
+        return sum(pool.released for pool in self.entity_pools)
+
+    def begin(self):
+        for pool in self.entity_pools:
+            pool.begin()
+
+    def end(self):
+        for pool in self.entity_pools:
+            pool.end()
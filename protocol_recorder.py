@@ -0,0 +1,54 @@
+from queue import Queue
+from threading import Thread
+import protocol_codec
+
+RECEIVED = 0
+SENT = 1
+
+INDEX_ENTRY = protocol_codec.make_struct('b b q q')
+
+
+class Recorder:
+    def __init__(self, path):
+        self.path = path
+        self.__queue = Queue()
+        self.__sent_offset = 0
+        self.__thread = Thread(target=self.__run, name='recorder', daemon=True)
+        self.__thread.start()
+
+    def received(self, data):
+        self.__queue.put((RECEIVED, bytes(data)))
+
+    def sent(self, data):
+        if data:
+            end = self.__sent_offset + data.__len__()
+            self.__queue.put((SENT, bytes(data)))
+            self.__queue.put((None, INDEX_ENTRY.pack(SENT, data[0], self.__sent_offset, end)))
+            self.__sent_offset = end
+
+    def message_received(self, message_type, begin, end):
+        self.__queue.put((None, INDEX_ENTRY.pack(RECEIVED, message_type, begin, end)))
+
+    def close(self):
+        self.__queue.put(None)
+        self.__thread.join()
+
+    def __run(self):
+        with open(self.path + '.in', 'wb') as received, open(self.path + '.out', 'wb') as sent, \
+                open(self.path + '.index', 'wb') as index:
+            files = {RECEIVED: received, SENT: sent, None: index}
+
+            while True:
+                item = self.__queue.get()
+                if item is None:
+                    break
+
+                stream, data = item
+                files[stream].write(data)
+
+
+def read_index(path):
+    with open(path + '.index', 'rb') as index:
+        data = index.read()
+
+    return list(INDEX_ENTRY.iter_unpack(data))
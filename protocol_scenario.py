@@ -0,0 +1,127 @@
+from itertools import count
+from math import pi
+from random import Random
+from model.Bonus import Bonus
+from model.BonusType import BonusType
+from model.Car import Car
+from model.CarType import CarType
+from model.Direction import Direction
+from model.Game import Game
+from model.OilSlick import OilSlick
+from model.Player import Player
+from model.Projectile import Projectile
+from model.ProjectileType import ProjectileType
+from model.TileType import TileType
+from model.World import World
+
+TILE_SIZE = 800.0
+TILE_MARGIN = 80.0
+
+
+def generate_game(random: Random):
+    return Game(
+        random_seed=random.getrandbits(63), tick_count=20000, world_width=16, world_height=16,
+        track_tile_size=TILE_SIZE, track_tile_margin=TILE_MARGIN, lap_count=2, lap_tick_count=4000,
+        initial_freeze_duration_ticks=180, burning_time_duration_factor=0.5, finish_track_scores=[128, 32, 8, 2],
+        finish_lap_score=16, lap_waypoints_summary_score_factor=1.0, car_damage_score_factor=100.0,
+        car_elimination_score=20, car_width=210.0, car_height=140.0, car_engine_power_change_per_tick=0.025,
+        car_wheel_turn_change_per_tick=0.05, car_angular_speed_factor=0.0017453292519943296,
+        car_movement_air_friction_factor=0.0075, car_rotation_air_friction_factor=0.0075,
+        car_lengthwise_movement_friction_factor=0.001, car_crosswise_movement_friction_factor=0.25,
+        car_rotation_friction_factor=0.0017453292519943296, throw_projectile_cooldown_ticks=60,
+        use_nitro_cooldown_ticks=120, spill_oil_cooldown_ticks=120, nitro_engine_power_factor=2.0,
+        nitro_duration_ticks=120, car_reactivation_time_ticks=300, buggy_mass=1250.0,
+        buggy_engine_forward_power=312.5, buggy_engine_rear_power=234.375, jeep_mass=1500.0,
+        jeep_engine_forward_power=375.0, jeep_engine_rear_power=281.25, bonus_size=70.0, bonus_mass=100.0,
+        pure_score_amount=20, washer_radius=20.0, washer_mass=10.0, washer_initial_speed=60.0,
+        washer_damage=0.15, side_washer_angle=0.03490658503988659, tire_radius=70.0, tire_mass=1000.0,
+        tire_initial_speed=60.0, tire_damage_factor=0.35, tire_disappear_speed_factor=0.25,
+        oil_slick_initial_range=10.0, oil_slick_radius=150.0, oil_slick_lifetime=600,
+        max_oiled_state_duration_ticks=60,
+    )
+
+
+def generate_position(random: Random, world_size):
+    return (random.uniform(0, world_size * TILE_SIZE),
+            random.uniform(0, world_size * TILE_SIZE))
+
+
+def generate_car(random: Random, id, player_id, teammate_index, teammate, world_size=16):
+    x, y = generate_position(random, world_size)
+    return Car(
+        id=id, mass=1250.0, x=x, y=y, speed_x=random.uniform(-30, 30), speed_y=random.uniform(-30, 30),
+        angle=random.uniform(-pi, pi), angular_speed=random.uniform(-0.05, 0.05), width=210.0, height=140.0,
+        player_id=player_id, teammate_index=teammate_index, teammate=teammate,
+        type=random.choice((CarType.BUGGY, CarType.JEEP)), projectile_count=random.randint(0, 5),
+        nitro_charge_count=random.randint(0, 3), oil_canister_count=random.randint(0, 3),
+        remaining_projectile_cooldown_ticks=random.randint(0, 60), remaining_nitro_cooldown_ticks=0,
+        remaining_oil_cooldown_ticks=0, remaining_nitro_ticks=0, remaining_oiled_ticks=0,
+        durability=random.random(), engine_power=random.uniform(-1, 1), wheel_turn=random.uniform(-1, 1),
+        next_waypoint_index=random.randint(0, 10), next_waypoint_x=random.randint(0, world_size - 1),
+        next_waypoint_y=random.randint(0, world_size - 1), finished_track=False,
+    )
+
+
+def generate_bonus(random: Random, id, world_size=16):
+    x, y = generate_position(random, world_size)
+    return Bonus(
+        id=id, mass=100.0, x=x, y=y, speed_x=0.0, speed_y=0.0, angle=0.0, angular_speed=0.0, width=70.0,
+        height=70.0, type=random.choice((BonusType.REPAIR_KIT, BonusType.AMMO_CRATE, BonusType.NITRO_BOOST,
+                                         BonusType.OIL_CANISTER, BonusType.PURE_SCORE)),
+    )
+
+
+def generate_projectile(random: Random, id, car_id, player_id, world_size=16):
+    x, y = generate_position(random, world_size)
+    return Projectile(
+        id=id, mass=10.0, x=x, y=y, speed_x=random.uniform(-60, 60), speed_y=random.uniform(-60, 60),
+        angle=random.uniform(-pi, pi), angular_speed=0.0, radius=20.0, car_id=car_id, player_id=player_id,
+        type=random.choice((ProjectileType.WASHER, ProjectileType.TIRE)),
+    )
+
+
+def generate_oil_slick(random: Random, id, world_size=16):
+    x, y = generate_position(random, world_size)
+    return OilSlick(
+        id=id, mass=0.0, x=x, y=y, speed_x=0.0, speed_y=0.0, angle=0.0, angular_speed=0.0, radius=150.0,
+        remaining_lifetime=random.randint(0, 600),
+    )
+
+
+def generate_tiles(size):
+    tiles = [[TileType.EMPTY] * size for _ in range(size)]
+    for i in range(1, size - 1):
+        tiles[i][0] = TileType.HORIZONTAL
+        tiles[i][size - 1] = TileType.HORIZONTAL
+        tiles[0][i] = TileType.VERTICAL
+        tiles[size - 1][i] = TileType.VERTICAL
+    tiles[0][0] = TileType.LEFT_TOP_CORNER
+    tiles[size - 1][0] = TileType.RIGHT_TOP_CORNER
+    tiles[0][size - 1] = TileType.LEFT_BOTTOM_CORNER
+    tiles[size - 1][size - 1] = TileType.RIGHT_BOTTOM_CORNER
+    return tiles
+
+
+def generate_waypoints(size):
+    return [[0, 0], [size - 1, 0], [size - 1, size - 1], [0, size - 1]]
+
+
+def generate_world(random: Random, tick=0, players_count=4, team_size=2, projectiles_count=0, bonuses_count=0,
+                   oil_slicks_count=0, world_size=16):
+    players = [Player(id=i + 1, me=i == 0, name='player{0}'.format(i + 1), strategy_crashed=False, score=0)
+               for i in range(players_count)]
+    cars = [generate_car(random, id=i + 1, player_id=players[i // team_size].id, teammate_index=i % team_size,
+                         teammate=i < team_size, world_size=world_size)
+            for i in range(players_count * team_size)]
+    ids = count(cars.__len__() + 1)
+    projectiles = [generate_projectile(random, id=next(ids), car_id=cars[i % cars.__len__()].id,
+                                       player_id=cars[i % cars.__len__()].player_id, world_size=world_size)
+                   for i in range(projectiles_count)]
+    bonuses = [generate_bonus(random, id=next(ids), world_size=world_size) for _ in range(bonuses_count)]
+    oil_slicks = [generate_oil_slick(random, id=next(ids), world_size=world_size) for _ in range(oil_slicks_count)]
+    return World(
+        tick=tick, tick_count=20000, last_tick_index=19999, width=world_size, height=world_size, players=players,
+        cars=cars, projectiles=projectiles, bonuses=bonuses, oil_slicks=oil_slicks, map_name='generated',
+        tiles_x_y=generate_tiles(world_size), waypoints=generate_waypoints(world_size),
+        starting_direction=Direction.RIGHT,
+    )
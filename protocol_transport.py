@@ -0,0 +1,27 @@
+import _socket
+
+# A transport is any object with the socket methods used by RemoteProcessClient: recv_into, sendall, shutdown and
+# close.
+
+
+def set_no_delay(transport):
+    if transport.family in (_socket.AF_INET, _socket.AF_INET6):
+        transport.setsockopt(_socket.IPPROTO_TCP, _socket.TCP_NODELAY, True)
+
+    return transport
+
+
+def connect_tcp(host, port):
+    transport = set_no_delay(_socket.socket())
+    transport.connect((host, port))
+    return transport
+
+
+def connect_unix(path):
+    transport = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    transport.connect(path)
+    return transport
+
+
+def make_pair():
+    return _socket.socketpair()
@@ -1,12 +1,28 @@
 from collections import namedtuple
 from itertools import chain
 from numpy import sign
-from scipy.optimize import bisect
 from model.CircularUnit import CircularUnit
 from model.RectangularUnit import RectangularUnit
 from model.TileType import TileType
 from strategy_common import Point, Line
-from strategy_path import get_point_index
+from strategy_path import get_point_index, get_point
+
+
+BISECT_TOLERANCE = 2e-12
+
+
+def bisect(function, begin, end, tolerance=BISECT_TOLERANCE):
+    begin_negative = function(begin) < 0
+    while end - begin > tolerance:
+        middle = (begin + end) / 2
+        value = function(middle)
+        if value == 0:
+            return middle
+        if (value < 0) == begin_negative:
+            begin = middle
+        else:
+            end = middle
+    return (begin + end) / 2
 
 
 class Circle:
@@ -172,6 +188,19 @@ def make_tiles_barriers(tiles, margin, size):
     return dict(generate())
 
 
+def update_tiles_barriers(barriers, tiles, indices, margin, size):
+    row_size = len(tiles[0])
+    for index in indices:
+        position = get_point(index, row_size)
+        barriers[index] = make_tile_barriers(
+            tile_type=tiles[position.x][position.y],
+            position=position,
+            margin=margin,
+            size=size,
+        )
+    return barriers
+
+
 def make_tile_barriers(tile_type: TileType, position: Point, margin, size):
     absolute_position = position * size
 
@@ -1,8 +1,23 @@
-from collections import deque
+from bisect import bisect_left
+from collections import defaultdict
 from itertools import islice
-from math import cos, sin, sqrt, atan2, pi, hypot
-from numpy import arctan2
-from scipy.interpolate import InterpolatedUnivariateSpline
+from math import cos, sin, sqrt, atan2, pi, hypot, floor
+from functools import lru_cache
+from numpy import (
+    arctan2,
+    argmin,
+    array,
+    column_stack,
+    concatenate,
+    cumsum,
+    diff,
+    einsum,
+    hypot as hypots,
+    interp,
+    linspace,
+    ones,
+    stack,
+)
 
 
 def get_current_tile(point, tile_size):
@@ -14,9 +29,17 @@ def tile_coord(value, tile_size):
 
 
 class Point:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        set_point_x(self, x)
+        set_point_y(self, y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Point is immutable, can't set %s" % name)
+
+    def __delattr__(self, name):
+        raise AttributeError("Point is immutable, can't delete %s" % name)
 
     def __repr__(self):
         return 'Point(x={x}, y={y})'.format(x=self.x, y=self.y)
@@ -24,6 +47,9 @@ class Point:
     def __eq__(self, other):
         return self.x == other.x and self.y == other.y
 
+    def __hash__(self):
+        return hash((self.x, self.y))
+
     def __add__(self, other):
         if isinstance(other, Point):
             return Point(self.x + other.x, self.y + other.y)
@@ -60,30 +86,30 @@ class Point:
     def radius(self):
         return self.x
 
-    @radius.setter
-    def radius(self, value):
-        self.x = value
-
     @property
     def angle(self):
         return self.y
 
-    @angle.setter
-    def angle(self, value):
-        self.y = value
-
     def dot(self, other):
         return self.x * other.x + self.y * other.y
 
     def norm(self):
         return hypot(self.x, self.y)
 
+    def squared_norm(self):
+        return self.x * self.x + self.y * self.y
+
     def cos(self, other):
         return self.dot(other) / (self.norm() * other.norm())
 
     def distance(self, other):
         return hypot(other.x - self.x, other.y - self.y)
 
+    def squared_distance(self, other):
+        dx = other.x - self.x
+        dy = other.y - self.y
+        return dx * dx + dy * dy
+
     def map(self, function):
         return Point(function(self.x), function(self.y))
 
@@ -115,6 +141,15 @@ class Point:
         return Point(self.x * cos(angle) - self.y * sin(angle),
                      self.y * cos(angle) + self.x * sin(angle))
 
+    def rotate_scale(self, angle, factor):
+        cos_value = cos(angle) * factor
+        sin_value = sin(angle) * factor
+        return Point(self.x * cos_value - self.y * sin_value,
+                     self.y * cos_value + self.x * sin_value)
+
+    def add_scaled(self, other, factor):
+        return Point(self.x + other.x * factor, self.y + other.y * factor)
+
     def normalized(self):
         return self / self.norm()
 
@@ -125,6 +160,52 @@ class Point:
         return abs(self.x - other.x) + abs(self.y - other.y)
 
 
+set_point_x = Point.x.__set__
+set_point_y = Point.y.__set__
+
+
+class MutablePoint(Point):
+    __slots__ = ()
+    __hash__ = None
+    __setattr__ = object.__setattr__
+    __delattr__ = object.__delattr__
+
+    def __iadd__(self, other):
+        if isinstance(other, Point):
+            self.x += other.x
+            self.y += other.y
+        else:
+            self.x += other
+            self.y += other
+        return self
+
+    def __isub__(self, other):
+        if isinstance(other, Point):
+            self.x -= other.x
+            self.y -= other.y
+        else:
+            self.x -= other
+            self.y -= other
+        return self
+
+    def __imul__(self, other):
+        if isinstance(other, Point):
+            self.x *= other.x
+            self.y *= other.y
+        else:
+            self.x *= other
+            self.y *= other
+        return self
+
+    def add_scaled_inplace(self, other, factor):
+        self.x += other.x * factor
+        self.y += other.y * factor
+        return self
+
+    def freeze(self):
+        return Point(self.x, self.y)
+
+
 class Line:
     def __init__(self, begin: Point, end: Point):
         self.begin = begin
@@ -185,7 +266,9 @@ class Line:
 class Polyline:
     def __init__(self, points):
         assert points
-        self.points = points
+        self.points = list(points)
+        self.__lengths = None
+        self.__directions = None
 
     def nearest_point(self, point):
         if len(self.points) < 2:
@@ -198,23 +281,137 @@ class Polyline:
     def distance(self, point):
         return self.nearest_point(point).distance(point)
 
-    def at(self, distance):
-        for i, p in islice(enumerate(self.points), len(self.points) - 1):
-            to_next = self.points[i + 1] - p
-            to_next_distance = to_next.norm()
-            if to_next_distance < distance:
-                distance -= to_next_distance
-            else:
-                return p + to_next.normalized() * distance
-        return self.points[-1]
+    def at(self, distance, size=None):
+        lengths = self.__cumulative_lengths()
+        end = len(lengths) if size is None else min(size, len(lengths))
+        distance += lengths[0]
+        index = bisect_left(lengths, distance, 1, end)
+        if index == end:
+            return self.points[end - 1]
+        return self.points[index - 1].add_scaled(
+            self.__directions[index - 1], distance - lengths[index - 1])
 
     def length(self):
-        if not self.points:
-            return 0
-        result = 0
-        for i, p in islice(enumerate(self.points), len(self.points) - 1):
-            result += p.distance(self.points[i + 1])
-        return result
+        lengths = self.__cumulative_lengths()
+        return lengths[-1] - lengths[0]
+
+    def append(self, point):
+        if self.__lengths is not None:
+            self.__add_segment(self.points[-1], point)
+        self.points.append(point)
+
+    def drop(self, count):
+        count = min(count, len(self.points) - 1)
+        del self.points[:count]
+        if self.__lengths is not None:
+            del self.__lengths[:count]
+            del self.__directions[:count]
+
+    def __cumulative_lengths(self):
+        if self.__lengths is None:
+            self.__lengths = [0]
+            self.__directions = []
+            for i, p in islice(enumerate(self.points), len(self.points) - 1):
+                self.__add_segment(p, self.points[i + 1])
+        return self.__lengths
+
+    def __add_segment(self, begin, end):
+        to_end = end - begin
+        length = to_end.norm()
+        self.__lengths.append(self.__lengths[-1] + length)
+        self.__directions.append(to_end / length if length > 0
+                                 else Point(0, 0))
+
+
+class IndexedPolyline(Polyline):
+    def __init__(self, points, cell_size):
+        super().__init__(points)
+        self.__cell_size = cell_size
+        self.__cells = defaultdict(list)
+        self.__bounds = None
+        self.__dropped = 0
+        for i in range(len(self.points) - 1):
+            self.__index_segment(i)
+
+    def nearest_point(self, point):
+        if len(self.points) < 2:
+            return self.points[0]
+        nearest = None
+        min_distance = None
+        visited = set()
+        column, row = self.__cell(point)
+        min_column, max_column, min_row, max_row = self.__bounds
+        max_radius = max(column - min_column, max_column - column,
+                         row - min_row, max_row - row)
+        radius = 0
+        while radius <= max_radius:
+            for cell in ring_cells(column, row, radius):
+                for i in self.__cells.get(cell, ()):
+                    i -= self.__dropped
+                    if i < 0 or i in visited:
+                        continue
+                    visited.add(i)
+                    candidate = nearest_at_segment(
+                        self.points[i], self.points[i + 1], point)
+                    distance = candidate.squared_distance(point)
+                    if min_distance is None or distance < min_distance:
+                        nearest = candidate
+                        min_distance = distance
+            if (min_distance is not None and
+                    min_distance <= (radius * self.__cell_size) ** 2):
+                break
+            radius += 1
+        return nearest
+
+    def append(self, point):
+        super().append(point)
+        self.__index_segment(len(self.points) - 2)
+
+    def drop(self, count):
+        count = min(count, len(self.points) - 1)
+        super().drop(count)
+        self.__dropped += count
+
+    def __index_segment(self, index):
+        begin = self.__cell(self.points[index])
+        end = self.__cell(self.points[index + 1])
+        min_column, max_column = sorted((begin[0], end[0]))
+        min_row, max_row = sorted((begin[1], end[1]))
+        for column in range(min_column, max_column + 1):
+            for row in range(min_row, max_row + 1):
+                self.__cells[(column, row)].append(index + self.__dropped)
+        if self.__bounds is None:
+            self.__bounds = (min_column, max_column, min_row, max_row)
+        else:
+            self.__bounds = (min(self.__bounds[0], min_column),
+                             max(self.__bounds[1], max_column),
+                             min(self.__bounds[2], min_row),
+                             max(self.__bounds[3], max_row))
+
+    def __cell(self, point):
+        return (floor(point.x / self.__cell_size),
+                floor(point.y / self.__cell_size))
+
+
+def ring_cells(column, row, radius):
+    if radius == 0:
+        yield (column, row)
+        return
+    for x in range(column - radius, column + radius + 1):
+        yield (x, row - radius)
+        yield (x, row + radius)
+    for y in range(row - radius + 1, row + radius):
+        yield (column - radius, y)
+        yield (column + radius, y)
+
+
+def nearest_at_segment(begin, end, point):
+    to_end = end - begin
+    squared_length = to_end.squared_norm()
+    if squared_length == 0:
+        return begin
+    parameter = (point - begin).dot(to_end) / squared_length
+    return begin.add_scaled(to_end, max(0, min(1, parameter)))
 
 
 def get_tile_center(point: Point, size):
@@ -233,47 +430,67 @@ def normalize_angle(value):
     return value
 
 
-class LimitedSum:
-    def __init__(self, history_size):
-        self.__values = deque(maxlen=history_size)
-        self.__amount = 0
-
-    def update(self, value):
-        first = (self.__values[0] if len(self.__values) == self.__values.maxlen
-                 else None)
-        self.__values.append(value)
-        self.__amount += value - (0 if first is None else first)
-
-    def reset(self):
-        self.__values.clear()
-        self.__amount = 0
-
-    def get(self):
-        return self.__amount
-
-    @property
-    def count(self):
-        return len(self.__values)
-
-    @property
-    def max_count(self):
-        return self.__values.maxlen
-
-
 class Curve:
     def __init__(self, points):
-        begin = points[0]
-        axis = points[-1] - begin
-        angle = axis.absolute_rotation()
-        relative = ((p - begin).rotate(-angle) for p in points)
-        polar = [p.polar() for p in relative]
-        x = [p.radius for p in polar]
-        y = [p.angle for p in polar]
-        self.__spline = InterpolatedUnivariateSpline(x, y, k=min(5, len(x) - 1))
-        self.__angle = angle
-        self.__begin = begin
+        self.__samples, self.__lengths = make_curve(tuple(points))
+
+    def length(self):
+        return float(self.__lengths[-1])
 
     def at(self, distance):
-        angle = self.__spline(distance)
-        point = Point(distance, angle)
-        return self.__begin + point.cartesian().rotate(self.__angle)
+        x, y = self.at_many([distance])[0]
+        return Point(float(x), float(y))
+
+    def at_many(self, distances):
+        return column_stack((
+            interp(distances, self.__lengths, self.__samples[:, 0]),
+            interp(distances, self.__lengths, self.__samples[:, 1]),
+        ))
+
+    def project(self, point):
+        to_samples = self.__samples - (point.x, point.y)
+        index = argmin(to_samples[:, 0] ** 2 + to_samples[:, 1] ** 2)
+        x, y = self.__samples[index]
+        return float(self.__lengths[index]), Point(float(x), float(y))
+
+
+CURVE_SAMPLES_PER_SEGMENT = 16
+CURVE_CACHE_SIZE = 64
+
+CATMULL_ROM = array([
+    [0, 2, 0, 0],
+    [-1, 0, 1, 0],
+    [2, -5, 4, -1],
+    [-1, 3, -3, 1],
+]) / 2
+
+
+def make_catmull_rom_basis(count):
+    parameters = linspace(0, 1, count, endpoint=False)
+    powers = column_stack((ones(count), parameters, parameters ** 2,
+                           parameters ** 3))
+    return powers.dot(CATMULL_ROM)
+
+
+CURVE_BASIS = make_catmull_rom_basis(CURVE_SAMPLES_PER_SEGMENT)
+
+
+@lru_cache(maxsize=CURVE_CACHE_SIZE)
+def make_curve(points):
+    control = array([(p.x, p.y) for p in points], dtype=float)
+    if len(control) < 2:
+        samples = control
+    else:
+        control = concatenate((2 * control[:1] - control[1:2], control,
+                               2 * control[-1:] - control[-2:-1]))
+        windows = stack([control[i:len(control) - 3 + i] for i in range(4)],
+                        axis=1)
+        samples = concatenate((
+            einsum('nk,skd->snd', CURVE_BASIS, windows).reshape(-1, 2),
+            control[-2:-1],
+        ))
+    steps = hypots(*diff(samples, axis=0).T)
+    lengths = concatenate(([0], cumsum(steps)))
+    samples.flags.writeable = False
+    lengths.flags.writeable = False
+    return samples, lengths
@@ -4,7 +4,8 @@ from functools import reduce
 from itertools import islice
 from math import pi, exp, sqrt, cos
 from operator import mul
-from strategy_common import Point, normalize_angle, LimitedSum
+from strategy_common import Point, normalize_angle
+from strategy_history import CRUSHES, CRUSH_SPEED_DERIVATIVE
 
 Control = namedtuple('Control', ('engine_power', 'wheel_turn', 'brake'))
 History = namedtuple('History', ('current', 'target'))
@@ -213,36 +214,37 @@ def sigmoid(x, kx=1, ky=1):
 
 
 class StuckDetector:
-    def __init__(self, history_size, stuck_distance, unstack_distance):
-        self.__distance = LimitedSum(history_size)
+    def __init__(self, history, history_size, stuck_distance,
+                 unstack_distance):
+        self.__history = history
+        self.__history_size = history_size
         self.__stuck_distance = stuck_distance
         self.__unstack_distance = unstack_distance
-        self.__previous_position = None
-
-    def update(self, position):
-        if self.__previous_position is not None:
-            self.__distance.update(position.distance(self.__previous_position))
-        self.__previous_position = position
+        self.__begin = history.appended
 
     def positive_check(self):
-        return (self.__distance.count == self.__distance.max_count and
-                self.__distance.get() < self.__stuck_distance)
+        return (self.__history.count(self.__begin) > self.__history_size and
+                self.__distance() < self.__stuck_distance)
 
     def negative_check(self):
-        return self.__distance.get() > self.__unstack_distance
+        return self.__distance() > self.__unstack_distance
 
     def reset(self):
-        self.__distance.reset()
-        self.__previous_position = None
+        self.__begin = self.__history.appended
+
+    def __distance(self):
+        return self.__history.distance(self.__history_size, self.__begin)
 
 
 class DirectionDetector:
-    def __init__(self, begin: Point, end: Point, min_distance):
+    def __init__(self, history, begin: Point, end: Point, min_distance):
+        self.__history = history
         self.__begin = begin
         self.__end = end
         self.__min_distance = min_distance
 
-    def update(self, position):
+    def update(self):
+        position = self.__history.position()
         if self.__end.distance(position) >= self.__min_distance:
             self.__begin = self.__end
             self.__end = position
@@ -256,28 +258,16 @@ class DirectionDetector:
 
 
 class CrushDetector:
-    Conf = namedtuple('Conf', ('speed', 'durability'))
-
-    def __init__(self, min_derivative):
-        self.__history = deque(maxlen=2)
-        self.__min_derivative = min_derivative
-
-    def update(self, speed: Point, durability):
-        self.__history.append(self.Conf(speed.norm(), durability))
-
-    def reset(self):
-        self.__history.clear()
+    def __init__(self, history):
+        self.__history = history
+        self.__begin = history.appended
 
-    def check(self):
-        return (self.durability_derivative() < 0 and
-                self.speed_derivative() < self.__min_derivative)
+    def count(self):
+        return self.__history.count(self.__begin)
 
-    def speed_derivative(self):
-        if len(self.__history) < 2:
-            return 0
-        return self.__history[1].speed - self.__history[0].speed
+    def crushes(self, size):
+        return self.__history.total(CRUSHES, size, self.__begin)
 
-    def durability_derivative(self):
-        if len(self.__history) < 2:
-            return 0
-        return self.__history[1].durability - self.__history[0].durability
+    def speed_derivative(self, size):
+        return self.__history.total(CRUSH_SPEED_DERIVATIVE, size,
+                                    self.__begin)
@@ -6,9 +6,9 @@ from strategy_barriers import make_tiles_barriers, Rectangle, Circle
 
 
 class DebugStrategy:
-    def __init__(self):
+    def __init__(self, history=None):
         from debug import Plot
-        self.__impl = ReleaseStrategy()
+        self.__impl = ReleaseStrategy(history)
         if 'PLOT' in environ and environ['PLOT'] == '1':
             self.__plot = Plot()
 
@@ -20,14 +20,14 @@ class DebugStrategy:
             path = self.__impl.path
             position = context.position
             target = self.__impl.target_position
-            tile_size = context.game.track_tile_size
+            tile_size = context.constants.tile_size
             waypoints = [get_tile_center(Point(p[0], p[1]), tile_size)
                          for p in context.world.waypoints]
             next_waypoint = waypoints[context.me.next_waypoint_index]
             barriers = make_tiles_barriers(
                 tiles=context.world.tiles_x_y,
-                margin=context.game.track_tile_margin,
-                size=context.game.track_tile_size,
+                margin=context.constants.tile_margin,
+                size=context.constants.tile_size,
             )
             self.__plot.clear()
             if path is not None:
@@ -0,0 +1,129 @@
+from numpy import (
+    array,
+    broadcast_arrays,
+    cos,
+    errstate,
+    floor,
+    full,
+    hypot,
+    nan,
+    pi,
+    round as round_,
+    sin,
+    sqrt,
+    stack,
+    where,
+)
+from strategy_common import Point
+
+
+def to_array(points):
+    return array([(p.x, p.y) for p in points], dtype=float).reshape(-1, 2)
+
+
+def to_point(value):
+    return Point(float(value[0]), float(value[1]))
+
+
+def make_vectors(x, y):
+    return stack(broadcast_arrays(x, y), axis=-1)
+
+
+def norms(vectors):
+    return hypot(vectors[..., 0], vectors[..., 1])
+
+
+def dots(a, b):
+    return a[..., 0] * b[..., 0] + a[..., 1] * b[..., 1]
+
+
+def dets(a, b):
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def cosines(a, b):
+    with errstate(divide='ignore', invalid='ignore'):
+        return dots(a, b) / (norms(a) * norms(b))
+
+
+def pairwise_distances(a, b):
+    return norms(a[:, None, :] - b[None, :, :])
+
+
+def rotate(vectors, angles):
+    cos_values = cos(angles)
+    sin_values = sin(angles)
+    x = vectors[..., 0]
+    y = vectors[..., 1]
+    return make_vectors(x * cos_values - y * sin_values,
+                        y * cos_values + x * sin_values)
+
+
+def normalize_angles(values):
+    values = array(values, dtype=float)
+    return where(values > pi,
+                 values - round_(values / (2.0 * pi)) * 2.0 * pi,
+                 where(values < -pi,
+                       values + round_(abs(values) / (2.0 * pi)) * 2.0 * pi,
+                       values))
+
+
+def projections(begins, ends, points):
+    to_end = ends - begins
+    squared_norms = dots(to_end, to_end)
+    with errstate(divide='ignore', invalid='ignore'):
+        return where(squared_norms == 0, 0,
+                     dots(points - begins, to_end) / squared_norms)
+
+
+def nearest(begins, ends, points):
+    parameters = projections(begins, ends, points)
+    return begins + (ends - begins) * parameters[..., None]
+
+
+def line_distances(begins, ends, points):
+    to_end = ends - begins
+    to_point = points - begins
+    with errstate(divide='ignore', invalid='ignore'):
+        norm = dots(to_point, to_end) / norms(to_end)
+    return sqrt(abs(dots(to_point, to_point) - norm ** 2))
+
+
+def line_intersections(a_begins, a_ends, b_begins, b_ends):
+    x_diff = make_vectors(a_begins[..., 0] - a_ends[..., 0],
+                          b_begins[..., 0] - b_ends[..., 0])
+    y_diff = make_vectors(a_begins[..., 1] - a_ends[..., 1],
+                          b_begins[..., 1] - b_ends[..., 1])
+    div = dets(x_diff, y_diff)
+    exists = div != 0
+    d = make_vectors(dets(a_begins, a_ends), dets(b_begins, b_ends))
+    with errstate(divide='ignore', invalid='ignore'):
+        points = make_vectors(dets(d, x_diff) / div, dets(d, y_diff) / div)
+    points[~exists] = nan
+    return points, exists
+
+
+def segment_intersections(a_begins, a_ends, b_begins, b_ends):
+    a_dir = a_ends - a_begins
+    b_dir = b_ends - b_begins
+    div = dets(a_dir, b_dir)
+    to_b = b_begins - a_begins
+    with errstate(divide='ignore', invalid='ignore'):
+        a_parameters = dets(to_b, b_dir) / div
+        b_parameters = dets(to_b, a_dir) / div
+    exists = ((div != 0) & (a_parameters >= 0) & (a_parameters <= 1) &
+              (b_parameters >= 0) & (b_parameters <= 1))
+    points = a_begins + a_dir * a_parameters[..., None]
+    points[~exists] = nan
+    return points, exists
+
+
+def tiles_at(points, tiles, tile_size):
+    x = points[..., 0]
+    y = points[..., 1]
+    inside = ((0 < x) & (x < tiles.shape[0] * tile_size) &
+              (0 < y) & (y < tiles.shape[1] * tile_size))
+    result = full(x.shape, -1, dtype=tiles.dtype)
+    result[inside] = tiles[floor(x[inside] / tile_size).astype(int),
+                           floor(y[inside] / tile_size).astype(int)]
+    return result
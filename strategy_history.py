@@ -0,0 +1,141 @@
+from math import hypot
+from numpy import arange, zeros
+from model.Car import Car
+from strategy_common import Point
+
+FIELDS = (
+    'x', 'y', 'speed_x', 'speed_y', 'angle', 'angular_speed', 'durability',
+    'engine_power', 'wheel_turn',
+)
+
+X, Y, SPEED_X, SPEED_Y, ANGLE, ANGULAR_SPEED, DURABILITY, ENGINE_POWER, \
+    WHEEL_TURN = range(len(FIELDS))
+
+TOTALS = ('distance', 'crushes', 'crush_speed_derivative')
+
+DISTANCE, CRUSHES, CRUSH_SPEED_DERIVATIVE = range(len(TOTALS))
+
+
+class History:
+    def __init__(self, capacity, columns):
+        self.__values = zeros((capacity, columns))
+        self.__capacity = capacity
+        self.__appended = 0
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    @property
+    def appended(self):
+        return self.__appended
+
+    def __len__(self):
+        return min(self.__appended, self.__capacity)
+
+    def append(self, *values):
+        self.__values[self.__appended % self.__capacity] = values
+        self.__appended += 1
+
+    def clear(self):
+        self.__appended = 0
+
+    def count(self, begin=0):
+        return max(0, min(len(self), self.__appended - begin))
+
+    def window(self, size, begin=0):
+        size = min(size, self.count(begin))
+        if size <= 0:
+            return self.__values[:0]
+        end = self.__appended % self.__capacity
+        if size <= end:
+            return self.__values[end - size:end]
+        return self.__values[arange(end - size, end) % self.__capacity]
+
+    def last(self, column):
+        if self.__appended == 0:
+            return 0
+        return self.__values[(self.__appended - 1) % self.__capacity, column]
+
+
+class PointHistory(History):
+    def __init__(self, capacity):
+        super().__init__(capacity, 2)
+
+    def append(self, point: Point):
+        super().append(point.x, point.y)
+
+    def points(self):
+        return [Point(float(x), float(y)) for x, y in self.window(len(self))]
+
+
+class CarHistory(History):
+    def __init__(self, capacity, crush_speed_derivative=0):
+        super().__init__(capacity, len(FIELDS))
+        self.__crush_speed_derivative = crush_speed_derivative
+        self.__totals = [None] * capacity
+
+    def append(self, car: Car):
+        index = self.appended
+        speed = hypot(car.speed_x, car.speed_y)
+        if index:
+            x, y, previous_speed, durability = self.__previous
+            distance, crushes, crush_speed_derivative = self.__running
+            speed_derivative = speed - previous_speed
+            crush = (car.durability < durability and
+                     speed_derivative < self.__crush_speed_derivative)
+            self.__running = (
+                distance + hypot(car.x - x, car.y - y),
+                crushes + crush,
+                crush_speed_derivative + (speed_derivative if crush else 0),
+            )
+        else:
+            self.__running = (0, 0, 0)
+        self.__previous = (car.x, car.y, speed, car.durability)
+        super().append(car.x, car.y, car.speed_x, car.speed_y, car.angle,
+                       car.angular_speed, car.durability, car.engine_power,
+                       car.wheel_turn)
+        self.__totals[index % self.capacity] = self.__running
+
+    def position(self):
+        return Point(float(self.last(X)), float(self.last(Y)))
+
+    def total(self, column, size, begin=0):
+        end = self.appended - 1
+        first = max(begin, end - size, self.appended - len(self))
+        if first >= end:
+            return 0
+        return (self.__totals[end % self.capacity][column] -
+                self.__totals[first % self.capacity][column])
+
+    def distance(self, size, begin=0):
+        return self.total(DISTANCE, size, begin)
+
+
+class CarsHistory:
+    def __init__(self, capacity, crush_speed_derivative=0):
+        self.__capacity = capacity
+        self.__crush_speed_derivative = crush_speed_derivative
+        self.__cars = {}
+        self.__tick = None
+
+    def update(self, tick, cars):
+        if tick == self.__tick:
+            return
+        self.__tick = tick
+        for car in cars:
+            if car is not None:
+                self.get(car.id).append(car)
+
+    def get(self, car_id):
+        history = self.__cars.get(car_id)
+        if history is None:
+            history = self.__cars[car_id] = CarHistory(
+                self.__capacity, self.__crush_speed_derivative)
+        return history
+
+    def __getitem__(self, car_id):
+        return self.__cars[car_id]
+
+    def __contains__(self, car_id):
+        return car_id in self.__cars
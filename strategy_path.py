@@ -511,13 +511,13 @@ def shortest_path_with_direction(graph, src, dst, initial_direction, forbidden):
     queue = [(0, src_position.distance(dst_position), src, initial_direction)]
     distances = {src: 0}
     previous_nodes = {}
-    visited = defaultdict(list)
+    visited = defaultdict(set)
     while queue:
         v = heappop(queue)
         distance = v[0]
         node_index = v[2]
         direction = v[3]
-        visited[node_index].append(direction)
+        visited[node_index].add(direction)
         node = graph[node_index]
         for neighbor_index, weight in node.arcs:
             if neighbor_index in forbidden:
@@ -1,20 +1,32 @@
 from collections import deque, namedtuple
-from copy import copy
-from math import cos, radians
+from math import cos, hypot, radians
 from itertools import chain, islice
 from functools import reduce
 from operator import mul
+from numpy import array, errstate
 from model.Car import Car
 from model.Game import Game
 from model.Move import Move
 from model.World import World
 from model.CarType import CarType
 from model.TileType import TileType
+from game_constants import (
+    WASHER_RANGE_TICKS,
+    TIRE_RANGE_TICKS,
+    get_game_constants,
+)
+from strategy_history import CarsHistory, PointHistory
+from strategy_geometry import (
+    to_array,
+    norms,
+    dots,
+    line_intersections,
+    tiles_at,
+)
 from strategy_common import (
     Point,
     Polyline,
     get_current_tile,
-    LimitedSum,
     Line,
     Curve,
 )
@@ -36,6 +48,7 @@ from strategy_path import (
 )
 from strategy_barriers import (
     make_tiles_barriers,
+    update_tiles_barriers,
     make_units_barriers,
     make_has_intersection_with_line,
     make_has_intersection_with_lane,
@@ -47,6 +60,9 @@ from strategy_barriers import (
 BUGGY_INITIAL_ANGLE_TO_DIRECT_PROPORTION = 4
 JEEP_INITIAL_ANGLE_TO_DIRECT_PROPORTION = 4
 SPEED_LOSS_HISTORY_SIZE = 500
+STUCK_HISTORY_SIZE = 150
+HISTORY_CAPACITY = max(SPEED_LOSS_HISTORY_SIZE, STUCK_HISTORY_SIZE) + 1
+CRUSH_SPEED_DERIVATIVE = -0.6
 MIN_SPEED_LOSS = 1 / SPEED_LOSS_HISTORY_SIZE
 MAX_SPEED_LOSS = 1 / SPEED_LOSS_HISTORY_SIZE
 CHANGE_PER_TICKS_COUNT = SPEED_LOSS_HISTORY_SIZE / 5
@@ -60,9 +76,11 @@ MAX_SPEED = 45
 MAX_SPEED_THROUGH_UNKNOWN = 40
 PATH_SIZE_FOR_BONUSES = 5
 CAR_SPEED_FACTOR = 1.2
+FAST_CAR_MIN_SPEED = 1
 WASHER_INTERVAL = 3
 TIRE_INTERVAL = 2
 MY_INTERVAL = 5
+FIND_MEETINGS_MIN_PAIRS = 32
 
 
 class Context:
@@ -71,6 +89,13 @@ class Context:
         self.world = world
         self.game = game
         self.move = move
+        self.__tiles = None
+        self.__fast_opponent_cars = None
+        self.__slow_opponent_cars = None
+
+    @property
+    def constants(self):
+        return get_game_constants(self.game)
 
     @property
     def position(self):
@@ -86,12 +111,18 @@ class Context:
 
     @property
     def tile(self):
-        return get_current_tile(self.position, self.game.track_tile_size)
+        return get_current_tile(self.position, self.constants.tile_size)
 
     @property
     def tile_index(self):
         return get_point_index(self.tile, self.world.height)
 
+    @property
+    def tiles(self):
+        if self.__tiles is None:
+            self.__tiles = array(self.world.tiles_x_y)
+        return self.__tiles
+
     @property
     def is_buggy(self):
         return self.me.type == CarType.BUGGY
@@ -104,26 +135,52 @@ class Context:
 
     @property
     def opponents_cars(self):
-        return (x for x in self.world.cars if not x.teammate)
+        return self.world.opponent_cars
+
+    @property
+    def fast_opponent_cars(self):
+        if self.__fast_opponent_cars is None:
+            self.__fast_opponent_cars = [
+                car for car in self.world.opponent_cars
+                if hypot(car.speed_x, car.speed_y) >= FAST_CAR_MIN_SPEED]
+        return self.__fast_opponent_cars
+
+    @property
+    def slow_opponent_cars(self):
+        if self.__slow_opponent_cars is None:
+            self.__slow_opponent_cars = [
+                car for car in self.world.opponent_cars
+                if hypot(car.speed_x, car.speed_y) < FAST_CAR_MIN_SPEED]
+        return self.__slow_opponent_cars
+
+
+def make_cars_history():
+    return CarsHistory(HISTORY_CAPACITY,
+                       crush_speed_derivative=CRUSH_SPEED_DERIVATIVE)
 
 
 class ReleaseStrategy:
-    def __init__(self):
+    def __init__(self, history=None):
+        self.__history = make_cars_history() if history is None else history
         self.__first_move = True
 
     def __lazy_init(self, context: Context):
+        history = self.__history.get(context.me.id)
         self.__stuck = StuckDetector(
-            history_size=150,
-            stuck_distance=min(context.me.width, context.me.height),
-            unstack_distance=max(context.me.width, context.me.height) * 1.5,
+            history=history,
+            history_size=STUCK_HISTORY_SIZE,
+            stuck_distance=context.constants.min_car_size,
+            unstack_distance=context.constants.max_car_size * 1.5,
         )
         self.__direction = DirectionDetector(
+            history=history,
             begin=context.position,
             end=context.position + context.direction,
-            min_distance=max(context.me.width, context.me.height),
+            min_distance=context.constants.max_car_size,
         )
         self.__controller = Controller(distance_to_wheels=context.me.width / 4)
         self.__move_mode = AdaptiveMoveMode(
+            history=history,
             start_tile=context.tile,
             controller=self.__controller,
             get_direction=self.__direction,
@@ -149,11 +206,10 @@ class ReleaseStrategy:
         if self.__first_move:
             self.__lazy_init(context)
             self.__first_move = False
-        if context.me.durability > 0:
-            self.__stuck.update(context.position)
-        else:
+        self.__history.update(context.world.tick, context.world.cars)
+        if context.me.durability <= 0:
             self.__stuck.reset()
-        self.__direction.update(context.position)
+        self.__direction.update()
         if self.__stuck.positive_check():
             self.__move_mode.switch()
             self.__stuck.reset()
@@ -170,7 +226,7 @@ class ReleaseStrategy:
 
 
 class AdaptiveMoveMode:
-    def __init__(self, controller, start_tile, get_direction,
+    def __init__(self, history, controller, start_tile, get_direction,
                  speed_angle_to_direct_proportion):
         self.__current_index = 0
         self.__move_mode = MoveMode(
@@ -179,8 +235,9 @@ class AdaptiveMoveMode:
             get_direction=get_direction,
             speed_angle_to_direct_proportion=speed_angle_to_direct_proportion,
         )
-        self.__crush = CrushDetector(min_derivative=-0.6)
-        self.__speed_loss = SpeedLoss(history_size=SPEED_LOSS_HISTORY_SIZE)
+        self.__crush = CrushDetector(history=history)
+        self.__speed_loss = SpeedLoss(crush=self.__crush,
+                                      history_size=SPEED_LOSS_HISTORY_SIZE)
         self.__last_change = 0
 
     @property
@@ -196,9 +253,6 @@ class AdaptiveMoveMode:
         return self.__move_mode.is_forward
 
     def move(self, context: Context):
-        self.__crush.update(context.speed, context.me.durability)
-        self.__speed_loss.update(self.__crush.check(),
-                                 -self.__crush.speed_derivative())
         speed_loss = self.__speed_loss.get()
         if speed_loss > MAX_SPEED_LOSS:
             self.__change(1 / 0.999, context.world.tick)
@@ -247,14 +301,15 @@ class MoveMode:
 
     def move(self, context: Context):
         path = self.__path.get(context)
-        course = self.__course.get(context, path[:COURSE_PATH_SIZE])
+        course = self.__course.get(context, path[:COURSE_PATH_SIZE],
+                                   self.__path.polyline)
         speed_path_size = max(TARGET_SPEED_PATH_MIN_SIZE,
                               int(context.speed.norm() / 9))
         speed_path = self.__path.history + path[:speed_path_size]
         max_speed = (
             MAX_SPEED_THROUGH_UNKNOWN
             if path_has_tiles(path, context.world.tiles_x_y,
-                              context.game.track_tile_size,
+                              context.constants.tile_size,
                               TileType.UNKNOWN)
             else MAX_SPEED
         )
@@ -288,7 +343,7 @@ class MoveMode:
             context.me.oil_canister_count > MAX_CANISTER_COUNT or
             make_has_intersection_with_line(
                 position=context.position,
-                course=(-context.direction * context.game.track_tile_size),
+                course=(-context.direction * context.constants.tile_size),
                 barriers=list(generate_opponents_cars_barriers(context)),
             )(0))
         context.move.throw_projectile = throw_projectile(
@@ -333,47 +388,30 @@ def throw_washer(context: Context):
         Washer(position=context.position,
                speed=context.direction.rotate(radians(-2)) * washer_speed),
     ]
-    world_tiles = context.world.tiles_x_y
-    tile_size = context.game.track_tile_size
+    moving_cars = context.fast_opponent_cars
 
     def generate():
-        for car in context.opponents_cars:
-            car_position = Point(car.x, car.y)
-            car_speed = Point(car.speed_x, car.speed_y)
+        for car in context.slow_opponent_cars:
             car_barriers = list(make_units_barriers([car]))
-            if car_speed.norm() < 1:
-                for washer in washers:
-                    yield make_has_intersection_with_lane(
-                        position=washer.position,
-                        course=washer.speed * 150,
-                        barriers=car_barriers,
-                        width=context.game.washer_radius,
-                    )(0)
-            else:
-                car_line = Line(car_position, car_position + car_speed)
-                for washer in washers:
-                    washer_line = Line(washer.position,
-                                       washer.position + washer.speed)
-                    intersection = washer_line.intersection(car_line)
-                    if intersection is None:
-                        continue
-                    if not is_in_world(intersection, world_tiles, tile_size):
-                        continue
-                    if is_in_empty_tile(intersection, world_tiles, tile_size):
-                        continue
-                    car_dir = intersection - car_position
-                    if car_dir.norm() > 0 and car_dir.cos(car_speed) < 0:
-                        continue
-                    if car_dir.norm() > washer_speed * 150:
-                        continue
-                    washer_dir = intersection - washer.position
-                    if (washer_dir.norm() > 0 and
-                            washer_dir.cos(washer.speed) < 0):
-                        continue
-                    car_time = car_dir.norm() / car_speed.norm()
-                    washer_time = washer_dir.norm() / washer.speed.norm()
-                    if abs(car_time - washer_time) <= WASHER_INTERVAL:
-                        yield True
+            for washer in washers:
+                yield make_has_intersection_with_lane(
+                    position=washer.position,
+                    course=washer.speed * WASHER_RANGE_TICKS,
+                    barriers=car_barriers,
+                    width=context.game.washer_radius,
+                )(0)
+        if moving_cars:
+            yield bool(find_meetings(
+                positions=[x.position for x in washers],
+                speeds=[x.speed for x in washers],
+                units_positions=[Point(x.x, x.y) for x in moving_cars],
+                units_speeds=[Point(x.speed_x, x.speed_y)
+                              for x in moving_cars],
+                max_distance=context.constants.washer_range,
+                interval=WASHER_INTERVAL,
+                tiles=context.tiles,
+                tile_size=context.constants.tile_size,
+            ))
 
     return next((x for x in generate() if x), False)
 
@@ -434,7 +472,7 @@ def throw_tire(context: Context, tiles_barriers):
                     yield tiles_barriers[get_point_index(tile, height)]
         return chain.from_iterable(impl())
 
-    tile_size = context.game.track_tile_size
+    tile_size = context.constants.tile_size
 
     def has_intersection_with_tiles(distance):
         course = tire_speed.normalized() * distance
@@ -447,55 +485,41 @@ def throw_tire(context: Context, tiles_barriers):
             width=context.game.tire_radius,
         )(0)
 
-    world_tiles = context.world.tiles_x_y
+    moving_cars = context.fast_opponent_cars
 
     def generate():
-        for car in context.opponents_cars:
+        for car in context.slow_opponent_cars:
             car_position = Point(car.x, car.y)
-            car_speed = Point(car.speed_x, car.speed_y)
             car_barriers = list(make_units_barriers([car]))
             distance = (context.position - car_position).norm()
-            if car_speed.norm() < 1:
-                yield (not has_intersection_with_tiles(distance) and
-                       make_has_intersection_with_lane(
-                           position=context.position,
-                           course=tire_speed * 50,
-                           barriers=car_barriers,
-                           width=context.game.tire_radius,
-                       )(0))
-            else:
-                car_line = Line(car_position, car_position + car_speed)
-                tire_line = Line(context.position,
-                                 context.position + tire_speed)
-                intersection = tire_line.intersection(car_line)
-                if intersection is None:
-                    continue
-                if not is_in_world(intersection, world_tiles, tile_size):
-                    continue
-                if is_in_empty_tile(intersection, world_tiles, tile_size):
-                    continue
-                car_dir = intersection - car_position
-                if car_dir.norm() > 0 and car_dir.cos(car_speed) < 0:
-                    continue
-                if car_dir.norm() > context.game.tire_initial_speed * 50:
-                    continue
-                tire_dir = intersection - context.position
-                if tire_dir.norm() > 0 and tire_dir.cos(tire_speed) < 0:
-                    continue
-                if has_intersection_with_tiles(tire_dir.norm()):
-                    continue
-                car_time = car_dir.norm() / car_speed.norm()
-                tire_time = tire_dir.norm() / tire_speed.norm()
-                if abs(car_time - tire_time) <= TIRE_INTERVAL:
-                    yield True
+            yield (not has_intersection_with_tiles(distance) and
+                   make_has_intersection_with_lane(
+                       position=context.position,
+                       course=tire_speed * TIRE_RANGE_TICKS,
+                       barriers=car_barriers,
+                       width=context.game.tire_radius,
+                   )(0))
+        if moving_cars:
+            for distance in find_meetings(
+                    positions=[context.position],
+                    speeds=[tire_speed],
+                    units_positions=[Point(x.x, x.y) for x in moving_cars],
+                    units_speeds=[Point(x.speed_x, x.speed_y)
+                                  for x in moving_cars],
+                    max_distance=context.constants.tire_range,
+                    interval=TIRE_INTERVAL,
+                    tiles=context.tiles,
+                    tile_size=tile_size):
+                yield not has_intersection_with_tiles(distance)
 
     return next((x for x in generate() if x), False)
 
 
 class Path:
     def __init__(self, start_tile, get_direction, history_size):
-        self.__path = []
-        self.__history = deque(maxlen=history_size)
+        self.__path = None
+        self.__polyline = None
+        self.__history = PointHistory(history_size)
         self.__forward = ForwardWaypointsPathBuilder(
             start_tile=start_tile,
         )
@@ -511,14 +535,22 @@ class Path:
 
     @property
     def history(self):
-        return list(self.__history)
+        return self.__history.points()
+
+    @property
+    def polyline(self):
+        return self.__polyline
 
     def get(self, context: Context):
         self.__update(context)
-        return list(adjust_for_bonuses(
-            path=self.__path,
+        if self.__path is None:
+            self.__polyline = None
+            return []
+        points = self.__path.points
+        path = list(adjust_for_bonuses(
+            path=points,
             bonuses=context.world.bonuses,
-            tile_size=context.game.track_tile_size,
+            tile_size=context.constants.tile_size,
             world_height=context.world.height,
             priority_conf=PriorityConf(
                 durability=context.me.durability,
@@ -528,15 +560,20 @@ class Path:
             ),
             limit=PATH_SIZE_FOR_BONUSES,
         ))
+        if all(x is y for x, y in zip(path, points)):
+            self.__polyline = self.__path
+        else:
+            self.__polyline = Polyline(path)
+        return path
 
     def use_forward(self):
         self.__current = self.__forward
-        self.__path.clear()
+        self.__path = None
         self.__history.clear()
 
     def switch(self):
         self.__current = self.__states[id(self.__current)]
-        self.__path.clear()
+        self.__path = None
         self.__history.clear()
 
     @property
@@ -544,37 +581,43 @@ class Path:
         return id(self.__current) == id(self.__forward)
 
     def __update(self, context: Context):
+        constants = context.constants
+
         def need_take_next(path):
-            if not path:
+            if path is None:
                 return False
-            course = path[0] - context.position
+            course = path.points[0] - context.position
             distance = course.norm()
-            if distance < min(context.me.width, context.me.height):
+            if distance < constants.min_car_size:
                 return True
-            return (distance < 0.75 * context.game.track_tile_size and
+            return (distance < constants.take_next_distance and
                     self.__get_direction().cos(course) < 0.25)
 
         while need_take_next(self.__path):
-            self.__history.append(self.__path[0])
-            self.__path = self.__path[1:]
+            self.__history.append(self.__path.points[0])
+            if len(self.__path.points) > 1:
+                self.__path.drop(1)
+            else:
+                self.__path = None
 
         def need_remake(path):
-            if not path:
+            if path is None:
                 return True
+            path = path.points
             return (
                 context.speed.norm() > 0 and
                 context.direction.cos(context.speed) < -cos(1) or
                 path_has_tiles(path, context.world.tiles_x_y,
-                               context.game.track_tile_size,
-                               TileType.EMPTY) or
+                               constants.tile_size, TileType.EMPTY) or
                 first_point_index(path, context.world.tiles_x_y,
-                                  context.game.track_tile_size,
+                                  constants.tile_size,
                                   TileType.UNKNOWN) < min(3, len(path)) or
                 context.position.distance(path[0]) >
-                2 * context.game.track_tile_size)
+                constants.remake_distance)
 
         if need_remake(self.__path):
-            self.__path = self.__current.make(context)
+            path = self.__current.make(context)
+            self.__path = Polyline(path) if path else None
         self.__forward.start_tile = context.tile
 
 
@@ -621,12 +664,9 @@ class WaypointsPathBuilder:
             path = [self.start_tile]
         elif self.start_tile != path[0]:
             path = [self.start_tile] + path
-        path = [(x + Point(0.5, 0.5)) * context.game.track_tile_size
-                for x in path]
-        shift = (context.game.track_tile_size / 2 -
-                 context.game.track_tile_margin -
-                 max(context.me.width, context.me.height) / 2)
-        path = list(adjust_path(path, shift, context.game.track_tile_size))
+        tile_size = context.constants.tile_size
+        path = [(x + Point(0.5, 0.5)) * tile_size for x in path]
+        path = list(adjust_path(path, context.constants.path_shift, tile_size))
         path = list(shift_on_direct(path))
         return path
 
@@ -662,7 +702,7 @@ class UnstuckPathBuilder:
     def make(self, context: Context):
         line = Line(begin=context.position,
                     end=(context.position + context.direction * self.__factor *
-                         context.game.track_tile_size))
+                         context.constants.tile_size))
         clipped = context.world_rectangle.clip_line(line)
         if clipped != line:
             return [clipped.begin + (line.end - line.begin) * 0.99]
@@ -670,6 +710,27 @@ class UnstuckPathBuilder:
             return [line.end]
 
 
+def path_at(position, path, polyline, distance):
+    if not path:
+        return position
+    to_first = path[0] - position
+    first_distance = to_first.norm()
+    if first_distance >= distance:
+        return position + to_first * (distance / first_distance)
+    if polyline is None:
+        polyline = Polyline(path)
+    return polyline.at(distance - first_distance, len(path))
+
+
+def curve_at(position, curve, distance):
+    length, nearest = curve.project(position)
+    to_nearest = nearest - position
+    nearest_distance = to_nearest.norm()
+    if nearest_distance >= distance:
+        return position + to_nearest * (distance / nearest_distance)
+    return curve.at(length + distance - nearest_distance)
+
+
 def generate_cos(path):
     for i, current in islice(enumerate(path), 1, len(path) - 1):
         a = current - path[i - 1]
@@ -683,32 +744,50 @@ Unit = namedtuple('Unit', ('position', 'speed'))
 class Course:
     def __init__(self):
         self.__tile_barriers = None
-        self.__tiles = None
+        self.__tiles_version = None
 
     @property
     def tile_barriers(self):
         return self.__tile_barriers
 
-    def get(self, context: Context, path):
-        if (self.__tiles is None or self.__tile_barriers is None or
-                self.__tiles != context.world.tiles_x_y):
-            self.__tiles = copy(context.world.tiles_x_y)
+    def get(self, context: Context, path, polyline=None):
+        tiles_version = context.world.tiles_version
+        if self.__tile_barriers is None or self.__tiles_version is None:
+            self.__tile_barriers = make_tiles_barriers(
+                tiles=context.world.tiles_x_y,
+                margin=context.constants.tile_margin,
+                size=context.constants.tile_size,
+            )
+        elif (self.__tiles_version + 1 == tiles_version and
+              context.world.changed_tiles):
+            update_tiles_barriers(
+                barriers=self.__tile_barriers,
+                tiles=context.world.tiles_x_y,
+                indices=context.world.changed_tiles,
+                margin=context.constants.tile_margin,
+                size=context.constants.tile_size,
+            )
+        elif self.__tiles_version != tiles_version:
             self.__tile_barriers = make_tiles_barriers(
                 tiles=context.world.tiles_x_y,
-                margin=context.game.track_tile_margin,
-                size=context.game.track_tile_size,
+                margin=context.constants.tile_margin,
+                size=context.constants.tile_size,
             )
-        tile_size = context.game.track_tile_size
-        sub_path = [context.position] + path
+        self.__tiles_version = tiles_version
+        tile_size = context.constants.tile_size
         if reduce(mul, generate_cos(path), 1) < 0:
-            target_position = Curve(sub_path).at(tile_size)
+            target_position = curve_at(context.position, Curve(path),
+                                       tile_size)
         else:
-            target_position = Polyline(sub_path).at(tile_size)
+            target_position = path_at(context.position, path, polyline,
+                                      tile_size)
         course = target_position - context.position
         current_tile = context.tile
         target_tile = get_current_tile(target_position, tile_size)
-        target_tile.x = max(0, min(context.world.width - 1, target_tile.x))
-        target_tile.y = max(0, min(context.world.height - 1, target_tile.y))
+        target_tile = Point(
+            max(0, min(context.world.width - 1, target_tile.x)),
+            max(0, min(context.world.height - 1, target_tile.y)),
+        )
         range_x = list(range(current_tile.x, target_tile.x + 1)
                        if current_tile.x <= target_tile.x
                        else range(target_tile.x, current_tile.x + 1))
@@ -731,8 +810,7 @@ class Course:
 
         all_units = list(
             Unit(Point(v.x, v.y), Point(v.speed_x, v.speed_y)) for v in chain(
-                (v for v in context.world.cars
-                 if v.id != context.me.id and (v.speed_x > 0 or v.speed_y > 0)),
+                (v for v in context.world.moving_cars if v.id != context.me.id),
                 (x for x in context.world.projectiles),
             )
         )
@@ -746,7 +824,7 @@ class Course:
             (BarrierLimit(v, 0.8) for v in cars_barriers),
             (BarrierLimit(v, 0.7) for v in oil_slicks_barriers),
         ))
-        width = max(context.me.width, context.me.height)
+        width = context.constants.max_car_size
         angle = course.rotation(context.direction)
 
         static = make_has_intersection_with_lane(
@@ -756,37 +834,24 @@ class Course:
             width=width,
         )
 
-        world_tiles = context.world.tiles_x_y
+        units_positions = [x.position for x in all_units]
+        units_speeds = [x.speed for x in all_units]
 
         def dynamic(current_angle):
-            if abs(current_angle) > 0.6:
+            if abs(current_angle) > 0.6 or not all_units:
                 return False
             my_speed = course.rotate(current_angle) * context.speed.norm()
-            my_line = Line(context.position, context.position + my_speed)
-            for unit in all_units:
-                if unit.speed.norm() == 0:
-                    continue
-                unit_line = Line(unit.position, unit.position + unit.speed)
-                intersection = my_line.intersection(unit_line)
-                if intersection is None:
-                    continue
-                if not is_in_world(intersection, world_tiles, tile_size):
-                    continue
-                if is_in_empty_tile(intersection, world_tiles, tile_size):
-                    continue
-                unit_dir = intersection - unit.position
-                if unit_dir.norm() == 0 or unit_dir.cos(unit.speed) < 0:
-                    continue
-                if unit_dir.norm() > my_speed.norm() * 100:
-                    continue
-                my_dir = intersection - context.position
-                if my_dir.norm() == 0 or my_dir.cos(my_speed) < 0:
-                    continue
-                unit_time = unit_dir.norm() / unit.speed.norm()
-                my_time = my_dir.norm() / my_speed.norm()
-                if abs(my_time - unit_time) <= MY_INTERVAL:
-                    return True
-            return False
+            return bool(find_meetings(
+                positions=[context.position],
+                speeds=[my_speed],
+                units_positions=units_positions,
+                units_speeds=units_speeds,
+                max_distance=my_speed.norm() * 100,
+                interval=MY_INTERVAL,
+                tiles=context.tiles,
+                tile_size=tile_size,
+                skip_zero=True,
+            ))
 
         def adjust(has_intersection, begin, end):
             return adjust_course(has_intersection, angle, begin, end)
@@ -825,6 +890,76 @@ def generate_opponents_cars_barriers(context: Context):
     return make_units_barriers(context.opponents_cars)
 
 
+def find_meetings(positions, speeds, units_positions, units_speeds,
+                  max_distance, interval, tiles, tile_size, skip_zero=False):
+    if len(positions) * len(units_positions) < FIND_MEETINGS_MIN_PAIRS:
+        return list(generate_meetings(
+            positions, speeds, units_positions, units_speeds,
+            max_distance, interval, tiles, tile_size, skip_zero))
+    found, distances = find_meetings_arrays(
+        to_array(positions)[:, None], to_array(speeds)[:, None],
+        to_array(units_positions), to_array(units_speeds),
+        max_distance, interval, tiles, tile_size, skip_zero)
+    return distances[found].tolist()
+
+
+def generate_meetings(positions, speeds, units_positions, units_speeds,
+                      max_distance, interval, tiles, tile_size, skip_zero):
+    width = tiles.shape[0] * tile_size
+    height = tiles.shape[1] * tile_size
+    for position, speed in zip(positions, speeds):
+        line = Line(position, position + speed)
+        speed_norm = speed.norm()
+        for unit_position, unit_speed in zip(units_positions, units_speeds):
+            intersection = line.intersection(
+                Line(unit_position, unit_position + unit_speed))
+            if intersection is None:
+                continue
+            if not (0 < intersection.x < width and
+                    0 < intersection.y < height):
+                continue
+            if (tiles[int(intersection.x / tile_size),
+                      int(intersection.y / tile_size)] == TileType.EMPTY):
+                continue
+            unit_dir = intersection - unit_position
+            unit_distance = unit_dir.norm()
+            if unit_dir.dot(unit_speed) < 0 or unit_distance > max_distance:
+                continue
+            direction = intersection - position
+            distance = direction.norm()
+            if direction.dot(speed) < 0:
+                continue
+            if skip_zero and (unit_distance == 0 or distance == 0):
+                continue
+            if (abs(distance / speed_norm - unit_distance / unit_speed.norm())
+                    <= interval):
+                yield distance
+
+
+def find_meetings_arrays(position, speed, units_positions, units_speeds,
+                         max_distance, interval, tiles, tile_size,
+                         skip_zero=False):
+    with errstate(divide='ignore', invalid='ignore'):
+        intersections, found = line_intersections(
+            position, position + speed,
+            units_positions, units_positions + units_speeds)
+        tile_types = tiles_at(intersections, tiles, tile_size)
+        found &= (tile_types >= 0) & (tile_types != TileType.EMPTY)
+        units_dirs = intersections - units_positions
+        units_distances = norms(units_dirs)
+        found &= dots(units_dirs, units_speeds) >= 0
+        found &= units_distances <= max_distance
+        dirs = intersections - position
+        distances = norms(dirs)
+        found &= dots(dirs, speed) >= 0
+        if skip_zero:
+            found &= (units_distances != 0) & (distances != 0)
+        units_times = units_distances / norms(units_speeds)
+        times = distances / norms(speed)
+        found &= abs(times - units_times) <= interval
+    return found, distances
+
+
 def adjust_course(has_intersection, angle, begin, end):
     return adjust_course_rotation(has_intersection, begin, end, angle)
 
@@ -873,22 +1008,16 @@ def find_false(begin, end, is_true, min_interval):
 
 
 class SpeedLoss:
-    def __init__(self, history_size):
-        self.__crush = LimitedSum(history_size)
-        self.__speed = LimitedSum(history_size)
+    def __init__(self, crush: CrushDetector, history_size):
+        self.__crush = crush
         self.__history_size = history_size
 
-    def update(self, crush, speed):
-        self.__crush.update(crush)
-        self.__speed.update(speed if crush else 0)
-
     def get(self):
-        return self.__speed.get() * self.__crush.get() / self.__crush.count
-
-
-def is_in_empty_tile(position, tiles, tile_size):
-    tile = get_current_tile(position, tile_size)
-    return tiles[tile.x][tile.y] == TileType.EMPTY
+        count = min(self.__history_size, self.__crush.count())
+        if count == 0:
+            return 0
+        return (-self.__crush.speed_derivative(self.__history_size) *
+                self.__crush.crushes(self.__history_size) / count)
 
 
 def is_in_world(position, tiles, tile_size):
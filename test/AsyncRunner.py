@@ -0,0 +1,93 @@
+import asyncio
+from socket import socket
+from threading import Thread
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from AsyncRunner import run_sessions
+from local_server import generate_session, serve
+from MyStrategy import SessionFinished
+
+
+class CountingStrategy:
+    ticks = []
+
+    def __init__(self, history):
+        pass
+
+    def move(self, me, world, game, move):
+        CountingStrategy.ticks.append((me.id, world.tick))
+        move.engine_power = 1.0
+
+
+class FinishingStrategy:
+    ticks = []
+
+    def __init__(self, history):
+        pass
+
+    def move(self, me, world, game, move):
+        if world.tick >= 3:
+            raise SessionFinished()
+        FinishingStrategy.ticks.append((me.id, world.tick))
+
+
+class RunSessionsTest(TestCase):
+    def test_run_sessions_plays_every_game(self):
+        CountingStrategy.ticks = []
+        listeners = []
+        servers = []
+        latencies = []
+        for seed in range(3):
+            listener = socket()
+            listener.bind(('127.0.0.1', 0))
+            listener.listen(1)
+            listeners.append(listener)
+
+            def run(listener=listener, seed=seed):
+                connection, _ = listener.accept()
+                latencies.append(serve(connection,
+                                       generate_session(seed, ticks=4))[0])
+
+            servers.append(Thread(target=run))
+            servers[-1].start()
+        sessions = [(listener.getsockname()[1], '0000000000000000')
+                    for listener in listeners]
+        results = asyncio.run(run_sessions('127.0.0.1', sessions,
+                                           strategy_class=CountingStrategy))
+        for server in servers:
+            server.join()
+        for listener in listeners:
+            listener.close()
+        assert_that(results, equal_to([None, None, None]))
+        assert_that([v.__len__() for v in latencies], equal_to([4, 4, 4]))
+        assert_that(CountingStrategy.ticks.__len__(), equal_to(3 * 4 * 2))
+
+    def test_session_finished_ends_only_its_session(self):
+        FinishingStrategy.ticks = []
+        listeners = []
+        servers = []
+        truncated = {}
+        for ticks in (6, 2):
+            listener = socket()
+            listener.bind(('127.0.0.1', 0))
+            listener.listen(1)
+            listeners.append(listener)
+
+            def run(listener=listener, ticks=ticks):
+                connection, _ = listener.accept()
+                _, truncated[ticks] = serve(
+                    connection, generate_session(ticks, ticks=ticks))
+
+            servers.append(Thread(target=run))
+            servers[-1].start()
+        sessions = [(listener.getsockname()[1], '0000000000000000')
+                    for listener in listeners]
+        results = asyncio.run(run_sessions('127.0.0.1', sessions,
+                                           strategy_class=FinishingStrategy))
+        for server in servers:
+            server.join()
+        for listener in listeners:
+            listener.close()
+        assert_that(results, equal_to([None, None]))
+        assert_that(truncated, equal_to({6: True, 2: False}))
+        assert_that(FinishingStrategy.ticks.__len__(), equal_to(3 * 2 + 2 * 2))
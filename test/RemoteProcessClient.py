@@ -0,0 +1,354 @@
+from random import Random
+from socket import socket, SHUT_WR
+from struct import pack
+from threading import Thread
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from RemoteProcessClient import RemoteProcessClient
+from model.Move import Move
+from model.TileType import TileType
+from model.Player import Player
+from model.PlayerContext import PlayerContext
+from protocol_scenario import (
+    generate_world,
+    generate_game,
+    generate_car,
+    generate_bonus,
+    generate_projectile,
+    generate_oil_slick,
+)
+from test import fields
+
+
+class RemoteProcessClientTestCase(TestCase):
+    decode_mode = None
+
+    def setUp(self):
+        self.server = socket()
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(1)
+        self.client = RemoteProcessClient(*self.server.getsockname(),
+                                          decode_mode=self.decode_mode)
+        self.peer, _ = self.server.accept()
+        self.random = Random(42)
+
+    def tearDown(self):
+        self.client.close()
+        self.peer.close()
+        self.server.close()
+
+    def echo(self, write, read, value):
+        write(value)
+        self.client.flush()
+        self.client.socket.shutdown(SHUT_WR)
+        data = bytes()
+        while True:
+            chunk = self.peer.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+        self.peer.sendall(data)
+        return read()
+
+
+class RemoteProcessClientTest(RemoteProcessClientTestCase):
+    def test_read_values_from_one_chunk(self):
+        self.peer.sendall(pack('<biqd', 1, 42, -7, 0.5))
+        assert_that(self.client.read_boolean(), equal_to(True))
+        assert_that(self.client.read_int(), equal_to(42))
+        assert_that(self.client.read_long(), equal_to(-7))
+        assert_that(self.client.read_double(), equal_to(0.5))
+
+    def test_read_value_split_between_chunks(self):
+        data = pack('<q', 1234567890123)
+        self.peer.sendall(data[:3])
+        self.peer.sendall(data[3:])
+        assert_that(self.client.read_long(), equal_to(1234567890123))
+
+    def test_read_string(self):
+        self.peer.sendall(pack('<i', 5) + b'hello')
+        assert_that(self.client.read_string(), equal_to('hello'))
+
+    def test_read_bytes_larger_than_buffer(self):
+        size = RemoteProcessClient.READ_BUFFER_SIZE_BYTES * 2 + 1
+        data = bytes(x % 256 for x in range(size))
+        self.peer.sendall(pack('<i', 1))
+        self.client.read_int()
+        sender = Thread(target=self.peer.sendall, args=(data,))
+        sender.start()
+        assert_that(self.client.read_bytes(size), equal_to(data))
+        sender.join()
+
+    def test_read_after_compact_keeps_unread_bytes(self):
+        size = RemoteProcessClient.READ_BUFFER_SIZE_BYTES - 2
+        self.peer.sendall(bytes(size) + pack('<ii', 1, 2))
+        self.client.read_bytes(size)
+        assert_that(self.client.read_int(), equal_to(1))
+        assert_that(self.client.read_int(), equal_to(2))
+
+    def test_write_without_flush_sends_nothing(self):
+        self.client.write_int(42)
+        self.peer.setblocking(False)
+        with self.assertRaises(BlockingIOError):
+            self.peer.recv(1)
+
+    def test_write_moves_message_sends_whole_message(self):
+        move = Move()
+        move.engine_power = 1.0
+        move.brake = True
+        self.client.write_moves_message([move, None])
+        data = self.peer.recv(4096)
+        assert_that(data, equal_to(
+            pack('<bibdbdbbbb', RemoteProcessClient.MessageType.MOVE, 2, 1,
+                 1.0, 1, 0.0, 0, 0, 0, 0)))
+
+    def test_read_from_closed_stream_raises(self):
+        self.peer.close()
+        with self.assertRaises(IOError):
+            self.client.read_int()
+
+
+class RemoteProcessClientRecordTest(RemoteProcessClientTestCase):
+    def test_read_car_returns_written(self):
+        car = generate_car(self.random, id=1, player_id=2, teammate_index=1,
+                           teammate=True)
+        result = self.echo(self.client.write_car, self.client.read_car, car)
+        assert_that(fields(result), equal_to(fields(car)))
+
+    def test_read_cars_with_absent_car_returns_none_for_it(self):
+        cars = [generate_car(self.random, id=1, player_id=2, teammate_index=0,
+                             teammate=False), None]
+        result = self.echo(self.client.write_cars, self.client.read_cars, cars)
+        assert_that(fields(result[0]), equal_to(fields(cars[0])))
+        assert_that(result[1], equal_to(None))
+
+    def test_read_bonus_returns_written(self):
+        bonus = generate_bonus(self.random, id=3)
+        result = self.echo(self.client.write_bonus, self.client.read_bonus,
+                           bonus)
+        assert_that(fields(result), equal_to(fields(bonus)))
+
+    def test_read_projectile_returns_written(self):
+        projectile = generate_projectile(self.random, id=4, car_id=1,
+                                         player_id=2)
+        result = self.echo(self.client.write_projectile,
+                           self.client.read_projectile, projectile)
+        assert_that(fields(result), equal_to(fields(projectile)))
+
+    def test_read_oil_slick_returns_written(self):
+        oil_slick = generate_oil_slick(self.random, id=5)
+        result = self.echo(self.client.write_oil_slick,
+                           self.client.read_oil_slick, oil_slick)
+        assert_that(fields(result), equal_to(fields(oil_slick)))
+
+    def test_read_game_returns_written(self):
+        game = generate_game(self.random)
+        result = self.echo(self.client.write_game, self.client.read_game, game)
+        assert_that(fields(result), equal_to(fields(game)))
+
+    def test_read_player_returns_written(self):
+        player = Player(id=2, me=True, name='elsid', strategy_crashed=False,
+                        score=10)
+        result = self.echo(self.client.write_player, self.client.read_player,
+                           player)
+        assert_that(fields(result), equal_to(fields(player)))
+
+    def test_read_move_returns_written(self):
+        move = Move()
+        move.engine_power = 0.5
+        move.wheel_turn = -0.25
+        move.use_nitro = True
+        result = self.echo(self.client.write_move, self.client.read_move, move)
+        assert_that(fields(result), equal_to(fields(move)))
+
+    def test_read_enums_2d_returns_written(self):
+        tiles = [[TileType.VERTICAL, TileType.EMPTY, TileType.UNKNOWN],
+                 [TileType.CROSSROADS, TileType.LEFT_TOP_CORNER, None]]
+        result = self.echo(self.client.write_enums_2d,
+                           lambda: self.client.read_enums_2d(TileType), tiles)
+        assert_that(result, equal_to(tiles))
+
+    def test_read_enum_for_unknown_value_returns_none(self):
+        result = self.echo(self.client.write_int,
+                           lambda: self.client.read_enum(TileType), 100)
+        assert_that(result, equal_to(None))
+
+    def test_read_tiles_x_y_updates_grid_in_place(self):
+        first = [[TileType.VERTICAL, TileType.UNKNOWN],
+                 [TileType.UNKNOWN, TileType.HORIZONTAL]]
+        second = [[TileType.VERTICAL, TileType.CROSSROADS],
+                  [TileType.UNKNOWN, TileType.HORIZONTAL]]
+        self.client.write_enums_2d(first)
+        self.client.write_enums_2d([])
+        self.client.write_enums_2d(second)
+        tiles = self.echo(lambda _: None, self.client.read_tiles_x_y, None)
+        assert_that(self.client.tiles_version, equal_to(1))
+        assert_that(self.client.changed_tiles, equal_to({0, 1, 2, 3}))
+        assert_that(self.client.read_tiles_x_y(), equal_to(first))
+        assert_that(self.client.tiles_version, equal_to(1))
+        assert_that(self.client.changed_tiles, equal_to(set()))
+        assert_that(self.client.read_tiles_x_y() is tiles, equal_to(True))
+        assert_that(tiles, equal_to(second))
+        assert_that(self.client.tiles_version, equal_to(2))
+        assert_that(self.client.changed_tiles, equal_to({1}))
+
+    def test_read_world_indexes_cars_and_players(self):
+        world = generate_world(self.random)
+        world.cars[0].speed_x = 0
+        world.cars[0].speed_y = 0
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        assert_that(sorted(result.cars_by_id),
+                    equal_to(sorted(v.id for v in world.cars)))
+        assert_that(sorted(result.players_by_id),
+                    equal_to(sorted(v.id for v in world.players)))
+        assert_that([v.id for v in result.teammate_cars],
+                    equal_to([v.id for v in world.cars if v.teammate]))
+        assert_that([v.id for v in result.opponent_cars],
+                    equal_to([v.id for v in world.cars if not v.teammate]))
+        assert_that([v.id for v in result.moving_cars],
+                    equal_to([v.id for v in world.cars[1:]]))
+        assert_that(result.cars_by_id[world.cars[1].id],
+                    equal_to(result.cars[1]))
+
+
+class RemoteProcessClientArraysTest(RemoteProcessClientTestCase):
+    decode_mode = RemoteProcessClient.DecodeMode.ARRAYS
+
+    def test_read_world_returns_objects_equal_to_written(self):
+        world = generate_world(self.random, projectiles_count=3,
+                               bonuses_count=2, oil_slicks_count=1)
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        for name in ('cars', 'projectiles', 'bonuses', 'oil_slicks'):
+            assert_that([fields(v) for v in getattr(result, name)],
+                        equal_to([fields(v) for v in getattr(world, name)]))
+
+    def test_read_world_fills_arrays(self):
+        world = generate_world(self.random, projectiles_count=3)
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        assert_that(list(result.arrays.cars.values['x']),
+                    equal_to([v.x for v in world.cars]))
+        assert_that(list(result.arrays.projectiles.values['id']),
+                    equal_to([v.id for v in world.projectiles]))
+        assert_that(result.arrays.bonuses.count, equal_to(0))
+
+    def test_read_world_makes_car_partitions_on_access(self):
+        world = generate_world(self.random)
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        assert_that(result.indices, equal_to({}))
+        assert_that([v.id for v in result.opponent_cars],
+                    equal_to([v.id for v in world.cars if not v.teammate]))
+        assert_that(sorted(result.indices), equal_to(['opponent_cars']))
+
+    def test_read_world_keeps_previous_world_values(self):
+        worlds = [generate_world(self.random, tick=tick, projectiles_count=2)
+                  for tick in range(2)]
+        first, _ = self.echo(
+            lambda values: [self.client.write_world(v) for v in values],
+            lambda: (self.client.read_world(), self.client.read_world()),
+            worlds)
+        assert_that([fields(v) for v in first.cars],
+                    equal_to([fields(v) for v in worlds[0].cars]))
+        assert_that(list(first.arrays.projectiles.values['x']),
+                    equal_to([v.x for v in worlds[0].projectiles]))
+
+    def test_read_world_keeps_absent_entities_slots(self):
+        world = generate_world(self.random, bonuses_count=2)
+        world.bonuses.insert(1, None)
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        assert_that([v and fields(v) for v in result.bonuses],
+                    equal_to([v and fields(v) for v in world.bonuses]))
+        assert_that(result.arrays.bonuses.count, equal_to(2))
+
+
+class RemoteProcessClientLazyTest(RemoteProcessClientTestCase):
+    decode_mode = RemoteProcessClient.DecodeMode.LAZY
+
+    def test_read_world_returns_sections_equal_to_written(self):
+        world = generate_world(self.random, projectiles_count=3,
+                               bonuses_count=2, oil_slicks_count=1)
+        world.players.append(None)
+        world.bonuses.insert(1, None)
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        for name in ('players', 'cars', 'projectiles', 'bonuses',
+                     'oil_slicks'):
+            assert_that([v and fields(v) for v in getattr(result, name)],
+                        equal_to([v and fields(v) for v in getattr(world, name)]))
+        assert_that(result.tick, equal_to(world.tick))
+        assert_that(result.tiles_x_y, equal_to(world.tiles_x_y))
+
+    def test_read_world_decodes_only_accessed_sections(self):
+        world = generate_world(self.random, projectiles_count=3)
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        assert_that(result.cars.__len__(), equal_to(world.cars.__len__()))
+        assert_that(sorted(result.sections), equal_to(
+            ['bonuses', 'oil_slicks', 'players', 'projectiles']))
+
+    def test_assign_section_replaces_lazy_value(self):
+        world = generate_world(self.random, projectiles_count=3)
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        result.projectiles = []
+        assert_that(result.projectiles, equal_to([]))
+        assert_that('projectiles' in result.sections, equal_to(False))
+
+    def test_car_partitions_decode_only_cars_section(self):
+        world = generate_world(self.random, projectiles_count=3)
+        result = self.echo(self.client.write_world, self.client.read_world,
+                           world)
+        assert_that([v.id for v in result.opponent_cars],
+                    equal_to([v.id for v in world.cars if not v.teammate]))
+        assert_that(result.opponent_cars is result.opponent_cars,
+                    equal_to(True))
+        assert_that(sorted(result.sections), equal_to(
+            ['bonuses', 'oil_slicks', 'players', 'projectiles']))
+
+
+class RemoteProcessClientPoolTest(RemoteProcessClientTestCase):
+    decode_mode = RemoteProcessClient.DecodeMode.POOL
+
+    def write_player_contexts(self, worlds):
+        for world in worlds:
+            self.client.write_player_context(
+                PlayerContext(world.cars[:2], world))
+
+    def read_player_contexts(self, count):
+        result = []
+        for _ in range(count):
+            player_context = self.client.read_player_context()
+            pool = self.client.world_pool
+            result.append((
+                [fields(v) for v in player_context.world.cars],
+                [fields(v) for v in player_context.world.bonuses],
+                {car.id: car for car in player_context.world.cars},
+                player_context.cars,
+                (pool.allocated, pool.reused, pool.released),
+            ))
+        return result
+
+    def test_read_player_context_reuses_objects_by_id(self):
+        first = generate_world(self.random, bonuses_count=2)
+        second = generate_world(self.random, tick=1, bonuses_count=1)
+        second.bonuses[0].id = first.bonuses[1].id
+        results = self.echo(self.write_player_contexts,
+                            lambda: self.read_player_contexts(2),
+                            [first, second])
+        first_cars, first_bonuses, first_ids, _, first_counts = results[0]
+        second_cars, second_bonuses, second_ids, context_cars, \
+            second_counts = results[1]
+        assert_that(first_cars, equal_to([fields(v) for v in first.cars]))
+        assert_that(second_cars, equal_to([fields(v) for v in second.cars]))
+        assert_that(second_bonuses,
+                    equal_to([fields(v) for v in second.bonuses]))
+        assert_that(all(second_ids[i] is first_ids[i] for i in first_ids),
+                    equal_to(True))
+        assert_that(context_cars[0] is second_ids[context_cars[0].id],
+                    equal_to(True))
+        assert_that(first_counts, equal_to((14, 0, 0)))
+        assert_that(second_counts, equal_to((0, 13, 1)))
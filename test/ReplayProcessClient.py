@@ -0,0 +1,104 @@
+from os.path import join
+from random import Random
+from socket import socket, SHUT_WR
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from RemoteProcessClient import RemoteProcessClient
+from ReplayProcessClient import ReplayProcessClient
+from model.Move import Move
+from model.PlayerContext import PlayerContext
+from protocol_scenario import generate_game, generate_world
+from test import fields
+
+
+def record(path, write):
+    server = socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    client = RemoteProcessClient(*server.getsockname())
+    peer, _ = server.accept()
+    write(client)
+    client.flush()
+    client.socket.shutdown(SHUT_WR)
+    with open(path + '.in', 'wb') as stream:
+        while True:
+            chunk = peer.recv(4096)
+            if not chunk:
+                break
+            stream.write(chunk)
+    client.close()
+    peer.close()
+    server.close()
+
+
+class ReplayProcessClientTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, 'game')
+        random = Random(42)
+        self.game = generate_game(random)
+        self.worlds = [generate_world(random, tick=tick, projectiles_count=2)
+                       for tick in range(3)]
+        record(self.path, self.write_game)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_game(self, client):
+        client.write_enum(RemoteProcessClient.MessageType.TEAM_SIZE)
+        client.write_int(2)
+        client.write_enum(RemoteProcessClient.MessageType.GAME_CONTEXT)
+        client.write_game(self.game)
+        for world in self.worlds:
+            client.write_enum(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+            client.write_player_context(
+                PlayerContext(world.cars[:2], world))
+        client.write_enum(RemoteProcessClient.MessageType.GAME_OVER)
+
+    def replay(self, client):
+        client.write_token_message('0000000000000000')
+        assert_that(client.read_team_size_message(), equal_to(2))
+        client.write_protocol_version_message()
+        game = client.read_game_context_message()
+        ticks = []
+        while True:
+            player_context = client.read_player_context_message()
+            if player_context is None:
+                break
+            ticks.append(player_context.world.tick)
+            move = Move()
+            move.engine_power = player_context.world.tick
+            client.write_moves_message([move, None])
+        return game, ticks
+
+    def test_replay_serves_recorded_messages(self):
+        client = ReplayProcessClient(self.path)
+        game, ticks = self.replay(client)
+        client.close()
+        assert_that(fields(game), equal_to(fields(self.game)))
+        assert_that(ticks, equal_to([0, 1, 2]))
+
+    def test_replay_captures_moves(self):
+        client = ReplayProcessClient(self.path)
+        self.replay(client)
+        client.close()
+        assert_that([[move and move.engine_power for move in moves]
+                     for moves in client.moves],
+                    equal_to([[0, None], [1, None], [2, None]]))
+        assert_that(client.sent[0], equal_to(
+            RemoteProcessClient.MessageType.AUTHENTICATION_TOKEN))
+
+    def test_replay_with_arrays_decode_mode(self):
+        client = ReplayProcessClient(
+            self.path, RemoteProcessClient.DecodeMode.ARRAYS)
+        _, ticks = self.replay(client)
+        client.close()
+        assert_that(ticks, equal_to([0, 1, 2]))
+
+    def test_read_after_end_of_recording_raises(self):
+        client = ReplayProcessClient(self.path)
+        self.replay(client)
+        with self.assertRaises(IOError):
+            client.read_int()
+        client.close()
@@ -0,0 +1,114 @@
+import asyncio
+from random import Random
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from RemoteProcessClient import RemoteProcessClient
+from StreamProcessClient import StreamProcessClient
+from model.PlayerContext import PlayerContext
+from protocol_scenario import generate_game, generate_world
+from test import fields
+
+
+class ChunkReader:
+    def __init__(self, data, chunk_size):
+        self.chunks = [data[i:i + chunk_size]
+                       for i in range(0, data.__len__(), chunk_size)]
+        self.reads = 0
+
+    async def read(self, size):
+        self.reads += 1
+        return self.chunks.pop(0) if self.chunks else b''
+
+
+class BufferWriter:
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+
+
+class StreamProcessClientTest(TestCase):
+    def setUp(self):
+        random = Random(42)
+        self.game = generate_game(random)
+        self.worlds = [generate_world(random, tick=tick, projectiles_count=2,
+                                      bonuses_count=1)
+                       for tick in range(2)]
+        self.worlds[1].players[1] = None
+
+    def encode(self):
+        writer = BufferWriter()
+        client = StreamProcessClient(None, writer)
+        client.write_enum(RemoteProcessClient.MessageType.TEAM_SIZE)
+        client.write_int(2)
+        client.write_enum(RemoteProcessClient.MessageType.GAME_CONTEXT)
+        client.write_game(self.game)
+        for world in self.worlds:
+            client.write_enum(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+            client.write_player_context(PlayerContext(world.cars[:2], world))
+        client.write_enum(RemoteProcessClient.MessageType.GAME_OVER)
+        client.flush()
+        return bytes(writer.data)
+
+    def read_all(self, client):
+        async def run():
+            await client.wait_message()
+            team_size = client.read_team_size_message()
+            await client.wait_message()
+            game = client.read_game_context_message()
+            ticks = []
+            while True:
+                await client.wait_message()
+                player_context = client.read_player_context_message()
+                if player_context is None:
+                    break
+                ticks.append(player_context.world.tick)
+            return team_size, game, ticks
+
+        return asyncio.run(run())
+
+    def test_wait_message_reads_messages_split_in_small_chunks(self):
+        reader = ChunkReader(self.encode(), 7)
+        client = StreamProcessClient(reader, None)
+        team_size, game, ticks = self.read_all(client)
+        assert_that(team_size, equal_to(2))
+        assert_that(fields(game), equal_to(fields(self.game)))
+        assert_that(ticks, equal_to([0, 1]))
+
+    def test_wait_message_reads_messages_from_one_chunk(self):
+        reader = ChunkReader(self.encode(), 1 << 20)
+        client = StreamProcessClient(
+            reader, None, RemoteProcessClient.DecodeMode.ARRAYS)
+        _, _, ticks = self.read_all(client)
+        assert_that(ticks, equal_to([0, 1]))
+        assert_that(reader.reads, equal_to(1))
+
+    def test_wait_message_on_end_of_stream_raises(self):
+        reader = ChunkReader(self.encode()[:100], 10)
+        client = StreamProcessClient(reader, None)
+
+        async def run():
+            await client.wait_message()
+            client.read_team_size_message()
+            await client.wait_message()
+
+        with self.assertRaises(IOError):
+            asyncio.run(run())
+
+    def test_wait_message_resumes_scan_after_each_chunk(self):
+        data = self.encode()
+        peeks = []
+        for chunk_size in (7, 1 << 20):
+            client = StreamProcessClient(ChunkReader(data, chunk_size), None)
+            peek_byte = client.peek_byte
+            count = [0]
+
+            def counted(offset):
+                count[0] += 1
+                return peek_byte(offset)
+
+            client.peek_byte = counted
+            self.read_all(client)
+            peeks.append(count[0])
+        assert_that(peeks[0], equal_to(peeks[1]))
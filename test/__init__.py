@@ -0,0 +1,3 @@
+def fields(value):
+    return {name: getattr(value, name) for cls in type(value).__mro__
+            for name in getattr(cls, '__slots__', ())}
@@ -0,0 +1,27 @@
+from random import Random
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from game_constants import make_game_constants
+from protocol_scenario import generate_game
+
+
+class MakeGameConstantsTest(TestCase):
+    def setUp(self):
+        self.game = generate_game(Random(0))
+        self.constants = make_game_constants(self.game)
+
+    def test_path_shift_keeps_car_off_tile_margin(self):
+        assert_that(self.constants.path_shift, equal_to(800 / 2 - 80 - 105))
+
+    def test_car_sizes(self):
+        assert_that(self.constants.min_car_size, equal_to(140))
+        assert_that(self.constants.max_car_size, equal_to(210))
+
+    def test_tile_distances(self):
+        assert_that(self.constants.take_next_distance, equal_to(600))
+        assert_that(self.constants.remake_distance, equal_to(1600))
+
+    def test_projectile_ranges(self):
+        assert_that(self.constants.washer_range, equal_to(60 * 150))
+        assert_that(self.constants.tire_range, equal_to(60 * 50))
+
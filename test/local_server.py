@@ -0,0 +1,63 @@
+from socket import socket
+from threading import Thread
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from RemoteProcessClient import RemoteProcessClient
+from model.Move import Move
+from local_server import generate_session, serve
+
+
+class ServeTest(TestCase):
+    def setUp(self):
+        self.listener = socket()
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(1)
+
+    def tearDown(self):
+        self.listener.close()
+
+    def play(self, session, max_ticks=None):
+        result = {}
+
+        def run():
+            connection, _ = self.listener.accept()
+            result['latencies'], result['truncated'] = serve(connection,
+                                                             session)
+
+        server = Thread(target=run)
+        server.start()
+        client = RemoteProcessClient(*self.listener.getsockname())
+        client.write_token_message('0000000000000000')
+        team_size = client.read_team_size_message()
+        client.write_protocol_version_message()
+        client.read_game_context_message()
+        ticks = []
+        while True:
+            player_context = client.read_player_context_message()
+            if player_context is None or ticks.__len__() == max_ticks:
+                break
+            ticks.append(player_context.world.tick)
+            assert_that(player_context.cars.__len__(), equal_to(team_size))
+            client.write_moves_message([Move() for _ in range(team_size)])
+        client.close()
+        server.join()
+        return ticks, result['latencies'], result['truncated']
+
+    def test_serve_generated_session_plays_every_tick(self):
+        ticks, latencies, truncated = self.play(
+            generate_session(seed=0, ticks=5))
+        assert_that(ticks, equal_to([0, 1, 2, 3, 4]))
+        assert_that(latencies.__len__(), equal_to(5))
+        assert_that(truncated, equal_to(False))
+
+    def test_serve_session_with_team_size_3(self):
+        ticks, _, _ = self.play(
+            generate_session(seed=1, ticks=2, team_size=3))
+        assert_that(ticks, equal_to([0, 1]))
+
+    def test_serve_reports_truncated_session_when_client_closes_early(self):
+        ticks, latencies, truncated = self.play(
+            generate_session(seed=2, ticks=5), max_ticks=2)
+        assert_that(ticks, equal_to([0, 1]))
+        assert_that(latencies.__len__(), equal_to(2))
+        assert_that(truncated, equal_to(True))
@@ -0,0 +1,94 @@
+from os.path import join
+from random import Random
+from socket import SHUT_WR
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from RemoteProcessClient import RemoteProcessClient
+from model.PlayerContext import PlayerContext
+from protocol_columns import ColumnReader, ColumnWriter, convert
+from protocol_scenario import generate_game, generate_world
+from protocol_transport import make_pair
+
+
+class ColumnsTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, 'game')
+        random = Random(42)
+        self.game = generate_game(random)
+        self.worlds = [generate_world(random, tick=tick,
+                                      projectiles_count=tick,
+                                      bonuses_count=2)
+                       for tick in range(4)]
+        self.worlds[2].bonuses.insert(0, None)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self):
+        writer = ColumnWriter(self.path)
+        for world in self.worlds:
+            writer.write_world(world)
+        writer.close()
+
+    def test_read_tick_returns_written_entities(self):
+        self.write()
+        reader = ColumnReader(self.path)
+        values = reader.read_tick(2)
+        assert_that(reader.__len__(), equal_to(4))
+        assert_that(list(values['cars']['x']),
+                    equal_to([car.x for car in self.worlds[2].cars]))
+        assert_that(list(values['cars']['teammate']),
+                    equal_to([car.teammate for car in self.worlds[2].cars]))
+        assert_that(list(values['projectiles']['id']),
+                    equal_to([v.id for v in self.worlds[2].projectiles]))
+        assert_that(list(values['bonuses']['type']),
+                    equal_to([v.type for v in self.worlds[2].bonuses if v]))
+        assert_that(values['oil_slicks'].__len__(), equal_to(0))
+        reader.close()
+
+    def test_read_tick_for_absent_tick_raises(self):
+        self.write()
+        reader = ColumnReader(self.path)
+        with self.assertRaises(KeyError):
+            reader.read_tick(10)
+        reader.close()
+
+    def test_read_column_returns_field_across_game(self):
+        self.write()
+        reader = ColumnReader(self.path)
+        ticks, ids, values = reader.read_column('projectiles', 'speed_x')
+        reader.close()
+        expected = [(world.tick, v.id, v.speed_x) for world in self.worlds
+                    for v in world.projectiles]
+        assert_that(list(zip(ticks.tolist(), ids.tolist(), values.tolist())),
+                    equal_to(expected))
+
+    def test_convert_raw_recording(self):
+        transport, peer = make_pair()
+        client = RemoteProcessClient(None, None, transport=transport)
+        client.write_enum(RemoteProcessClient.MessageType.TEAM_SIZE)
+        client.write_int(2)
+        client.write_enum(RemoteProcessClient.MessageType.GAME_CONTEXT)
+        client.write_game(self.game)
+        for world in self.worlds:
+            client.write_enum(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+            client.write_player_context(PlayerContext(world.cars[:2], world))
+        client.write_enum(RemoteProcessClient.MessageType.GAME_OVER)
+        client.flush()
+        client.socket.shutdown(SHUT_WR)
+        with open(self.path + '.in', 'wb') as stream:
+            while True:
+                chunk = peer.recv(1 << 16)
+                if not chunk:
+                    break
+                stream.write(chunk)
+        client.close()
+        peer.close()
+        convert(self.path, self.path)
+        reader = ColumnReader(self.path)
+        ticks, ids, values = reader.read_column('cars', 'y')
+        reader.close()
+        assert_that(values.tolist(), equal_to(
+            [car.y for world in self.worlds for car in world.cars]))
@@ -0,0 +1,60 @@
+from os.path import join
+from socket import socket
+from struct import pack
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from RemoteProcessClient import RemoteProcessClient
+from protocol_recorder import Recorder, RECEIVED, SENT, read_index
+
+
+class RecorderTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, 'game')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self, suffix):
+        with open(self.path + suffix, 'rb') as stream:
+            return stream.read()
+
+    def test_close_writes_streams_and_index(self):
+        recorder = Recorder(self.path)
+        recorder.received(b'\x03\x02')
+        recorder.received(b'\x00\x00\x00')
+        recorder.message_received(3, 0, 5)
+        recorder.sent(b'\x07abc')
+        recorder.sent(b'\x04d')
+        recorder.close()
+        assert_that(self.read('.in'), equal_to(b'\x03\x02\x00\x00\x00'))
+        assert_that(self.read('.out'), equal_to(b'\x07abc\x04d'))
+        assert_that(read_index(self.path), equal_to([
+            (RECEIVED, 3, 0, 5), (SENT, 7, 0, 4), (SENT, 4, 4, 6)]))
+
+    def test_client_records_every_message(self):
+        server = socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        client = RemoteProcessClient(*server.getsockname(),
+                                     recorder=Recorder(self.path))
+        peer, _ = server.accept()
+        data = pack('<bi', RemoteProcessClient.MessageType.TEAM_SIZE, 2)
+        data += pack('<b', RemoteProcessClient.MessageType.GAME_OVER)
+        peer.sendall(data)
+        client.write_token_message('token')
+        assert_that(client.read_team_size_message(), equal_to(2))
+        client.write_protocol_version_message()
+        assert_that(client.read_player_context_message(), equal_to(None))
+        client.close()
+        peer.close()
+        server.close()
+        assert_that(self.read('.in'), equal_to(data))
+        assert_that(read_index(self.path), equal_to([
+            (SENT, RemoteProcessClient.MessageType.AUTHENTICATION_TOKEN,
+             0, 10),
+            (RECEIVED, RemoteProcessClient.MessageType.TEAM_SIZE, 0, 5),
+            (SENT, RemoteProcessClient.MessageType.PROTOCOL_VERSION, 10, 15),
+            (RECEIVED, RemoteProcessClient.MessageType.GAME_OVER, 5, 6),
+        ]))
@@ -0,0 +1,45 @@
+from os.path import join
+from socket import socket, AF_UNIX
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from RemoteProcessClient import RemoteProcessClient
+from local_server import ServerConnection
+from protocol_transport import connect_unix, make_pair, set_no_delay
+
+
+class TransportTest(TestCase):
+    def exchange(self, client, server):
+        client.write_token_message('token')
+        assert_that(server.read_token_message(), equal_to('token'))
+        server.write_team_size_message(3)
+        assert_that(client.read_team_size_message(), equal_to(3))
+
+    def test_client_over_socket_pair(self):
+        transport, peer = make_pair()
+        client = RemoteProcessClient(None, None, transport=transport)
+        server = ServerConnection(peer)
+        self.exchange(client, server)
+        client.close()
+        server.close()
+
+    def test_client_over_unix_socket(self):
+        with TemporaryDirectory() as directory:
+            path = join(directory, 'socket')
+            listener = socket(AF_UNIX)
+            listener.bind(path)
+            listener.listen(1)
+            client = RemoteProcessClient(None, None,
+                                         transport=connect_unix(path))
+            peer, _ = listener.accept()
+            server = ServerConnection(peer)
+            self.exchange(client, server)
+            client.close()
+            server.close()
+            listener.close()
+
+    def test_set_no_delay_ignores_non_tcp_transport(self):
+        first, second = make_pair()
+        assert_that(set_no_delay(first) is first, equal_to(True))
+        first.close()
+        second.close()
@@ -1,14 +1,28 @@
 from unittest import TestCase
-from hamcrest import assert_that, equal_to
+from hamcrest import assert_that, close_to, equal_to
 from model.TileType import TileType
 from strategy_barriers import (
     Rectangle,
     Circle,
-    make_tile_barriers
+    bisect,
+    make_tile_barriers,
+    make_tiles_barriers,
+    update_tiles_barriers,
 )
 from strategy_common import Point, Line
 
 
+class BisectTest(TestCase):
+    def test_finds_root_of_increasing_function(self):
+        assert_that(bisect(lambda x: x - 0.3, 0, 1), close_to(0.3, 1e-11))
+
+    def test_finds_root_of_decreasing_function(self):
+        assert_that(bisect(lambda x: 0.7 - x, 0, 1), close_to(0.7, 1e-11))
+
+    def test_returns_exact_root_at_middle(self):
+        assert_that(bisect(lambda x: x - 0.5, 0, 1), equal_to(0.5))
+
+
 class CircleTest(TestCase):
     def test_intersection_with_line_begins_from_circle_position_returns_one_point(self):
         circle = Circle(Point(0, 0), 1)
@@ -182,3 +196,15 @@ class MakeTileBarriersTest(TestCase):
             Circle(Point(30, 60), 1), Circle(Point(30, 63), 1),
             Circle(Point(33, 60), 1), Circle(Point(33, 63), 1),
         ]))
+
+
+class UpdateTilesBarriersTest(TestCase):
+    def test_for_changed_tile_returns_equal_to_rebuilt(self):
+        tiles = [[TileType.UNKNOWN, TileType.VERTICAL],
+                 [TileType.HORIZONTAL, TileType.UNKNOWN]]
+        barriers = make_tiles_barriers(tiles=tiles, margin=1, size=3)
+        tiles[1][1] = TileType.CROSSROADS
+        result = update_tiles_barriers(barriers=barriers, tiles=tiles,
+                                       indices={3}, margin=1, size=3)
+        assert_that(result, equal_to(make_tiles_barriers(tiles=tiles, margin=1,
+                                                         size=3)))
@@ -4,13 +4,17 @@ from math import sqrt, pi
 from strategy_common import (
     Line,
     Point,
+    MutablePoint,
     get_tile_center,
     get_current_tile,
     tile_coord,
     tile_center_coord,
     normalize_angle,
     Polyline,
-    LimitedSum,
+    IndexedPolyline,
+    Curve,
+    make_curve,
+    CURVE_SAMPLES_PER_SEGMENT,
 )
 
 
@@ -162,6 +166,52 @@ class PointTest(TestCase):
         assert_that(result.x, close_to(value=sqrt(2) / 2, delta=1e-8))
         assert_that(result.y, close_to(value=sqrt(2) / 2, delta=1e-8))
 
+    def test_equal_points_have_equal_hashes(self):
+        assert_that(hash(Point(1, 2)), equal_to(hash(Point(1.0, 2.0))))
+        assert_that({Point(1, 2), Point(1, 2), Point(2, 1)}.__len__(),
+                    equal_to(2))
+
+    def test_is_immutable(self):
+        point = Point(1, 2)
+        with self.assertRaises(AttributeError):
+            point.x = 3
+        with self.assertRaises(AttributeError):
+            del point.y
+        assert_that(point, equal_to(Point(1, 2)))
+
+    def test_squared_distance_1_1_to_4_5_returns_25(self):
+        assert_that(Point(1, 1).squared_distance(Point(4, 5)), equal_to(25))
+
+    def test_squared_norm_3_4_returns_25(self):
+        assert_that(Point(3, 4).squared_norm(), equal_to(25))
+
+    def test_rotate_scale_1_0_by_half_pi_and_2_returns_0_2(self):
+        result = Point(1, 0).rotate_scale(pi / 2, 2)
+        assert_that(result.x, close_to(value=0, delta=1e-8))
+        assert_that(result.y, close_to(value=2, delta=1e-8))
+
+    def test_add_scaled_1_1_and_2_0_by_3_returns_7_1(self):
+        assert_that(Point(1, 1).add_scaled(Point(2, 0), 3),
+                    equal_to(Point(7, 1)))
+
+
+class MutablePointTest(TestCase):
+    def test_iadd_updates_in_place(self):
+        point = MutablePoint(1, 1)
+        same = point
+        point += Point(2, 3)
+        assert_that(same, equal_to(Point(3, 4)))
+        assert_that(point is same, equal_to(True))
+
+    def test_add_scaled_inplace_1_1_and_2_0_by_3_returns_7_1(self):
+        point = MutablePoint(1, 1)
+        point.add_scaled_inplace(Point(2, 0), 3)
+        assert_that(point.freeze(), equal_to(Point(7, 1)))
+
+    def test_is_not_hashable(self):
+        with self.assertRaises(TypeError):
+            hash(MutablePoint(1, 1))
+
 
 class TileCenterCoordTest(TestCase):
     def test_at_0_for_tile_size_10_returns_5(self):
@@ -236,51 +286,132 @@ class PolylineTest(TestCase):
         result = polyline.distance(Point(1, 0))
         assert_that(result, equal_to(1))
 
+    def test_at_inside_segment_returns_point_at_distance(self):
+        polyline = Polyline([Point(0, 0), Point(2, 0), Point(2, 3)])
+        assert_that(polyline.at(1), equal_to(Point(1, 0)))
+        assert_that(polyline.at(3), equal_to(Point(2, 1)))
+
+    def test_at_beyond_end_returns_last_point(self):
+        polyline = Polyline([Point(0, 0), Point(2, 0), Point(2, 3)])
+        assert_that(polyline.at(10), equal_to(Point(2, 3)))
+
+    def test_at_with_size_stops_at_last_point_of_prefix(self):
+        polyline = Polyline([Point(0, 0), Point(2, 0), Point(2, 3)])
+        assert_that(polyline.at(1, 2), equal_to(Point(1, 0)))
+        assert_that(polyline.at(3, 2), equal_to(Point(2, 0)))
+        assert_that(polyline.at(3, 1), equal_to(Point(0, 0)))
+
+    def test_at_over_zero_length_segment_skips_it(self):
+        polyline = Polyline([Point(0, 0), Point(0, 0), Point(2, 0)])
+        assert_that(polyline.at(0), equal_to(Point(0, 0)))
+        assert_that(polyline.at(1), equal_to(Point(1, 0)))
+
+    def test_length_sums_segments(self):
+        polyline = Polyline([Point(0, 0), Point(3, 4), Point(3, 5)])
+        assert_that(polyline.length(), equal_to(6))
+
+    def test_append_extends_cached_lengths(self):
+        polyline = Polyline([Point(0, 0), Point(2, 0)])
+        assert_that(polyline.length(), equal_to(2))
+        polyline.append(Point(2, 3))
+        assert_that(polyline.length(), equal_to(5))
+        assert_that(polyline.at(4), equal_to(Point(2, 2)))
+
+    def test_drop_measures_from_new_first_point(self):
+        polyline = Polyline([Point(0, 0), Point(2, 0), Point(2, 3)])
+        assert_that(polyline.length(), equal_to(5))
+        polyline.drop(1)
+        assert_that(polyline.points, equal_to([Point(2, 0), Point(2, 3)]))
+        assert_that(polyline.length(), equal_to(3))
+        assert_that(polyline.at(1), equal_to(Point(2, 1)))
+
+    def test_drop_keeps_last_point(self):
+        polyline = Polyline([Point(0, 0), Point(2, 0)])
+        polyline.drop(5)
+        assert_that(polyline.points, equal_to([Point(2, 0)]))
+        assert_that(polyline.length(), equal_to(0))
+
+
+class IndexedPolylineTest(TestCase):
+    def test_nearest_point_to_polyline_of_one_returns_this(self):
+        polyline = IndexedPolyline([Point(0, 0)], cell_size=10)
+        assert_that(polyline.nearest_point(Point(1, 0)), equal_to(Point(0, 0)))
+
+    def test_nearest_point_is_clamped_to_segment(self):
+        polyline = IndexedPolyline([Point(0, 0), Point(10, 0)], cell_size=10)
+        assert_that(polyline.nearest_point(Point(15, 5)),
+                    equal_to(Point(10, 0)))
+
+    def test_nearest_point_returns_nearest_from_far_segments(self):
+        polyline = IndexedPolyline(
+            [Point(0, 0), Point(100, 0), Point(100, 100), Point(0, 100)],
+            cell_size=10)
+        assert_that(polyline.nearest_point(Point(50, 60)),
+                    equal_to(Point(50, 100)))
+        assert_that(polyline.distance(Point(50, 60)), equal_to(40))
+
+    def test_nearest_point_outside_indexed_cells(self):
+        polyline = IndexedPolyline([Point(0, 0), Point(10, 0)], cell_size=10)
+        assert_that(polyline.nearest_point(Point(-100, -100)),
+                    equal_to(Point(0, 0)))
+
+    def test_append_indexes_new_segment(self):
+        polyline = IndexedPolyline([Point(0, 0), Point(10, 0)], cell_size=10)
+        polyline.append(Point(10, 50))
+        assert_that(polyline.nearest_point(Point(12, 40)),
+                    equal_to(Point(10, 40)))
+
+    def test_drop_excludes_dropped_segments(self):
+        polyline = IndexedPolyline(
+            [Point(0, 0), Point(10, 0), Point(10, 50)], cell_size=10)
+        polyline.drop(1)
+        assert_that(polyline.nearest_point(Point(0, 1)),
+                    equal_to(Point(10, 1)))
+
+
+class CurveTest(TestCase):
+    def test_at_0_returns_first_point(self):
+        curve = Curve([Point(0, 0), Point(100, 0), Point(100, 100)])
+        assert_that(curve.at(0), equal_to(Point(0, 0)))
+
+    def test_at_beyond_length_returns_last_point(self):
+        curve = Curve([Point(0, 0), Point(100, 0), Point(100, 100)])
+        assert_that(curve.at(curve.length() + 1), equal_to(Point(100, 100)))
+
+    def test_curve_of_two_points_is_segment(self):
+        curve = Curve([Point(0, 0), Point(10, 0)])
+        assert_that(curve.length(), close_to(value=10, delta=1e-8))
+        result = curve.at(5)
+        assert_that(result.x, close_to(value=5, delta=1e-8))
+        assert_that(result.y, close_to(value=0, delta=1e-8))
 
-class LimitedSumTest(TestCase):
-    def test_get_empty_returns_0(self):
-        limited_sum = LimitedSum(1)
-        result = limited_sum.get()
-        assert_that(result, equal_to(0))
-
-    def test_update_by_1_get_returns_1(self):
-        limited_sum = LimitedSum(1)
-        limited_sum.update(1)
-        result = limited_sum.get()
-        assert_that(result, equal_to(1))
-
-    def test_update_twice_by_1_with_history_size_2_get_returns_2(self):
-        limited_sum = LimitedSum(2)
-        limited_sum.update(1)
-        limited_sum.update(1)
-        result = limited_sum.get()
-        assert_that(result, equal_to(2))
-
-    def test_update_twice_by_1_with_history_size_1_get_returns_1(self):
-        limited_sum = LimitedSum(1)
-        limited_sum.update(1)
-        limited_sum.update(1)
-        result = limited_sum.get()
-        assert_that(result, equal_to(1))
-
-    def test_update_by_2_and_3_with_history_size_2_get_returns_5(self):
-        limited_sum = LimitedSum(2)
-        limited_sum.update(2)
-        limited_sum.update(3)
-        result = limited_sum.get()
-        assert_that(result, equal_to(5))
-
-    def test_update_by_2_and_3_with_history_size_1_get_returns_3(self):
-        limited_sum = LimitedSum(1)
-        limited_sum.update(2)
-        limited_sum.update(3)
-        result = limited_sum.get()
-        assert_that(result, equal_to(3))
-
-    def test_update_by_2_and_3_with_history_size_1_and_reset_get_returns_0(self):
-        limited_sum = LimitedSum(1)
-        limited_sum.update(2)
-        limited_sum.update(3)
-        limited_sum.reset()
-        result = limited_sum.get()
-        assert_that(result, equal_to(0))
+    def test_curve_of_one_point_returns_it(self):
+        assert_that(Curve([Point(5, 5)]).at(10), equal_to(Point(5, 5)))
+
+    def test_curve_passes_through_control_points(self):
+        points = [Point(0, 0), Point(100, 0), Point(100, 100)]
+        samples = Curve(points).at_many([0, 1e6])
+        assert_that(samples.tolist(), equal_to([[0, 0], [100, 100]]))
+        middle = make_curve(tuple(points))[0][CURVE_SAMPLES_PER_SEGMENT]
+        assert_that(middle.tolist(), equal_to([100, 0]))
+
+    def test_at_many_matches_at(self):
+        curve = Curve([Point(0, 0), Point(100, 0), Point(100, 100),
+                       Point(200, 100)])
+        distances = [0, 50, 120, 250]
+        for (x, y), distance in zip(curve.at_many(distances), distances):
+            point = curve.at(distance)
+            assert_that(x, close_to(value=point.x, delta=1e-8))
+            assert_that(y, close_to(value=point.y, delta=1e-8))
+
+    def test_project_returns_nearest_sample_and_its_length(self):
+        curve = Curve([Point(0, 0), Point(10, 0)])
+        length, point = curve.project(Point(5, 3))
+        assert_that(length, close_to(value=5, delta=1))
+        assert_that(point.x, close_to(value=5, delta=1))
+        assert_that(point.y, close_to(value=0, delta=1e-8))
+
+    def test_same_points_reuse_curve(self):
+        points = (Point(0, 0), Point(50, 0), Point(50, 50))
+        assert_that(make_curve(points) is make_curve(tuple(points)),
+                    equal_to(True))
@@ -1,12 +1,21 @@
 from unittest import TestCase
 from hamcrest import assert_that, equal_to, greater_than, less_than
 from strategy_common import Point
-from strategy_control import DirectionDetector, Controller
+from strategy_control import (
+    DirectionDetector,
+    Controller,
+    StuckDetector,
+    CrushDetector,
+)
+from strategy_history import CarHistory
+from test.strategy_history import make_car
 
 
 class DirectionDetectorTest(TestCase):
     def test_for_initial_points_get_returns_direction(self):
+        history = CarHistory(1)
         get_direction = DirectionDetector(
+            history=history,
             begin=Point(0, 0),
             end=Point(1, 0),
             min_distance=1,
@@ -14,30 +23,39 @@ class DirectionDetectorTest(TestCase):
         assert_that(get_direction(), equal_to(Point(1, 0)))
 
     def test_update_by_nearest_than_min_distance_returns_initial(self):
+        history = CarHistory(1)
         get_direction = DirectionDetector(
+            history=history,
             begin=Point(0, 0),
             end=Point(1, 0),
             min_distance=1,
         )
-        get_direction.update(Point(1, 0.5))
+        history.append(make_car(1, 0.5))
+        get_direction.update()
         assert_that(get_direction(), equal_to(Point(1, 0)))
 
     def test_update_by_far_than_min_distance_returns_updated(self):
+        history = CarHistory(1)
         get_direction = DirectionDetector(
+            history=history,
             begin=Point(0, 0),
             end=Point(1, 0),
             min_distance=1,
         )
-        get_direction.update(Point(0, 2))
+        history.append(make_car(0, 2))
+        get_direction.update()
         assert_that(get_direction(), equal_to(Point(-1, 2)))
 
     def test_update_by_exact_min_distance_returns_updated(self):
+        history = CarHistory(1)
         get_direction = DirectionDetector(
+            history=history,
             begin=Point(0, 0),
             end=Point(1, 0),
             min_distance=1,
         )
-        get_direction.update(Point(1, 1))
+        history.append(make_car(1, 1))
+        get_direction.update()
         assert_that(get_direction(), equal_to(Point(0, 1)))
 
 
@@ -381,3 +399,40 @@ class ControllerTest(TestCase):
         assert_that(result.engine_power, equal_to(1))
         assert_that(result.wheel_turn, greater_than(0))
         assert_that(result.brake, equal_to(False))
+
+
+class StuckDetectorTest(TestCase):
+    def setUp(self):
+        self.history = CarHistory(4)
+        self.stuck = StuckDetector(history=self.history, history_size=2,
+                                   stuck_distance=1, unstack_distance=2)
+
+    def test_positive_check_needs_full_history(self):
+        self.history.append(make_car(0))
+        self.history.append(make_car(0))
+        assert_that(self.stuck.positive_check(), equal_to(False))
+        self.history.append(make_car(0))
+        assert_that(self.stuck.positive_check(), equal_to(True))
+
+    def test_reset_drops_previous_positions(self):
+        for x in (0, 3, 3):
+            self.history.append(make_car(x))
+        assert_that(self.stuck.negative_check(), equal_to(True))
+        self.stuck.reset()
+        self.history.append(make_car(3))
+        assert_that(self.stuck.negative_check(), equal_to(False))
+        assert_that(self.stuck.positive_check(), equal_to(False))
+
+
+class CrushDetectorTest(TestCase):
+    def test_totals_start_from_creation(self):
+        history = CarHistory(4, crush_speed_derivative=-1)
+        history.append(make_car(0, speed_x=5, durability=1))
+        history.append(make_car(0, speed_x=1, durability=0.5))
+        crush = CrushDetector(history=history)
+        assert_that(crush.count(), equal_to(0))
+        history.append(make_car(0, speed_x=4, durability=0.5))
+        history.append(make_car(0, speed_x=0, durability=0.25))
+        assert_that(crush.count(), equal_to(2))
+        assert_that(crush.crushes(3), equal_to(1))
+        assert_that(crush.speed_derivative(3), equal_to(-4))
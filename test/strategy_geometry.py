@@ -0,0 +1,123 @@
+from random import Random
+from unittest import TestCase
+from hamcrest import assert_that, equal_to, close_to
+from numpy import array, isnan
+from strategy_common import Line, Point, normalize_angle
+from strategy_geometry import (
+    to_array,
+    to_point,
+    pairwise_distances,
+    rotate,
+    normalize_angles,
+    nearest,
+    line_distances,
+    line_intersections,
+    segment_intersections,
+    tiles_at,
+)
+
+
+def generate_points(random, count):
+    return [Point(random.uniform(-10, 10), random.uniform(-10, 10))
+            for _ in range(count)]
+
+
+class GeometryTest(TestCase):
+    def setUp(self):
+        random = Random(0)
+        self.points = generate_points(random, 20)
+        self.begins = generate_points(random, 20)
+        self.ends = generate_points(random, 20)
+        self.other_begins = generate_points(random, 20)
+        self.other_ends = generate_points(random, 20)
+
+    def assert_points(self, result, expected):
+        for value, point in zip(result, expected):
+            assert_that(value[0], close_to(point.x, 1e-8))
+            assert_that(value[1], close_to(point.y, 1e-8))
+
+    def test_to_array_and_to_point(self):
+        assert_that(to_point(to_array([Point(1, 2)])[0]),
+                    equal_to(Point(1, 2)))
+        assert_that(to_array([]).shape, equal_to((0, 2)))
+
+    def test_pairwise_distances_match_point_distance(self):
+        result = pairwise_distances(to_array(self.points),
+                                    to_array(self.begins))
+        for i, a in enumerate(self.points):
+            for j, b in enumerate(self.begins):
+                assert_that(result[i, j], close_to(a.distance(b), 1e-8))
+
+    def test_rotate_matches_point_rotate(self):
+        angles = array([v.x for v in self.begins])
+        result = rotate(to_array(self.points), angles)
+        self.assert_points(result, [p.rotate(a)
+                                    for p, a in zip(self.points, angles)])
+
+    def test_normalize_angles_matches_normalize_angle(self):
+        values = [-10, -4, -3, 0, 3, 4, 10]
+        for value, result in zip(values, normalize_angles(values)):
+            assert_that(result, close_to(normalize_angle(value), 1e-12))
+
+    def test_nearest_matches_line_nearest(self):
+        result = nearest(to_array(self.begins), to_array(self.ends),
+                         to_array(self.points))
+        self.assert_points(result, [
+            Line(b, e).nearest(p)
+            for b, e, p in zip(self.begins, self.ends, self.points)])
+
+    def test_nearest_for_degenerate_line_returns_begin(self):
+        result = nearest(to_array([Point(1, 1)]), to_array([Point(1, 1)]),
+                         to_array([Point(5, 5)]))
+        self.assert_points(result, [Point(1, 1)])
+
+    def test_line_distances_match_line_distance(self):
+        result = line_distances(to_array(self.begins), to_array(self.ends),
+                                to_array(self.points))
+        for value, b, e, p in zip(result, self.begins, self.ends,
+                                  self.points):
+            assert_that(value, close_to(Line(b, e).distance(p), 1e-6))
+
+    def test_line_intersections_match_line_intersection(self):
+        result, exists = line_intersections(
+            to_array(self.begins), to_array(self.ends),
+            to_array(self.other_begins), to_array(self.other_ends))
+        for value, found, b, e, ob, oe in zip(result, exists, self.begins,
+                                              self.ends, self.other_begins,
+                                              self.other_ends):
+            expected = Line(b, e).intersection(Line(ob, oe))
+            assert_that(bool(found), equal_to(expected is not None))
+            assert_that(value[0], close_to(expected.x, 1e-6))
+            assert_that(value[1], close_to(expected.y, 1e-6))
+
+    def test_line_intersections_of_parallel_lines_do_not_exist(self):
+        result, exists = line_intersections(
+            to_array([Point(0, 0)]), to_array([Point(1, 0)]),
+            to_array([Point(0, 1)]), to_array([Point(1, 1)]))
+        assert_that(list(exists), equal_to([False]))
+        assert_that(isnan(result[0]).all(), equal_to(True))
+
+    def test_segment_intersections_require_both_segments(self):
+        result, exists = segment_intersections(
+            to_array([Point(0, 0), Point(0, 0)]),
+            to_array([Point(2, 2), Point(2, 2)]),
+            to_array([Point(0, 2), Point(3, 0)]),
+            to_array([Point(2, 0), Point(3, 1)]))
+        assert_that(list(exists), equal_to([True, False]))
+        self.assert_points(result[:1], [Point(1, 1)])
+
+    def test_segment_intersections_broadcast_one_to_many(self):
+        _, exists = segment_intersections(
+            to_array([Point(0, 0), Point(0, 1)])[:, None],
+            to_array([Point(2, 0), Point(2, 1)])[:, None],
+            to_array([Point(1, -1), Point(3, -1)]),
+            to_array([Point(1, 0.5), Point(3, 2)]))
+        assert_that(exists.tolist(), equal_to([[True, False],
+                                               [False, False]]))
+
+    def test_tiles_at_returns_minus_one_outside_world(self):
+        tiles = array([[1, 2], [3, 0]])
+        result = tiles_at(to_array([Point(50, 150), Point(150, 50),
+                                    Point(-1, 50), Point(250, 50)]),
+                          tiles, 100)
+        assert_that(list(result), equal_to([2, 3, -1, -1]))
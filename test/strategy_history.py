@@ -0,0 +1,116 @@
+from unittest import TestCase
+from hamcrest import assert_that, equal_to
+from protocol_scenario import generate_car
+from random import Random
+from strategy_common import Point
+from strategy_history import (
+    CarHistory,
+    CarsHistory,
+    PointHistory,
+    X,
+    CRUSHES,
+    CRUSH_SPEED_DERIVATIVE,
+)
+
+
+def make_car(x, y=0, speed_x=0, speed_y=0, durability=1, id=1):
+    car = generate_car(Random(0), id=id, player_id=1, teammate_index=0,
+                       teammate=True)
+    car.x = x
+    car.y = y
+    car.speed_x = speed_x
+    car.speed_y = speed_y
+    car.durability = durability
+    return car
+
+
+class CarHistoryTest(TestCase):
+    def test_window_of_empty_is_empty(self):
+        assert_that(len(CarHistory(3).window(2)), equal_to(0))
+
+    def test_window_returns_last_values_in_order(self):
+        history = CarHistory(3)
+        for x in range(5):
+            history.append(make_car(x))
+        assert_that(len(history), equal_to(3))
+        assert_that(history.appended, equal_to(5))
+        assert_that(list(history.window(3)[:, X]), equal_to([2, 3, 4]))
+        assert_that(list(history.window(2)[:, X]), equal_to([3, 4]))
+
+    def test_window_is_limited_by_begin(self):
+        history = CarHistory(4)
+        for x in range(3):
+            history.append(make_car(x))
+        assert_that(history.count(begin=2), equal_to(1))
+        assert_that(list(history.window(3, begin=2)[:, X]), equal_to([2]))
+
+    def test_distance_sums_steps(self):
+        history = CarHistory(4)
+        for x, y in ((0, 0), (3, 4), (3, 5), (3, 6)):
+            history.append(make_car(x, y))
+        assert_that(history.distance(3), equal_to(7))
+        assert_that(history.distance(2), equal_to(2))
+
+    def test_distance_is_limited_by_begin_and_capacity(self):
+        history = CarHistory(3)
+        for x in (0, 1, 3, 6, 10):
+            history.append(make_car(x))
+        assert_that(history.distance(10), equal_to(7))
+        assert_that(history.distance(10, begin=3), equal_to(4))
+
+    def test_total_counts_crushes(self):
+        history = CarHistory(4, crush_speed_derivative=-1)
+        history.append(make_car(0, speed_x=5, durability=1))
+        history.append(make_car(0, speed_x=1, durability=0.5))
+        history.append(make_car(0, speed_x=0, durability=0.5))
+        history.append(make_car(0, speed_x=3, durability=0.25))
+        assert_that(history.total(CRUSHES, 3), equal_to(1))
+        assert_that(history.total(CRUSH_SPEED_DERIVATIVE, 3), equal_to(-4))
+        assert_that(history.total(CRUSHES, 2), equal_to(0))
+
+    def test_clear_restarts_totals(self):
+        history = CarHistory(3)
+        history.append(make_car(0))
+        history.append(make_car(5))
+        history.clear()
+        history.append(make_car(7))
+        assert_that(history.distance(2), equal_to(0))
+        history.append(make_car(8))
+        assert_that(history.distance(2), equal_to(1))
+
+
+class CarsHistoryTest(TestCase):
+    def test_update_appends_to_each_car(self):
+        history = CarsHistory(2)
+        history.update(0, [make_car(1, id=1), make_car(2, id=2)])
+        history.update(1, [make_car(3, id=1)])
+        assert_that(history[1].appended, equal_to(2))
+        assert_that(history[2].appended, equal_to(1))
+        assert_that(history[1].last(X), equal_to(3))
+        assert_that(3 in history, equal_to(False))
+
+    def test_update_once_per_tick(self):
+        history = CarsHistory(2)
+        history.update(0, [make_car(1, id=1)])
+        history.update(0, [make_car(2, id=1)])
+        assert_that(history[1].appended, equal_to(1))
+        assert_that(history[1].last(X), equal_to(1))
+
+    def test_update_skips_absent_cars(self):
+        history = CarsHistory(2)
+        history.update(0, [None, make_car(1, id=1)])
+        assert_that(history[1].appended, equal_to(1))
+
+
+class PointHistoryTest(TestCase):
+    def test_points_returns_last_points_in_order(self):
+        history = PointHistory(2)
+        for x in range(3):
+            history.append(Point(x, -x))
+        assert_that(history.points(), equal_to([Point(1, -1), Point(2, -2)]))
+
+    def test_clear_removes_points(self):
+        history = PointHistory(2)
+        history.append(Point(1, 1))
+        history.clear()
+        assert_that(history.points(), equal_to([]))
@@ -0,0 +1,213 @@
+from random import Random
+from unittest import TestCase
+from numpy import array
+from hamcrest import (
+    assert_that,
+    close_to,
+    equal_to,
+    same_instance,
+    instance_of,
+)
+from model.CarType import CarType
+from model.TileType import TileType
+from model.Move import Move
+from game_constants import make_game_constants
+from protocol_scenario import generate_game, generate_world
+from strategy_barriers import make_tiles_barriers
+from strategy_common import Point, Polyline, Curve
+from strategy_release import (
+    Context,
+    Course,
+    ReleaseStrategy,
+    FIND_MEETINGS_MIN_PAIRS,
+    curve_at,
+    find_meetings,
+    make_cars_history,
+    path_at,
+    throw_projectile,
+)
+
+
+class ContextTest(TestCase):
+    def setUp(self):
+        random = Random(0)
+        self.game = generate_game(random)
+        self.world = generate_world(random)
+
+    def make_context(self):
+        return Context(me=self.world.cars[0], world=self.world,
+                       game=self.game, move=Move())
+
+    def test_constants_are_made_once_per_game(self):
+        constants = self.make_context().constants
+        assert_that(constants, equal_to(make_game_constants(self.game)))
+        assert_that(self.make_context().constants, same_instance(constants))
+
+    def test_opponent_cars_are_split_by_speed(self):
+        opponents = [v for v in self.world.cars if not v.teammate]
+        opponents[0].speed_x = 0.5
+        opponents[0].speed_y = 0.5
+        opponents[1].speed_x = 1
+        opponents[1].speed_y = 0
+        context = self.make_context()
+        assert_that([v.id for v in context.slow_opponent_cars],
+                    equal_to([opponents[0].id]))
+        assert_that([v.id for v in context.fast_opponent_cars],
+                    equal_to([v.id for v in opponents[1:]]))
+
+
+class ReleaseStrategyTest(TestCase):
+    def test_teammates_update_shared_history_once_per_tick(self):
+        random = Random(0)
+        game = generate_game(random)
+        game.initial_freeze_duration_ticks = 0
+        world = generate_world(random)
+        history = make_cars_history()
+        for car in world.cars[:2]:
+            context = Context(me=car, world=world, game=game, move=Move())
+            ReleaseStrategy(history).move(context)
+        assert_that([history[v.id].appended for v in world.cars],
+                    equal_to([1] * world.cars.__len__()))
+
+
+class ThrowProjectileTest(TestCase):
+    def setUp(self):
+        random = Random(0)
+        self.game = generate_game(random)
+        self.world = generate_world(random)
+        self.me = self.world.cars[0]
+        self.me.x, self.me.y, self.me.angle = 2000, 400, 0
+        opponent = next(v for v in self.world.cars if not v.teammate)
+        opponent.x, opponent.y = 3200, 200
+        opponent.speed_x, opponent.speed_y = 0, 10
+        self.world.cars = [self.me, opponent]
+        self.barriers = make_tiles_barriers(
+            tiles=self.world.tiles_x_y,
+            margin=self.game.track_tile_margin,
+            size=self.game.track_tile_size,
+        )
+
+    def throw(self, car_type):
+        self.me.type = car_type
+        context = Context(me=self.me, world=self.world, game=self.game,
+                          move=Move())
+        return throw_projectile(context, self.barriers)
+
+    def test_washer_at_crossing_car_returns_bool(self):
+        result = self.throw(CarType.BUGGY)
+        assert_that(result, instance_of(bool))
+        assert_that(result, equal_to(True))
+
+    def test_tire_at_crossing_car_returns_bool(self):
+        result = self.throw(CarType.JEEP)
+        assert_that(result, instance_of(bool))
+        assert_that(result, equal_to(True))
+
+
+class FindMeetingsTest(TestCase):
+    def setUp(self):
+        self.tiles = array([[TileType.VERTICAL] * 4] * 4)
+
+    def find(self, units_count):
+        return find_meetings(
+            positions=[Point(100, 200)],
+            speeds=[Point(10, 0)],
+            units_positions=[Point(300, 100)] * units_count,
+            units_speeds=[Point(0, 5)] * units_count,
+            max_distance=1000,
+            interval=1,
+            tiles=self.tiles,
+            tile_size=100,
+        )
+
+    def test_scalar_and_vectorised_paths_find_same_meetings(self):
+        for units_count in (1, FIND_MEETINGS_MIN_PAIRS):
+            result = self.find(units_count)
+            assert_that(result.__len__(), equal_to(units_count))
+            for distance in result:
+                assert_that(distance, close_to(200, 1e-9))
+
+    def test_empty_tile_has_no_meetings(self):
+        self.tiles[3][2] = TileType.EMPTY
+        for units_count in (1, FIND_MEETINGS_MIN_PAIRS):
+            assert_that(self.find(units_count), equal_to([]))
+
+
+class PathAtTest(TestCase):
+    def test_for_empty_path_returns_position(self):
+        assert_that(path_at(Point(1, 1), [], None, 10),
+                    equal_to(Point(1, 1)))
+
+    def test_within_first_segment_moves_towards_first_point(self):
+        assert_that(path_at(Point(0, 0), [Point(4, 0)], None, 2),
+                    equal_to(Point(2, 0)))
+
+    def test_uses_given_polyline_after_first_point(self):
+        polyline = Polyline([Point(0, 0), Point(2, 0), Point(2, 3),
+                             Point(2, 10)])
+        polyline.drop(1)
+        path = polyline.points[:2]
+        assert_that(path_at(Point(0, 0), path, polyline, 3),
+                    equal_to(Point(2, 1)))
+        assert_that(path_at(Point(0, 0), path, polyline, 10),
+                    equal_to(Point(2, 3)))
+
+
+class CurveAtTest(TestCase):
+    def setUp(self):
+        self.curve = Curve([Point(0, 0), Point(1000, 0), Point(2000, 0)])
+
+    def test_moves_along_curve_from_position_projection(self):
+        result = curve_at(Point(125, 0), self.curve, 300)
+        assert_that(result.x, close_to(425, 1e-6))
+        assert_that(result.y, close_to(0, 1e-6))
+
+    def test_far_from_curve_moves_towards_projection(self):
+        result = curve_at(Point(125, 500), self.curve, 300)
+        assert_that(result.x, close_to(125, 1e-6))
+        assert_that(result.y, close_to(200, 1e-6))
+
+
+class CourseTest(TestCase):
+    def setUp(self):
+        random = Random(0)
+        self.game = generate_game(random)
+        self.world = generate_world(random)
+        self.me = self.world.cars[0]
+        self.me.angle = 0
+        self.me.speed_x, self.me.speed_y = 0, 0
+        self.world.cars = [self.me]
+
+    def get(self, position, path):
+        self.me.x, self.me.y = position.x, position.y
+        context = Context(me=self.me, world=self.world, game=self.game,
+                          move=Move())
+        return Course().get(context, path)
+
+    def test_sharp_turn_follows_polyline(self):
+        position = Point(2400, 400)
+        path = [Point(2800, 400), Point(3600, 400), Point(3000, 450)]
+        assert_that(self.get(position, path), equal_to(Point(800, 0)))
+
+    def test_smooth_path_follows_polyline(self):
+        position = Point(2400, 400)
+        path = [Point(2800, 400), Point(3600, 400), Point(4400, 450)]
+        assert_that(self.get(position, path), equal_to(Point(800, 0)))
+
+    def test_missed_tiles_change_rebuilds_barriers(self):
+        path = [Point(2800, 400), Point(3600, 400), Point(4400, 400)]
+        self.me.x, self.me.y = 2400, 400
+        course = Course()
+        context = Context(me=self.me, world=self.world, game=self.game,
+                          move=Move())
+        course.get(context, path)
+        self.world.tiles_x_y[1][1] = TileType.CROSSROADS
+        self.world.tiles_version += 1
+        self.world.changed_tiles = frozenset()
+        course.get(context, path)
+        expected = make_tiles_barriers(
+            tiles=self.world.tiles_x_y,
+            margin=self.game.track_tile_margin,
+            size=self.game.track_tile_size,
+        )
+        assert_that(course.tile_barriers, equal_to(expected))
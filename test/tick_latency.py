@@ -0,0 +1,49 @@
+from unittest import TestCase
+from hamcrest import assert_that, equal_to, close_to, less_than_or_equal_to
+from tick_latency import Histogram, TickProfiler, PHASES, WAIT, DECODE
+
+
+class HistogramTest(TestCase):
+    def test_percentile_of_empty_returns_zero(self):
+        assert_that(Histogram().percentile(0.5), equal_to(0.0))
+
+    def test_percentile_is_within_bucket_error(self):
+        histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.add(value / 1000)
+        assert_that(histogram.count, equal_to(1000))
+        assert_that(histogram.max, equal_to(1.0))
+        assert_that(histogram.percentile(0.5), close_to(0.5, 0.05))
+        assert_that(histogram.percentile(0.99), close_to(0.99, 0.09))
+
+    def test_percentile_does_not_exceed_max(self):
+        histogram = Histogram()
+        histogram.add(0.003)
+        assert_that(histogram.percentile(0.99), equal_to(0.003))
+
+
+class TickProfilerTest(TestCase):
+    def test_lap_adds_sample_to_phase(self):
+        profiler = TickProfiler()
+        profiler.start()
+        profiler.lap(WAIT)
+        profiler.lap(DECODE)
+        profiler.lap(DECODE)
+        summary = {(v['clock'], v['phase']): v for v in profiler.summary()}
+        assert_that(sorted(summary), equal_to(sorted(
+            (clock, phase) for clock in ('wall', 'cpu') for phase in PHASES)))
+        assert_that(summary[('wall', WAIT)]['count'], equal_to(1))
+        assert_that(summary[('cpu', DECODE)]['count'], equal_to(2))
+        assert_that(summary[('wall', DECODE)]['p50'],
+                    less_than_or_equal_to(summary[('wall', DECODE)]['max']))
+
+    def test_count_adds_counters_to_summary(self):
+        profiler = TickProfiler()
+        profiler.count(allocated=4, reused=0)
+        profiler.count(allocated=1, reused=3)
+        summary = {v['counter']: v for v in profiler.summary()
+                   if 'counter' in v}
+        assert_that(summary['allocated'], equal_to(
+            dict(counter='allocated', count=2, total=5, max=4)))
+        assert_that(summary['reused'], equal_to(
+            dict(counter='reused', count=2, total=3, max=3)))
@@ -0,0 +1,93 @@
+from math import floor, log2
+from time import perf_counter, thread_time
+
+WAIT = 'wait'
+DECODE = 'decode'
+STRATEGY = 'strategy'
+ENCODE = 'encode'
+
+PHASES = (WAIT, DECODE, STRATEGY, ENCODE)
+
+
+class Histogram:
+    BUCKETS_PER_OCTAVE = 8
+    MIN_VALUE = 1e-7
+
+    def __init__(self):
+        self.__buckets = {}
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, value):
+        value = max(value, Histogram.MIN_VALUE)
+        index = floor(log2(value) * Histogram.BUCKETS_PER_OCTAVE)
+        self.__buckets[index] = self.__buckets.get(index, 0) + 1
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction):
+        if self.count == 0:
+            return 0.0
+        required = fraction * self.count
+        passed = 0
+        for index in sorted(self.__buckets):
+            passed += self.__buckets[index]
+            if passed >= required:
+                upper = 2 ** ((index + 1) / Histogram.BUCKETS_PER_OCTAVE)
+                return min(upper, self.max)
+        return self.max
+
+
+class TickProfiler:
+    def __init__(self):
+        self.wall = {phase: Histogram() for phase in PHASES}
+        self.cpu = {phase: Histogram() for phase in PHASES}
+        self.counters = {}
+        self.__wall_start = 0.0
+        self.__cpu_start = 0.0
+
+    def start(self):
+        self.__wall_start = perf_counter()
+        self.__cpu_start = thread_time()
+
+    def lap(self, phase):
+        wall = perf_counter()
+        cpu = thread_time()
+        self.wall[phase].add(wall - self.__wall_start)
+        self.cpu[phase].add(cpu - self.__cpu_start)
+        self.__wall_start = wall
+        self.__cpu_start = cpu
+
+    def count(self, **values):
+        for name, value in values.items():
+            counter = self.counters.get(name)
+            if counter is None:
+                counter = self.counters[name] = dict(counter=name, count=0, total=0, max=0)
+            counter['count'] += 1
+            counter['total'] += value
+            counter['max'] = max(counter['max'], value)
+
+    def summary(self):
+        for clock, histograms in (('wall', self.wall), ('cpu', self.cpu)):
+            for phase in PHASES:
+                histogram = histograms[phase]
+                yield dict(phase=phase, clock=clock, count=histogram.count,
+                           p50=histogram.percentile(0.5),
+                           p99=histogram.percentile(0.99),
+                           max=histogram.max)
+        for name in sorted(self.counters):
+            yield dict(self.counters[name])
+
+
+class NullTickProfiler:
+    def start(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def count(self, **values):
+        pass
+
+    def summary(self):
+        return iter(())